@@ -83,6 +83,11 @@ config = {
                 }
             },
 
+            # ORM identity map and unit of work, one uvicore.orm.session() per request
+            # 'OrmSession': {
+            #     'module': 'uvicore.orm.middleware.Session',
+            # },
+
             # If you have a loadbalancer with SSL termination in front of your web
             # app, don't use this redirection to enforce HTTPS as it is always HTTP internally.
             # 'HTTPSRedirect': {
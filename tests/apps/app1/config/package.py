@@ -50,6 +50,30 @@ config = {
                 'username': 'root',
                 'password': 'techie',
                 'prefix': None,
+
+                # Optional connection pool options, any other options are passed to the drivers pool
+                # 'pool': {
+                #     'min_size': 1,
+                #     'max_size': 10,
+                #     'lifetime': 300,
+                #     'timeout': 10,
+                # },
+
+                # Optional read replicas, each overriding any options of this primary connection
+                # Reads go to a replica chosen by the replica_policy (round_robin, least_connections
+                # or a class path), but stay on the primary read_your_writes seconds after a write
+                # 'replicas': [
+                #     {'host': '127.0.0.2'},
+                #     {'host': '127.0.0.3'},
+                # ],
+                # 'replica_policy': 'round_robin',
+                # 'read_your_writes': 5,
+
+                # Optional compiled statement cache, by statement structure (ORM query plan)
+                # 'statements': {
+                #     'enabled': True,
+                #     'size': 500,
+                # },
             },
 
             'app1_remote': {
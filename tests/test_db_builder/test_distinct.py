@@ -0,0 +1,60 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB Builder
+
+
+@pytest.mark.asyncio
+async def test_distinct(app1):
+    # Single table selects of the primary key are already unique
+    assert 'DISTINCT' not in uvicore.db.query().table('posts').sql()
+    assert 'DISTINCT' not in uvicore.db.query().table('posts').select('id', 'title').sql()
+
+    # Selects without the primary key may have duplicates
+    assert 'DISTINCT' in uvicore.db.query().table('posts').select('creator_id').sql()
+    creators = await uvicore.db.query().table('posts').select('creator_id').get()
+    assert len(creators) == len(set([row.creator_id for row in creators]))
+
+    # Joins of many rows may duplicate rows
+    assert 'DISTINCT' in uvicore.db.query().table('posts').join('comments', 'posts.id', 'comments.post_id').sql()
+
+    # Joins on the primary or a unique key of the joined table never duplicate rows
+    assert 'DISTINCT' not in uvicore.db.query().table('comments').join('posts', 'comments.post_id', 'posts.id').sql()
+    assert 'DISTINCT' not in uvicore.db.query().table('posts').join('tags', 'posts.unique_slug', 'tags.name').sql()
+    comments = await uvicore.db.query().table('comments').join('posts', 'comments.post_id', 'posts.id').get()
+    assert len(comments) == len(set([row.id for row in comments]))
+
+    # Explicit
+    assert 'DISTINCT' in uvicore.db.query().table('posts').distinct().sql()
+    assert 'DISTINCT' not in uvicore.db.query().table('posts').select('creator_id').no_distinct().sql()
+
+
+@pytest.mark.asyncio
+async def test_orm_distinct(app1):
+    from app1.models.post import Post
+
+    # *One joins never duplicate rows
+    assert 'DISTINCT' not in Post.query().include('creator', 'owner.info').sql()['main']
+
+    # The main query joins *Many relations, but their secondary query is unique
+    sqls = Post.query().include('creator', 'comments').sql()
+    assert 'DISTINCT' in sqls['main']
+    assert 'DISTINCT' not in sqls['comments']
+    assert 'DISTINCT' not in Post.query().include('tags').sql()['tags']
+
+    # Unless other *Many relations are joined too
+    sqls = Post.query().include('comments', 'tags').sql()
+    assert 'DISTINCT' in sqls['comments']
+    assert 'DISTINCT' in sqls['tags']
+
+    # Explicit
+    assert 'DISTINCT' in Post.query().distinct().sql()['main']
+    assert 'DISTINCT' not in Post.query().include('comments').no_distinct().sql()['main']
+
+    # Results are the same without DISTINCT
+    posts = await Post.query().include('creator', 'comments', 'tags').order_by('id').get()
+    undistinct = await Post.query().include('creator', 'comments', 'tags').order_by('id').no_distinct().get()
+    assert [post.id for post in posts] == [post.id for post in undistinct]
+    assert [len(post.comments or []) for post in posts] == [len(post.comments or []) for post in undistinct]
+    assert [len(post.tags or []) for post in posts] == [len(post.tags or []) for post in undistinct]
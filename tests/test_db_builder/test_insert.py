@@ -0,0 +1,42 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from tests.transactions import rollback
+
+# DB Builder
+
+
+@pytest.mark.asyncio
+async def test_execute_many(app1):
+    hashtags = uvicore.db.table('hashtags')
+
+    # A List of rows for a plain INSERT is bulk inserted in multi-row statements
+    async with rollback():
+        await uvicore.db.execute(hashtags.insert(), [{'name': 'many' + str(i)} for i in range(1500)])
+        rows = await uvicore.db.query().table('hashtags').where('name', 'like', 'many%').get()
+        assert sorted([row.name for row in rows]) == sorted(['many' + str(i) for i in range(1500)])
+
+
+def test_bulk_paths(app1):
+    import sqlalchemy as sa
+    from sqlalchemy.dialects import postgresql, sqlite
+    hashtags = uvicore.db.table('hashtags')
+
+    # Only INSERTs without their own values, prefixes or returning are batched
+    assert uvicore.db._plain_insert(hashtags.insert()) == True
+    assert uvicore.db._plain_insert(hashtags.insert().values(name='x')) == False
+    assert uvicore.db._plain_insert(hashtags.insert().prefix_with('OR IGNORE')) == False
+    assert uvicore.db._plain_insert(hashtags.update()) == False
+    assert uvicore.db._plain_insert('INSERT INTO hashtags (name) VALUES (:name)') == False
+
+    # Batches are sized by the bound parameter limit
+    rows = [{'id': i, 'name': str(i)} for i in range(10)]
+    assert [len(batch) for batch in uvicore.db._batches(rows, 8)] == [4, 4, 2]
+    assert uvicore.db.max_params() > 0
+
+    # Large PostgreSQL bulk inserts use COPY FROM
+    rows = [{'name': str(i)} for i in range(1000)]
+    assert uvicore.db._copyable(hashtags, rows, postgresql.dialect()) == True
+    assert uvicore.db._copyable(hashtags, rows[:10], postgresql.dialect()) == False
+    assert uvicore.db._copyable(hashtags, rows, sqlite.dialect()) == False
+    assert uvicore.db._copyable(hashtags, rows[:-1] + [{'name': 'x', 'id': 1}], postgresql.dialect()) == False
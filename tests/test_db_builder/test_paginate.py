@@ -0,0 +1,37 @@
+import pytest
+import uvicore
+import sqlalchemy as sa
+from uvicore.support.dumper import dump
+
+# DB Builder
+
+@pytest.mark.asyncio
+async def test_chunk(app1):
+    # Keyset chunks by primary key
+    chunks = [x async for x in uvicore.db.query().table('posts').where('id', '<=', 5).chunk(2)]
+    assert [[1, 2], [3, 4], [5]] == [[x.id for x in chunk] for chunk in chunks]
+
+    # The primary key is selected to seek past each chunk, even when not selected
+    chunks = [x async for x in uvicore.db.query().table('posts').select('title').where('id', '<=', 5).chunk(2)]
+    assert [[1, 2], [3, 4], [5]] == [[x.id for x in chunk] for chunk in chunks]
+    assert chunks[0][0].title is not None
+
+
+@pytest.mark.asyncio
+async def test_paginate(app1):
+    # First page by offset, next pages by cursor
+    query = uvicore.db.query().table('posts').where('id', '<=', 5)
+    page = await query.paginate(per_page=2)
+    assert [1, 2] == [x.id for x in page.results]
+
+    page = await query.paginate(per_page=2, cursor=page.cursor)
+    assert [3, 4] == [x.id for x in page.results]
+    assert page.page == 2
+
+    page = await query.paginate(per_page=2, cursor=page.cursor)
+    assert [5] == [x.id for x in page.results]
+    assert page.cursor is None
+
+    # Jump to a page by offset
+    page = await query.paginate(page=2, per_page=2)
+    assert [3, 4] == [x.id for x in page.results]
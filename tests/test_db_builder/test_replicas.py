@@ -0,0 +1,85 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB Builder
+
+
+@pytest.fixture
+async def replicas(app1):
+    # Two read replicas of the default connection, both the same database
+    from databases import Database as EncodeDatabase
+    from uvicore.database.replicas import Replicas
+    metakey = uvicore.db.metakey()
+    url = str(uvicore.db.databases[metakey].url)
+    replicas = uvicore.db._replicas[metakey] = Replicas([EncodeDatabase(url), EncodeDatabase(url)])
+    yield metakey
+    del uvicore.db._replicas[metakey]
+    for database in replicas.databases:
+        if database.is_connected: await database.disconnect()
+
+
+def acquires(metakey: str):
+    stats = uvicore.db.stats(metakey=metakey)[metakey]
+    return (stats.acquires, [replica.acquires for replica in stats.replicas])
+
+
+@pytest.mark.asyncio
+async def test_replicas(replicas):
+    from app1.models.post import Post
+    metakey = replicas
+    (primary, _) = acquires(metakey)
+
+    # Reads are round robin across the replicas
+    await uvicore.db.query().table('posts').get()
+    assert acquires(metakey) == (primary, [1, 0])
+    await Post.query().find(1)
+    assert acquires(metakey) == (primary, [1, 1])
+
+    # Unless read from the primary explicitly
+    await uvicore.db.query().table('posts').on_primary().get()
+    await Post.query().on_primary().find(1)
+    assert acquires(metakey) == (primary + 2, [1, 1])
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes(replicas):
+    from app1.models.post import Post
+    metakey = replicas
+    assert uvicore.db.sticky(metakey=metakey) == False
+
+    # Reads after a write of this context stay on the primary
+    await uvicore.db.query().table('posts').where('id', 0).delete()
+    assert uvicore.db.sticky(metakey=metakey) == True
+    (primary, _) = acquires(metakey)
+    await Post.query().include('comments').find(1)
+    assert acquires(metakey) == (primary + 2, [0, 0])
+
+
+@pytest.mark.asyncio
+async def test_replica_policies(app1):
+    from uvicore.database.pool import PoolStats
+    from uvicore.database.replicas import LeastConnections, RoundRobin
+    pools = [PoolStats(), PoolStats(), PoolStats()]
+    policy = RoundRobin()
+    assert [policy.choose(pools) for i in range(4)] == [0, 1, 2, 0]
+
+    pools[0].active = 2
+    pools[1].waiters = 1
+    assert LeastConnections().choose(pools) == 2
+
+
+@pytest.mark.asyncio
+async def test_transaction_reads(replicas):
+    from app1.models.post import Post
+    metakey = replicas
+
+    # Reads inside a transaction see its uncommitted writes on the primary
+    async with uvicore.db.transaction(metakey=metakey):
+        assert uvicore.db.sticky(metakey=metakey) == True
+        async with uvicore.db.transaction(metakey=metakey):
+            assert uvicore.db.in_transaction(metakey=metakey) == True
+        assert uvicore.db.in_transaction(metakey=metakey) == True
+        await Post.query().find(1)
+    assert uvicore.db.in_transaction(metakey=metakey) == False
+    assert acquires(metakey)[1] == [0, 0]
@@ -0,0 +1,37 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from uvicore.typing import Dict
+
+# DB Builder
+
+
+@pytest.mark.asyncio
+async def test_stats(app1):
+    metakey = uvicore.db.metakey()
+    before = uvicore.db.stats()[metakey]
+    posts = await uvicore.db.query().table('posts').get()
+    stats = uvicore.db.stats(metakey=metakey)[metakey]
+
+    # Each query acquires a connection and records its latency
+    assert stats.connected == True
+    assert stats.acquires == before.acquires + 1
+    assert stats.active == 0
+    assert stats.waiters == 0
+    assert sum(stats.latency.buckets.values()) == stats.acquires
+    assert stats.latency.max_ms >= stats.latency.avg_ms
+
+
+def test_pool_options(app1):
+    from uvicore.database.pool import pool_options
+
+    # Common options are renamed for each driver, others are passed through
+    connection = Dict({'driver': 'postgresql', 'pool': {'min_size': 2, 'max_size': 20, 'lifetime': 300, 'command_timeout': 5}})
+    assert pool_options(connection) == {'min_size': 2, 'max_size': 20, 'max_inactive_connection_lifetime': 300, 'command_timeout': 5}
+
+    connection = Dict({'driver': 'mysql', 'pool': {'max_size': 20, 'lifetime': 300, 'timeout': 10}})
+    assert pool_options(connection) == {'max_size': 20, 'pool_recycle': 300, 'connect_timeout': 10}
+
+    # SQLite has no pool
+    assert pool_options(Dict({'driver': 'sqlite', 'pool': {'max_size': 20}})) == {}
+    assert pool_options(Dict({'driver': 'mysql'})) == {}
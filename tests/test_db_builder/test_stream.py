@@ -0,0 +1,16 @@
+import pytest
+import uvicore
+import sqlalchemy as sa
+from uvicore.support.dumper import dump
+
+# DB Builder
+
+@pytest.mark.asyncio
+async def test_stream(app1):
+    # Stream rows from a database cursor
+    posts = [x async for x in uvicore.db.query().table('posts').where('creator_id', 'in', [1, 2]).stream()]
+    assert [1, 2, 3, 4, 5] == [x.id for x in posts]
+
+    # Same signature as the ORM stream()
+    posts = [x async for x in uvicore.db.query().table('posts').where('creator_id', 'in', [1, 2]).stream(chunk_size=2)]
+    assert [1, 2, 3, 4, 5] == [x.id for x in posts]
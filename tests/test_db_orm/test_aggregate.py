@@ -0,0 +1,47 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_count_exists(app1):
+    # Count and exists without hydrating models
+    from app1.models.post import Post
+    assert await Post.query().where('id', 'in', [1, 2, 3]).count() == 3
+    assert await Post.query().where('id', 'in', [1, 2, 3]).exists() == True
+    assert await Post.query().where('id', 0).exists() == False
+    assert await Post.query().where('id', 0).count() == 0
+
+    # Relation wheres match get()
+    posts = await Post.query().include('creator').where('creator.email', 'administrator@example.com').get()
+    assert await Post.query().where('creator.email', 'administrator@example.com').count() == len(posts)
+
+    # *Many relation joins never count a record twice
+    assert await Post.query().where('comments.title', 'like', 'Post3%').count() == 1
+
+
+@pytest.mark.asyncio
+async def test_aggregates(app1):
+    from app1.models.post import Post
+    query = Post.query().where('id', 'in', [1, 2, 3])
+    assert await query.sum('id') == 6
+    assert await query.min('id') == 1
+    assert await query.max('id') == 3
+    assert await query.avg('id') == 2
+    assert await Post.query().where('id', 0).max('id') is None
+
+
+@pytest.mark.asyncio
+async def test_with_count(app1):
+    # Relation counts without loading the relations
+    from app1.models.post import Post
+    counted = await Post.query().with_count('comments', 'tags', 'hashtags').where('id', 'in', [1, 2, 3]).order_by('id').get()
+    included = await Post.query().include('comments', 'tags', 'hashtags').where('id', 'in', [1, 2, 3]).order_by('id').get()
+    for (post, full) in zip(counted, included):
+        assert post.comments is None
+        assert post.get_count('comments') == len(full.comments)
+        assert post.get_count('tags') == len(full.tags)
+        assert post.get_count('hashtags') == len(full.hashtags)
+    assert counted[0].get_count('image') is None
@@ -0,0 +1,46 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from tests.transactions import rollback
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_update_delete_relation_where(app1):
+    # Update and delete with wheres on relations as single statements
+    from app1.models.post import Post
+    from app1.models.comment import Comment
+
+    # Temp rows are rolled back
+    async with rollback():
+        pks = await Post.insert_with_relations([
+            {
+                'slug': 'test-bulk-where',
+                'title': 'Test Bulk Where',
+                'creator_id': 1,
+                'owner_id': 2,
+                'comments': [
+                    {'title': 'Bulk Where Comment1', 'body': 'Body', 'creator_id': 1},
+                    {'title': 'Bulk Where Comment2', 'body': 'Body', 'creator_id': 2},
+                ],
+            },
+        ])
+
+        await Comment.query().where('post.slug', 'test-bulk-where').update(body='Updated')
+        comments = await Comment.query().where('post_id', pks[0]).order_by('id').get()
+        assert ['Updated', 'Updated'] == [x.body for x in comments]
+
+        # Other comments are untouched
+        comments = await Comment.query().where('post_id', 1).get()
+        assert 'Updated' not in [x.body for x in comments]
+
+        # SQLAlchemy column wheres mixed with relation wheres
+        await Comment.query().where(Comment.table.c.title, 'Bulk Where Comment2').where('post.slug', 'test-bulk-where').update(body='Column')
+        comments = await Comment.query().where('post_id', pks[0]).order_by('id').get()
+        assert ['Updated', 'Column'] == [x.body for x in comments]
+
+        # Nested relation wheres
+        await Comment.query().where('post.slug', 'test-bulk-where').where('creator.email', 'administrator@example.com').delete()
+        comments = await Comment.query().where('post_id', pks[0]).get()
+        assert ['Bulk Where Comment1'] == [x.title for x in comments]
@@ -0,0 +1,56 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_concurrent_many(app1):
+    # Concurrent and sequential secondary queries stitch the same results
+    from app1.models.post import Post
+    query = Post.query().include('comments', 'tags', 'attributes').where('id', '<=', 5)
+    posts = await query.get()
+
+    uvicore.config.app.orm.concurrency = 1
+    try:
+        sequential = await query.get()
+    finally:
+        uvicore.config.app.orm.concurrency = None
+
+    assert [x.id for x in posts] == [x.id for x in sequential]
+    assert [[c.id for c in x.comments or []] for x in posts] == [[c.id for c in x.comments or []] for x in sequential]
+    assert [[t.id for t in x.tags or []] for x in posts] == [[t.id for t in x.tags or []] for x in sequential]
+    assert [x.attributes for x in posts] == [x.attributes for x in sequential]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_overlap(app1):
+    # Secondary queries run at the same time, in a copy of this context
+    import asyncio
+    from contextvars import ContextVar
+    from app1.models.post import Post
+    request = ContextVar('request')
+    request.set('request1')
+    fetchall = uvicore.db.fetchall
+    running = {'now': 0, 'most': 0}
+    seen = []
+
+    async def overlapped(*args, **kwargs):
+        # Count queries running at the same time and the context each sees
+        running['now'] += 1
+        running['most'] = max(running['most'], running['now'])
+        seen.append(request.get(None))
+        try:
+            await asyncio.sleep(0.05)
+            return await fetchall(*args, **kwargs)
+        finally:
+            running['now'] -= 1
+
+    uvicore.db.fetchall = overlapped
+    try:
+        await Post.query().include('comments', 'tags', 'attributes').where('id', '<=', 5).get()
+    finally:
+        del uvicore.db.fetchall
+    assert running['most'] > 1
+    assert set(seen) == {'request1'}
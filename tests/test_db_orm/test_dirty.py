@@ -0,0 +1,57 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from tests.transactions import rollback
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_dirty(app1):
+    # Loaded models are clean until a field changes
+    from app1.models.post import Post
+    post = await Post.query().find(1)
+    assert post.is_dirty() == False
+    assert post.get_dirty() == {}
+
+    post.title = 'Test Post1 Changed'
+    assert post.is_dirty() == True
+    assert post.is_dirty('title') == True
+    assert post.is_dirty('body', 'other') == False
+    assert post.get_dirty() == {'title': 'Test Post1 Changed'}
+    assert post.get_original('title') == 'Test Post1'
+
+    # Changing back to the original value is clean again
+    post.title = 'Test Post1'
+    assert post.is_dirty() == False
+
+    # New models are entirely dirty
+    new = Post(slug='test-dirty', title='Test Dirty', body='Body', other='Other', creator_id=1, owner_id=2)
+    assert new.is_dirty('slug', 'title', 'body') == True
+    assert new.get_original('title') is None
+
+
+@pytest.mark.asyncio
+async def test_save_changed_only(app1):
+    # Save only updates changed columns, so two copies changing different
+    # fields do not overwrite each other
+    from app1.models.post import Post
+
+    # Changes to the post are rolled back
+    async with rollback():
+        post1 = await Post.query().find(1)
+        post2 = await Post.query().find(1)
+
+        post1.title = 'Test Post1 Changed'
+        await post1.save()
+        assert post1.is_dirty() == False
+
+        post2.other = 'other1 changed'
+        await post2.save()
+
+        post = await Post.query().find(1)
+        assert post.title == 'Test Post1 Changed'
+        assert post.other == 'other1 changed'
+
+        # Nothing changed, save skips the update
+        await post.save()
@@ -0,0 +1,55 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from tests.transactions import rollback
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_pks(app1):
+    # Bulk insert returns the new PKs and sets them on each model
+    from app1.models.hashtag import Hashtag
+
+    # Temp rows are rolled back
+    async with rollback():
+        hashtags = [Hashtag(name='bulk1'), Hashtag(name='bulk2'), Hashtag(name='bulk3')]
+        pks = await Hashtag.insert(hashtags)
+        assert pks == [x.id for x in hashtags]
+
+        found = await Hashtag.query().where('id', 'in', pks).order_by('id').get()
+        assert ['bulk1', 'bulk2', 'bulk3'] == [x.name for x in found]
+
+
+@pytest.mark.asyncio
+async def test_insert_with_relations_pks(app1):
+    # Each level of relations is bulk inserted and linked to its new parent PK
+    from app1.models.post import Post
+
+    # Temp rows are rolled back
+    async with rollback():
+        pks = await Post.insert_with_relations([
+            {
+                'slug': 'test-bulk1',
+                'title': 'Test Bulk1',
+                'creator_id': 1,
+                'owner_id': 2,
+                'comments': [
+                    {'title': 'Bulk1 Comment1', 'body': 'Body', 'creator_id': 1},
+                    {'title': 'Bulk1 Comment2', 'body': 'Body', 'creator_id': 1},
+                ],
+            },
+            {
+                'slug': 'test-bulk2',
+                'title': 'Test Bulk2',
+                'creator_id': 1,
+                'owner_id': 2,
+                'comments': [
+                    {'title': 'Bulk2 Comment1', 'body': 'Body', 'creator_id': 1},
+                ],
+            },
+        ])
+        posts = await Post.query().include('comments').where('id', 'in', pks).order_by('id').get()
+        assert ['test-bulk1', 'test-bulk2'] == [x.slug for x in posts]
+        assert ['Bulk1 Comment1', 'Bulk1 Comment2'] == [x.title for x in posts[0].comments]
+        assert ['Bulk2 Comment1'] == [x.title for x in posts[1].comments]
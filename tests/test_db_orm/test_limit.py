@@ -0,0 +1,30 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_limit_many(app1):
+    # A limit on the main query limits *Many relations to the children of those parents only
+    from app1.models.post import Post
+    posts = await Post.query().include('comments').where('id', '>=', 3).order_by('id').limit(1).get()
+    assert [3] == [x.id for x in posts]
+    assert ['Post3 Comment1', 'Post3 Comment2', 'Post3 Comment3'] == [x.title for x in posts[0].comments]
+
+
+@pytest.mark.asyncio
+async def test_many_key_chunks(app1):
+    # Large parent key lists are split into multiple WHERE IN secondary queries
+    from app1.models.post import Post
+    posts = await Post.query().include('comments', 'tags').where('id', '<=', 5).get()
+    uvicore.config.app.orm.in_chunk_size = 2
+    try:
+        assert uvicore.db.in_chunk_size() == 2
+        chunked = await Post.query().include('comments', 'tags').where('id', '<=', 5).get()
+    finally:
+        uvicore.config.app.orm.in_chunk_size = None
+    assert uvicore.db.in_chunk_size() == 500
+    assert [[c.id for c in x.comments or []] for x in posts] == [[c.id for c in x.comments or []] for x in chunked]
+    assert [[t.id for t in x.tags or []] for x in posts] == [[t.id for t in x.tags or []] for x in chunked]
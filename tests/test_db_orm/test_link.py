@@ -0,0 +1,51 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from tests.transactions import rollback
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_link_many(app1):
+    # Link, sync and unlink Many-To-Many records of many parents at once
+    from app1.models.post import Post
+    from app1.models.tag import Tag
+
+    # Temp posts and pivots are rolled back
+    async with rollback():
+        posts = [
+            Post(slug='test-link1', title='Test Link1', creator_id=1, owner_id=2),
+            Post(slug='test-link2', title='Test Link2', creator_id=1, owner_id=2),
+        ]
+        pks = await Post.insert(posts)
+
+        # SQLite reuses ids of deleted posts, whose pivots other tests may have left behind
+        await Post.unlink_many(posts, 'tags')
+        await Post.unlink_many(posts, 'hashtags')
+
+        async def linked():
+            results = await Post.query().include('tags', 'hashtags').where('id', 'in', pks).order_by('id').get()
+            return [(sorted([x.id for x in post.tags or []]), sorted([x.id for x in post.hashtags or []])) for post in results]
+
+        await Post.link_many(posts, 'tags', [{'id': 1}, {'id': 2}])
+        assert [([1, 2], []), ([1, 2], [])] == await linked()
+
+        # Already linked records are skipped
+        await Post.link_many(posts, 'tags', await Tag.query().where('id', 'in', [2, 3]).get())
+        assert [([1, 2, 3], []), ([1, 2, 3], [])] == await linked()
+
+        # Sync unlinks all others
+        await Post.link_many(posts, 'tags', {'id': 3}, sync=True)
+        assert [([3], []), ([3], [])] == await linked()
+
+        # Polymorphic Many-To-Many
+        await Post.link_many(posts, 'hashtags', [{'id': 1}, {'id': 2}])
+        await Post.unlink_many(posts[0], 'hashtags', {'id': 1})
+        results = await Post.query().include('hashtags').where('id', 'in', pks).order_by('id').get()
+        assert [['obsolete'], ['important', 'obsolete']] == [sorted([y.name for y in x.hashtags]) for x in results]
+
+        # Unlink all
+        await Post.unlink_many(posts, 'tags')
+        await Post.unlink_many(posts, 'hashtags')
+        assert [([], []), ([], [])] == await linked()
@@ -0,0 +1,45 @@
+import asyncio
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_load_many(app1):
+    # Lazy load nested relations of many models at once
+    from app1.models.post import Post
+    posts = await Post.query().where('id', 'in', [1, 2, 3]).order_by('id').get()
+    assert posts[0].comments is None
+
+    await Post.load_many(posts, 'comments.creator', 'owner')
+    assert ['Post1 Comment1', 'Post1 Comment2'] == [x.title for x in posts[0].comments]
+    assert ['Post3 Comment1', 'Post3 Comment2', 'Post3 Comment3'] == [x.title for x in posts[2].comments]
+    assert posts[0].comments[0].creator.id == posts[0].comments[0].creator_id
+    assert posts[1].owner.id == posts[1].owner_id
+
+    # Same as including the relations in the query
+    included = await Post.query().include('comments.creator', 'owner').where('id', 'in', [1, 2, 3]).order_by('id').get()
+    assert [x.dict() for x in included] == [x.dict() for x in posts]
+
+    # Only relations can be loaded
+    with pytest.raises(Exception):
+        await Post.load_many(posts, 'title')
+
+
+@pytest.mark.asyncio
+async def test_load_batched(app1):
+    # Loads in the same event loop tick are one query
+    from app1.models.post import Post
+    posts = await Post.query().where('id', 'in', [1, 2, 3]).order_by('id').get()
+    plans = uvicore.ioc.make('uvicore.orm.plans.PlanCache')
+    plans.clear()
+
+    await asyncio.gather(*[post.load('comments') for post in posts])
+    assert plans.hits + plans.misses == 1
+    assert [2, 0, 3] == [len(x.comments) for x in posts]
+
+    post = await posts[0].load('creator')
+    assert post is posts[0]
+    assert post.creator.id == post.creator_id
@@ -0,0 +1,35 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_row_mapper(app1):
+    # Row to model slots are precompiled per relation prefix
+    from app1.models.post import Post
+    (columns, evaluators) = Post.row_slots()
+    assert ('slug', 'unique_slug') in columns
+    (columns, evaluators) = Post.row_slots('creator__posts')
+    assert ('slug', 'creator__posts__unique_slug') in columns
+    assert Post.row_slots('creator__posts') is Post.row_slots('creator__posts')
+
+    # Only columns found in the row are mapped
+    post = Post.mapper({'id': 1, 'unique_slug': 'test-post1', 'title': 'Test Post1', 'creator_id': 1, 'owner_id': 2}).model()
+    assert 'test-post1' == post.slug
+    assert post.body is None
+    post = Post.mapper({'posts__id': 1, 'posts__unique_slug': 'test-post1', 'posts__title': 'Test Post1', 'posts__creator_id': 1, 'posts__owner_id': 2}, 'posts').model()
+    assert 'test-post1' == post.slug
+
+
+@pytest.mark.asyncio
+async def test_dict_mapper(app1):
+    # Dicts are user input, never marked clean or swapped for a session instance
+    from app1.models.post import Post
+    async with uvicore.orm.session():
+        loaded = await Post.query().find(1)
+        post = Post.mapper({'id': 1, 'unique_slug': 'changed', 'title': 'Changed', 'creator_id': 1, 'owner_id': 2}).model()
+        assert post is not loaded
+        assert 'changed' == post.slug
+        assert post.is_dirty('slug')
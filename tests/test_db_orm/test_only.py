@@ -0,0 +1,86 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from tests.transactions import rollback
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_only(app1):
+    from app1.models.post import Post
+    query = Post.query().only('title')
+
+    # Only the listed fields and the primary key are selected
+    sql = query.sql()['main']
+    assert 'posts.title' in sql
+    assert 'posts.body' not in sql
+
+    post = await query.find(1)
+    assert post.id == 1
+    assert post.title == 'Test Post1'
+    assert post.body is None
+    assert post.is_loaded() == False
+    assert post.is_loaded('id', 'title') == True
+    assert post.is_loaded('body') == False
+
+    # Unloaded fields are not dirty
+    assert post.is_dirty() == False
+
+    # A full query is fully loaded
+    post = await Post.query().find(1)
+    assert post.is_loaded() == True
+
+
+@pytest.mark.asyncio
+async def test_defer(app1):
+    from app1.models.post import Post
+    posts = await Post.query().defer('body', 'other').where('id', 'in', [1, 2]).order_by('id').get()
+    assert [post.id for post in posts] == [1, 2]
+    assert [post.title for post in posts] == ['Test Post1', 'Test Post2']
+    assert posts[0].body is None
+    assert posts[0].is_loaded('title', 'slug') == True
+    assert posts[0].is_loaded('body', 'other') == False
+
+
+@pytest.mark.asyncio
+async def test_only_relations(app1):
+    from app1.models.post import Post
+    query = Post.query().include('creator', 'comments').only('title', 'creator.email', 'comments.title')
+    sqls = query.sql()
+    assert 'posts.body' not in sqls['main']
+    assert 'creator.first_name' not in sqls['main']
+    assert 'comments.body' not in sqls['comments']
+
+    post = await query.find(1)
+    full = await Post.query().include('creator', 'comments').find(1)
+    assert post.title == 'Test Post1'
+    assert post.body is None
+
+    # *One relation fields
+    assert post.creator.id == full.creator.id
+    assert post.creator.email == full.creator.email
+    assert post.creator.is_loaded('email') == True
+    assert post.creator.is_loaded('first_name') == False
+
+    # *Many children are still merged by their always selected foreign key
+    assert [comment.title for comment in post.comments] == [comment.title for comment in full.comments]
+    assert all(comment.body is None for comment in post.comments)
+    assert all(comment.post_id == 1 for comment in post.comments)
+
+
+@pytest.mark.asyncio
+async def test_only_save(app1):
+    from app1.models.post import Post
+
+    # Changes to the post are rolled back
+    async with rollback():
+        post = await Post.query().only('title').find(1)
+        original = await Post.query().find(1)
+
+        # Saving a partial model only updates the changed fields, not the unloaded ones
+        post.title = 'Test Post1 Partial'
+        await post.save()
+        saved = await Post.query().find(1)
+        assert saved.title == 'Test Post1 Partial'
+        assert saved.body == original.body
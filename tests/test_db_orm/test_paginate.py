@@ -0,0 +1,34 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_chunk(app1):
+    # Keyset chunks by primary key with *Many relations scoped to each chunk
+    from app1.models.post import Post
+    posts = await Post.query().include('comments').where('id', '<=', 5).get()
+    chunks = [x async for x in Post.query().include('comments').where('id', '<=', 5).chunk(2)]
+    assert [[1, 2], [3, 4], [5]] == [[x.id for x in chunk] for chunk in chunks]
+    chunked = [x for chunk in chunks for x in chunk]
+    assert [[c.id for c in x.comments or []] for x in posts] == [[c.id for c in x.comments or []] for x in chunked]
+
+
+@pytest.mark.asyncio
+async def test_paginate(app1):
+    # First page by offset, next pages by cursor
+    from app1.models.post import Post
+    query = Post.query().include('creator', 'comments').where('id', '<=', 5)
+    page = await query.paginate(per_page=2)
+    assert [1, 2] == [x.id for x in page.results]
+    assert ['Post1 Comment1', 'Post1 Comment2'] == [x.title for x in page.results[0].comments]
+
+    page = await query.paginate(per_page=2, cursor=page.cursor)
+    assert [3, 4] == [x.id for x in page.results]
+    assert ['Post3 Comment1', 'Post3 Comment2', 'Post3 Comment3'] == [x.title for x in page.results[0].comments]
+
+    page = await query.paginate(per_page=2, cursor=page.cursor)
+    assert [5] == [x.id for x in page.results]
+    assert page.cursor is None
@@ -0,0 +1,54 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_plan_hit(app1):
+    # Same query shape with different values re-uses the cached plan
+    from app1.models.post import Post
+    plans = uvicore.ioc.make('uvicore.orm.plans.PlanCache')
+    plans.clear()
+
+    post = await Post.query().include('creator', 'comments').where('slug', 'test-post1').get()
+    assert plans.misses == 1 and plans.hits == 0
+    assert ['test-post1'] == [x.slug for x in post]
+
+    post = await Post.query().include('creator', 'comments').where('slug', 'test-post3').get()
+    assert plans.misses == 1 and plans.hits == 1
+    assert ['test-post3'] == [x.slug for x in post]
+    assert ['Post3 Comment1', 'Post3 Comment2', 'Post3 Comment3'] == [x.title for x in post[0].comments]
+
+    # Where IN values are bound one parameter per item, so only the same
+    # number of items re-uses the plan
+    posts = await Post.query().where('id', 'in', [1, 2]).get()
+    assert [1, 2] == [x.id for x in posts]
+    posts = await Post.query().where('id', 'in', [4, 5]).get()
+    assert [4, 5] == [x.id for x in posts]
+    posts = await Post.query().where('id', 'in', [3, 4, 5]).get()
+    assert [3, 4, 5] == [x.id for x in posts]
+    assert plans.stats().hits == 2
+    assert plans.stats().misses == 3
+
+
+@pytest.mark.asyncio
+async def test_plan_shape(app1):
+    # Different includes, operators or null values are different plans
+    from app1.models.post import Post
+    plans = uvicore.ioc.make('uvicore.orm.plans.PlanCache')
+    plans.clear()
+
+    await Post.query().where('id', 1).get()
+    await Post.query().where('id', '!=', 1).get()
+    await Post.query().include('creator').where('id', 1).get()
+    await Post.query().where('other', 'null').get()
+    assert plans.misses == 4 and plans.hits == 0
+
+    # Limit values are bound, only their presence is part of the shape
+    posts = await Post.query().limit(2).get()
+    assert [1, 2] == [x.id for x in posts]
+    posts = await Post.query().limit(3).get()
+    assert [1, 2, 3] == [x.id for x in posts]
+    assert plans.misses == 5 and plans.hits == 1
@@ -0,0 +1,39 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_copy(app1):
+    # Forking a query copies containers only, items are shared byref
+    from app1.models.post import Post
+    query = Post.query().include('creator', 'tags').where('slug', 'test-post1').sort('tags.name').query
+    fork = query.copy()
+
+    fork.wheres.append(('id', '=', 1))
+    fork.includes.append('comments')
+    assert len(query.wheres) == 1 and len(fork.wheres) == 2
+    assert query.includes == ['creator', 'tags']
+    assert fork.wheres[0] is query.wheres[0]
+    assert fork.table is query.table
+
+
+@pytest.mark.asyncio
+async def test_copy_relations(app1):
+    # Each fork builds its own joins and relations without touching the original
+    from app1.models.post import Post
+    builder = Post.query().include('creator', 'owner', 'tags')
+    query = builder.query.copy()
+    builder._build_orm_relations(query)
+    assert ['creator', 'owner', 'tags'] == [x for x in query.relations.keys()]
+    assert builder.query.relations == {} and builder.query.joins == []
+
+    # Same model relations are separate instances sharing the same related entity
+    assert query.relations['creator'] is not query.relations['owner']
+    assert query.relations['creator'].entity is query.relations['owner'].entity
+
+    fork = query.copy()
+    assert fork.joins is not query.joins
+    assert [x.table for x in fork.joins] == [x.table for x in query.joins]
@@ -0,0 +1,43 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_raw(app1):
+    # Raw models are constructed without validation but are identical
+    from app1.models.post import Post
+    posts = await Post.query().include('creator', 'comments', 'attributes').where('id', '<=', 3).get()
+    raw = await Post.query().include('creator', 'comments', 'attributes').where('id', '<=', 3).raw().get()
+    assert [type(x) for x in raw] == [Post, Post, Post]
+    assert [x.dict() for x in posts] == [x.dict() for x in raw]
+
+
+@pytest.mark.asyncio
+async def test_as_dicts(app1):
+    # Plain dictionaries with the same field mapping and relation nesting
+    from app1.models.post import Post
+    posts = await Post.query().include('creator', 'comments', 'tags').where('id', '<=', 3).get()
+    dicts = await Post.query().include('creator', 'comments', 'tags').where('id', '<=', 3).as_dicts().get()
+    assert [x.dict() for x in posts] == dicts
+    assert 'test-post1' == dicts[0]['slug']
+    assert 'Post1 Comment1' == dicts[0]['comments'][0]['title']
+
+    # Keyed results
+    dicts = await Post.query().where('id', '<=', 3).key_by('slug').as_dicts().get()
+    assert ['test-post1', 'test-post2', 'test-post3'] == [x for x in dicts.keys()]
+
+
+@pytest.mark.asyncio
+async def test_as_tuples(app1):
+    # Plain tuples of field values in model field order
+    from app1.models.post import Post
+    posts = await Post.query().include('creator').where('id', '<=', 3).get()
+    tuples = await Post.query().include('creator').where('id', '<=', 3).as_tuples().get()
+    fields = list(Post.__fields__.keys())
+    for post, values in zip(posts, tuples):
+        assert tuple(post.dict(exclude={'creator'}).values()) == tuple(v for (f, v) in zip(fields, values) if f != 'creator')
+    assert 'test-post1' == tuples[0][fields.index('slug')]
+    assert posts[0].creator.email == tuples[0][fields.index('creator')][list(posts[0].creator.__fields__.keys()).index('email')]
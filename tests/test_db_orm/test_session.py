@@ -0,0 +1,96 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from tests.transactions import rollback
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_identity_map(app1):
+    # The same row is the same instance within a session
+    from app1.models.post import Post
+    from app1.models.user import User
+    async with uvicore.orm.session() as session:
+        posts = await Post.query().include('creator', 'owner').where('id', 'in', [2, 3]).order_by('id').get()
+
+        # Post2 creator and Post3 owner are both user 1
+        assert posts[0].creator is posts[1].owner
+
+        # Find is answered from memory
+        user = await User.query().find(posts[0].creator_id)
+        assert user is posts[0].creator
+
+        # Separate queries return the same instance
+        post = await Post.query().where('slug', 'test-post2').get()
+        assert post[0] is posts[0]
+
+    # Outside of a session every query builds new instances
+    assert uvicore.orm.current_session() is None
+    post1 = await Post.query().find(2)
+    post2 = await Post.query().find(2)
+    assert post1 is not post2
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work(app1):
+    # Pending models are saved at the end of the session
+    from app1.models.post import Post
+    from app1.models.hashtag import Hashtag
+
+    # Changes and temp hashtags are rolled back
+    async with rollback():
+        async with uvicore.orm.session() as session:
+            hashtag1 = await Hashtag.query().find(1)
+            hashtag1.name = 'important-changed'
+            new = Hashtag(name='session1')
+            session.add(hashtag1, new)
+
+            # Not saved until committed
+            assert new.id is None
+            assert (await Hashtag.query().where('name', 'important-changed').get()) == []
+
+        assert new.id is not None
+        assert [1, new.id] == [x.id for x in await Hashtag.query().where('name', 'in', ['important-changed', 'session1']).order_by('id').get()]
+
+        # Exceptions discard pending saves
+        with pytest.raises(ValueError):
+            async with uvicore.orm.session() as session:
+                hashtag1.name = 'important-discarded'
+                session.add(hashtag1)
+                raise ValueError()
+        assert 'important-changed' == (await Hashtag.query().find(1)).name
+
+
+@pytest.mark.asyncio
+async def test_session_bulk_evict(app1):
+    # Bulk updates and deletes forget the stale loaded instances of their model
+    from app1.models.hashtag import Hashtag
+    async with rollback():
+        async with uvicore.orm.session() as session:
+            hashtag1 = await Hashtag.query().find(1)
+            await Hashtag.query().where('id', 1).update(name='important-bulk')
+            hashtag = await Hashtag.query().find(1)
+            assert hashtag is not hashtag1
+            assert hashtag.name == 'important-bulk'
+
+
+@pytest.mark.asyncio
+async def test_session_middleware(app1):
+    # Pending saves of a request are committed before the response body is sent
+    from app1.models.hashtag import Hashtag
+    from uvicore.orm.middleware import Session
+    sent = []
+
+    async def app(scope, receive, send):
+        uvicore.orm.current_session().add(Hashtag(name='middleware1'))
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'ok'})
+
+    async def send(message):
+        saved = await Hashtag.query().where('name', 'middleware1').get()
+        sent.append((message['type'], len(saved)))
+
+    async with rollback():
+        await Session(app)({'type': 'http'}, None, send)
+    assert sent == [('http.response.start', 0), ('http.response.body', 1)]
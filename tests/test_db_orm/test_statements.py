@@ -0,0 +1,53 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_statement_cache(app1):
+    from app1.models.post import Post
+    metakey = uvicore.db.metakey()
+    uvicore.db._statements[metakey].clear()
+
+    # Queries of the same plan compile once and are re-bound to each queries values
+    post1 = await Post.query().include('creator', 'comments').find(1)
+    post2 = await Post.query().include('creator', 'comments').find(2)
+    stats = uvicore.db.stats(metakey=metakey)[metakey].statements
+    assert (stats.statements, stats.misses, stats.hits) == (1, 1, 1)
+    assert stats.hit_ratio == 0.5
+
+    # Re-bound statements return this queries results
+    assert [post1.id, post2.id] == [1, 2]
+    assert post2.creator.id == post2.creator_id
+    assert [x.post_id for x in post2.comments or []] == [2] * len(post2.comments or [])
+
+    # Queries are plain SQLAlchemy queries, only executed queries use the statement cache
+    import sqlalchemy as sa
+    queries = Post.query().include('creator', 'comments').where('id', 2).queries()
+    assert isinstance(queries[0]['saquery'], sa.sql.Select)
+    assert str(queries[0]['saquery']) == queries[0]['sql']
+
+
+def test_statement_cache_lru(app1):
+    import sqlalchemy as sa
+    from sqlalchemy.dialects import sqlite
+    from uvicore.database.statements import Statement, StatementCache
+    cache = StatementCache({'size': 2})
+    dialect = sqlite.dialect()
+    select = sa.select([sa.literal_column('id')]).where(sa.literal_column('id') == sa.bindparam('plan_id', 1))
+
+    # Each statement is bound to its own values
+    compiled = Statement(select, {'plan_id': 5}, 'a', cache).compile(dialect=dialect)
+    assert compiled.params == {'plan_id': 5}
+    compiled = Statement(select, {'plan_id': 6}, 'a', cache).compile(dialect=dialect)
+    assert compiled.params == {'plan_id': 6}
+    assert compiled.string == str(select.compile(dialect=dialect))
+
+    # Least recently used statements are evicted first
+    Statement(select, {}, 'b', cache).compile(dialect=dialect)
+    Statement(select, {}, 'a', cache).compile(dialect=dialect)
+    Statement(select, {}, 'c', cache).compile(dialect=dialect)
+    assert [key[-1] for key in cache._statements.keys()] == ['a', 'c']
+    assert (cache.hits, cache.misses) == (2, 3)
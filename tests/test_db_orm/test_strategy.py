@@ -0,0 +1,50 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_json_strategy(app1):
+    from app1.models.post import Post
+    includes = ['creator', 'comments', 'tags', 'hashtags', 'attributes']
+
+    # *Many relations are JSON arrays of the main query instead of secondary queries
+    sqls = Post.query().include(*includes).strategy('json').sql()
+    assert list(sqls.keys()) == ['main']
+    assert 'json_group_array' in sqls['main']
+
+    # Same results as the default query strategy
+    posts = await Post.query().include(*includes).order_by('id').get()
+    jsons = await Post.query().include(*includes).strategy('json').order_by('id').get()
+    assert [post.id for post in jsons] == [post.id for post in posts]
+    for (post, json) in zip(posts, jsons):
+        assert json.creator.id == post.creator.id
+        assert sorted([x.id for x in json.comments or []]) == sorted([x.id for x in post.comments or []])
+        assert sorted([x.name for x in json.tags or []]) == sorted([x.name for x in post.tags or []])
+        assert sorted([x.name for x in json.hashtags or []]) == sorted([x.name for x in post.hashtags or []])
+        assert json.attributes == post.attributes
+
+
+@pytest.mark.asyncio
+async def test_json_strategy_fallback(app1):
+    from app1.models.post import Post
+
+    # Nested includes and relation filters still use secondary queries
+    sqls = Post.query().include('comments.creator', 'tags').strategy('json').sql()
+    assert 'comments' in sqls
+    assert 'tags' not in sqls
+
+    sqls = Post.query().include('comments', 'tags').filter('comments.title', 'like', '%1%').strategy('json').sql()
+    assert 'comments' in sqls
+    assert 'tags' not in sqls
+
+    # Nested children of the JSON strategy match the query strategy
+    post = await Post.query().include('comments.creator', 'tags').find(1)
+    json = await Post.query().include('comments.creator', 'tags').strategy('json').find(1)
+    assert [x.creator.id for x in json.comments] == [x.creator.id for x in post.comments]
+    assert sorted([x.name for x in json.tags]) == sorted([x.name for x in post.tags])
+
+    with pytest.raises(Exception):
+        Post.query().strategy('lateral')
@@ -0,0 +1,26 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_stream(app1):
+    # Stream models from a database cursor
+    from app1.models.post import Post
+    posts = [x async for x in Post.query().where('id', 'in', [1, 2, 3]).stream()]
+    assert [1, 2, 3] == [x.id for x in posts]
+
+
+@pytest.mark.asyncio
+async def test_stream_chunks(app1):
+    # *Many relations are queried per chunk of parent keys and match a regular get()
+    from app1.models.post import Post
+    query = Post.query().include('creator', 'comments', 'tags').order_by('id')
+    posts = await query.get()
+    streamed = [x async for x in query.stream(chunk_size=2)]
+    assert [x.id for x in posts] == [x.id for x in streamed]
+    assert [x.creator.email for x in posts] == [x.creator.email for x in streamed]
+    assert [[c.title for c in x.comments or []] for x in posts] == [[c.title for c in x.comments or []] for x in streamed]
+    assert [[t.name for t in x.tags or []] for x in posts] == [[t.name for t in x.tags or []] for x in streamed]
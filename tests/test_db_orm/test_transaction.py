@@ -0,0 +1,73 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_transaction_commit(app1):
+    from app1.models.post import Post, Comment
+    hashtags = uvicore.db.table('hashtags')
+    assert uvicore.db.in_transaction() == False
+
+    # DB builder and ORM queries share the transactions connection
+    async with uvicore.db.transaction():
+        assert uvicore.db.in_transaction() == True
+        await uvicore.db.execute(hashtags.insert().values(name='txn1'))
+        hashtag = await uvicore.db.query().table('hashtags').find(name='txn1')
+        pk = await Comment.insert({'title': 'Txn Comment1', 'body': 'Body', 'post_id': 1, 'creator_id': 1})
+
+        # Uncommitted writes are visible to reads of this transaction, including secondary queries
+        post = await Post.query().include('comments').find(1)
+        assert 'Txn Comment1' in [x.title for x in post.comments]
+    assert uvicore.db.in_transaction() == False
+
+    assert (await uvicore.db.query().table('hashtags').find(name='txn1')) is not None
+    assert (await Comment.query().find(title='Txn Comment1')) is not None
+
+    # Delete temp hashtag and comment
+    await uvicore.db.query().table('hashtags').where('id', hashtag.id).delete()
+    await Comment.query().where('title', 'Txn Comment1').delete()
+
+
+@pytest.mark.asyncio
+async def test_transaction_rollback(app1):
+    from app1.models.post import Post, Comment
+    hashtags = uvicore.db.table('hashtags')
+
+    # An exception rolls back every query of the transaction
+    with pytest.raises(ValueError):
+        async with uvicore.db.transaction():
+            await uvicore.db.execute(hashtags.insert().values(name='txn2'))
+            await Post.insert_with_relations([{
+                'slug': 'test-txn2',
+                'title': 'Test Txn2',
+                'creator_id': 1,
+                'owner_id': 2,
+                'comments': [{'title': 'Txn2 Comment1', 'body': 'Body', 'creator_id': 1}],
+            }])
+            raise ValueError('rollback')
+
+    assert (await uvicore.db.query().table('hashtags').find(name='txn2')) is None
+    assert (await Post.query().find(slug='test-txn2')) is None
+    assert (await Comment.query().find(title='Txn2 Comment1')) is None
+
+
+@pytest.mark.asyncio
+async def test_transaction_savepoint(app1):
+    hashtags = uvicore.db.table('hashtags')
+
+    # Nested transactions are savepoints, rolling back only their own queries
+    async with uvicore.db.transaction():
+        await uvicore.db.execute(hashtags.insert().values(name='txn3'))
+        with pytest.raises(ValueError):
+            async with uvicore.db.transaction():
+                await uvicore.db.execute(hashtags.insert().values(name='txn4'))
+                raise ValueError('rollback')
+
+    names = [x.name for x in await uvicore.db.query().table('hashtags').where('name', 'in', ['txn3', 'txn4']).get()]
+    assert names == ['txn3']
+
+    # Delete temp hashtag
+    await uvicore.db.query().table('hashtags').where('name', 'txn3').delete()
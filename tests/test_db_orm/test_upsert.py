@@ -0,0 +1,68 @@
+import pytest
+import uvicore
+from uvicore.support.dumper import dump
+from tests.transactions import rollback
+
+# DB ORM
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert(app1):
+    # Existing PKs are updated and new rows are inserted in one statement
+    from app1.models.hashtag import Hashtag
+
+    # Temp rows are rolled back
+    async with rollback():
+        hashtags = [Hashtag(name='upsert1'), Hashtag(name='upsert2')]
+        pks = await Hashtag.insert(hashtags)
+
+        await Hashtag.upsert([
+            {'id': pks[0], 'name': 'upsert1-updated'},
+            {'id': pks[1], 'name': 'upsert2-updated'},
+            {'id': pks[1] + 100, 'name': 'upsert3'},
+        ])
+        found = await Hashtag.query().where('id', 'in', pks + [pks[1] + 100]).order_by('id').get()
+        assert ['upsert1-updated', 'upsert2-updated', 'upsert3'] == [x.name for x in found]
+
+        # Upserted models are clean, but new models without a PK do not get their generated PK
+        found[0].name = 'upsert1-again'
+        new = Hashtag(name='upsert5')
+        await Hashtag.upsert([found[0], new])
+        assert (found[0].get_dirty(), new.get_dirty()) == ({}, {})
+        assert new.id is None
+        assert (await Hashtag.query().find(name='upsert5')) is not None
+
+
+@pytest.mark.asyncio
+async def test_save_upsert(app1):
+    # Save with upsert skips the existence SELECT
+    from app1.models.hashtag import Hashtag
+
+    # Temp rows are rolled back
+    async with rollback():
+        hashtag = Hashtag(name='upsert4')
+        await hashtag.save()
+
+        hashtag.name = 'upsert4-updated'
+        await hashtag.save(upsert=True)
+        found = await Hashtag.query().find(hashtag.id)
+        assert 'upsert4-updated' == found.name
+
+
+@pytest.mark.asyncio
+async def test_upsert_keeps_write_only(app1):
+    # Write only fields not loaded (None) are not upserted over the stored value
+    from app1.models.user import User
+
+    # Changes to the user are rolled back
+    async with rollback('auth'):
+        users = User.table
+        await User.execute(users.update().where(users.c.id == 1).values(password='secret'))
+
+        user = await User.query().find(1)
+        assert user.password is None
+        user.first_name = 'Upserted'
+        await user.save(upsert=True)
+
+        found = await User.query().show_writeonly().find(1)
+        assert ('Upserted', 'secret') == (found.first_name, found.password)
@@ -0,0 +1,20 @@
+import uvicore
+from contextlib import asynccontextmanager
+
+
+class Rollback(Exception):
+    pass
+
+
+@asynccontextmanager
+async def rollback(connection: str = None):
+    """Run a tests writes in a transaction that is always rolled back, even if an assert fails
+
+    So tests never leave rows (or pivot rows of deleted posts) behind for other tests.
+    """
+    try:
+        async with uvicore.db.transaction(connection):
+            yield
+            raise Rollback()
+    except Rollback:
+        pass
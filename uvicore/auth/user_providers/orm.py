@@ -175,7 +175,8 @@ class Orm(UserProvider):
         username = kwargs['username']
 
         # Get actual backend user
-        user = await UserModel.query().show_writeonly(['password']).find(username=username)
+        # Password is not needed, save() only updates the fields changed below
+        user = await UserModel.query().find(username=username)
 
         # If we have successfully logged in, we are not disabled
         user.disabled = False
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Tuple, TypeVar, Union
+from typing import Any, AsyncGenerator, Dict, Generic, List, Tuple, TypeVar, Union
 
 try:
     import sqlalchemy as sa
@@ -37,6 +37,18 @@ class QueryBuilder(Generic[B, E], ABC):
     def offset(self, offset: int) -> B[B, E]:
         """Limit offset"""
 
+    @abstractmethod
+    def on_primary(self) -> B[B, E]:
+        """Read from the primary database even if the connection has read replicas"""
+
+    @abstractmethod
+    def distinct(self) -> B[B, E]:
+        """Always SELECT DISTINCT, instead of only when joins may duplicate rows"""
+
+    @abstractmethod
+    def no_distinct(self) -> B[B, E]:
+        """Never SELECT DISTINCT, even when joins may duplicate rows"""
+
     @abstractmethod
     def cache(self, name: str = None) -> B[B, E]:
         """Cache results, None seconds uses cache backend default, 0=forever"""
@@ -75,6 +87,18 @@ class DbQueryBuilder(QueryBuilder[B, E], ABC):
     async def get(self) -> List[RowProxy]:
         """Execute select query and return all rows found"""
 
+    @abstractmethod
+    async def stream(self, chunk_size: int = 1000) -> AsyncGenerator[RowProxy, None]:
+        """Execute select query and yield each row as it is read from the database cursor"""
+
+    @abstractmethod
+    async def chunk(self, size: int = 1000) -> AsyncGenerator[List[RowProxy], None]:
+        """Execute select query in chunks of size rows using keyset pagination on the primary key"""
+
+    @abstractmethod
+    async def paginate(self, page: int = 1, per_page: int = 20, cursor: str = None) -> Any:
+        """Execute select query for one page of results ordered by primary key"""
+
     @abstractmethod
     async def delete(self) -> None:
         """Execute delete query"""
@@ -105,6 +129,41 @@ class OrmQueryBuilder(QueryBuilder[B, E], ABC):
         """Key results as a Dictionary by this column"""
         pass
 
+    @abstractmethod
+    def raw(self) -> B[B, E]:
+        """Return models constructed from trusted database rows without validation"""
+        pass
+
+    @abstractmethod
+    def as_dicts(self) -> B[B, E]:
+        """Return results as plain dictionaries instead of models"""
+        pass
+
+    @abstractmethod
+    def as_tuples(self) -> B[B, E]:
+        """Return results as plain tuples of field values instead of models"""
+        pass
+
+    @abstractmethod
+    def with_count(self, *args) -> B[B, E]:
+        """Count the records of these relations (without loading them) into each models get_count(relation)"""
+        pass
+
+    @abstractmethod
+    def strategy(self, strategy: str) -> B[B, E]:
+        """Eager load strategy of included *Many relations, 'query' (default) or 'json'"""
+        pass
+
+    @abstractmethod
+    def only(self, *args) -> B[B, E]:
+        """Select only these fields, with dot notation for relation fields like only('id', 'title', 'creator.email')"""
+        pass
+
+    @abstractmethod
+    def defer(self, *args) -> B[B, E]:
+        """Do not select these fields, with dot notation for relation fields like defer('body', 'creator.password')"""
+        pass
+
     @abstractmethod
     async def find(self, pk_value: Union[int, str] = None, **kwargs) -> Union[E, None]:
         """Execute query by primary key or custom column and return first row found"""
@@ -115,6 +174,51 @@ class OrmQueryBuilder(QueryBuilder[B, E], ABC):
         """Execute a select query and return all rows found"""
         pass
 
+    @abstractmethod
+    async def count(self) -> int:
+        """Count the records matching this query without selecting or hydrating them"""
+        pass
+
+    @abstractmethod
+    async def exists(self) -> bool:
+        """Check if any record matches this query using an EXISTS subquery"""
+        pass
+
+    @abstractmethod
+    async def sum(self, field: str) -> Any:
+        """Sum of this field of the records matching this query"""
+        pass
+
+    @abstractmethod
+    async def min(self, field: str) -> Any:
+        """Minimum of this field of the records matching this query"""
+        pass
+
+    @abstractmethod
+    async def max(self, field: str) -> Any:
+        """Maximum of this field of the records matching this query"""
+        pass
+
+    @abstractmethod
+    async def avg(self, field: str) -> Any:
+        """Average of this field of the records matching this query"""
+        pass
+
+    @abstractmethod
+    async def stream(self, chunk_size: int = 1000) -> AsyncGenerator[E, None]:
+        """Execute a select query and yield each model as it is read from the database cursor"""
+        pass
+
+    @abstractmethod
+    async def chunk(self, size: int = 1000) -> AsyncGenerator[Union[List[E], Dict[str, E]], None]:
+        """Execute a select query in chunks of size rows using keyset pagination on the primary key"""
+        pass
+
+    @abstractmethod
+    async def paginate(self, page: int = 1, per_page: int = 20, cursor: str = None) -> Any:
+        """Execute a select query for one page of results ordered by primary key"""
+        pass
+
     @abstractmethod
     async def delete(self) -> None:
         """Execute delete query"""
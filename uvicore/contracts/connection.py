@@ -1,4 +1,4 @@
-from uvicore.typing import Dict
+from uvicore.typing import Dict, List
 
 class Connection(Dict):
     """Database Connection Definition"""
@@ -17,6 +17,11 @@ class Connection(Dict):
     prefix: str
     metakey: str
     url: str
+    pool: Dict
+    replicas: List[Dict]
+    replica_policy: str
+    read_your_writes: float
+    statements: Dict
 
 
 
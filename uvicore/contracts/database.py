@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Union, Mapping, Optional
+from contextvars import Context
+from typing import Any, AsyncContextManager, AsyncGenerator, Dict, Hashable, List, Union, Mapping, Optional
 
 try:
     from sqlalchemy.engine import Engine
@@ -105,13 +106,73 @@ class Database(ABC):
         pass
 
     @abstractmethod
-    async def fetchall(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None) -> List[RowProxy]:
-        """Fetch List of records from a SQLAlchemy Core Query based on connection str or metakey"""
+    def stats(self, connection: str = None, metakey: str = None) -> Dict[str, Dict]:
+        """Live connection pool and statement cache statistics keyed by metakey, of all databases or just this connection or metakey"""
         pass
 
     @abstractmethod
-    async def fetchone(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None) -> Optional[RowProxy]:
-        """Fetch one record from a SQLAlchemy Core Query based on connection str or metakey"""
+    def in_transaction(self, connection: str = None, metakey: str = None) -> bool:
+        """Whether this context is inside a uvicore.db.transaction() of this database"""
+        pass
+
+    @abstractmethod
+    def transaction(self, connection: str = None, metakey: str = None) -> AsyncContextManager:
+        """Run all queries of this context in one transaction of the primary database, nested transactions are savepoints"""
+        pass
+
+    @abstractmethod
+    def statement(self, statement: ClauseElement, values: Dict, key: Hashable, connection: str = None, metakey: str = None) -> ClauseElement:
+        """Bind values to a statement whose compiled SQL is cached by its structure key (like an ORM plan key)"""
+        pass
+
+    @abstractmethod
+    def task_context(self) -> Context:
+        """Copy of this context to run a concurrent task in, with its own pool connections"""
+        pass
+
+    @abstractmethod
+    def sticky(self, connection: str = None, metakey: str = None) -> bool:
+        """Whether reads of this context stick to the primary, inside a transaction or just after a write"""
+        pass
+
+    @abstractmethod
+    async def fetchall(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None, primary: bool = False) -> List[RowProxy]:
+        """Fetch List of records from a SQLAlchemy Core Query based on connection str or metakey, from a read replica unless primary"""
+        pass
+
+    @abstractmethod
+    async def fetchone(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None, primary: bool = False) -> Optional[RowProxy]:
+        """Fetch one record from a SQLAlchemy Core Query based on connection str or metakey, from a read replica unless primary"""
+        pass
+
+    @abstractmethod
+    def max_params(self, connection: str = None, metakey: str = None) -> int:
+        """Maximum bound parameters of one statement for this connections dialect (or app config database.max_params)"""
+        pass
+
+    @abstractmethod
+    def in_chunk_size(self) -> int:
+        """Maximum keys of one WHERE IN, longer key lists are split into multiple queries (or app config orm.in_chunk_size)"""
+        pass
+
+    @abstractmethod
+    async def insert_many(self, table: Table, values: List[Dict], connection: str = None, metakey: str = None) -> None:
+        """Bulk insert rows using as few multi-row INSERT statements as the bound parameter limit allows"""
+        pass
+
+    @abstractmethod
+    async def insert_returning(self, table: Table, values: List[Dict], connection: str = None, metakey: str = None) -> List:
+        """Bulk insert rows using multi-row INSERT statements returning the primary key of each inserted row"""
+        pass
+
+    @abstractmethod
+    async def upsert(self, table: Table, values: List[Dict], connection: str = None, metakey: str = None) -> None:
+        """Bulk insert rows, updating rows whose primary key already exists, using dialect native upserts"""
+        pass
+
+    @abstractmethod
+    async def iterate(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None, primary: bool = False) -> AsyncGenerator[RowProxy, None]:
+        """Iterate records one at a time from a database cursor of a SQLAlchemy Core Query based on connection str or metakey"""
         pass
 
     @abstractmethod
@@ -1,6 +1,6 @@
 #from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, TypeVar, Union, List, Tuple, Any
+from typing import Dict, Generic, TypeVar, Union, List, Optional, Tuple, Any
 
 from uvicore.contracts import Mapper
 from uvicore.contracts import OrmQueryBuilder
@@ -28,24 +28,23 @@ class Model(Generic[E], ABC):
     #     pass
 
     @abstractmethod
-    async def insert(entity, models: Union[List[E], List[Dict]]) -> None:
+    async def insert(entity, models: Union[List[E], List[Dict]]) -> Any:
         """Insert one or more entities as List of entities or List of Dictionaries
 
-        This bulk insert does NOT allow inserting child relations at the
-        same time as there is no way to get each parents PK out to
-        reference with each child in BULK. If you want to insert parent
-        and relations at the same time use the slower non-bulk
-        insert_with_relations() instead.
+        A List is bulk inserted using multi-row INSERT statements and returns
+        the List of new PKs, which are also set on each model instance.  This
+        bulk insert does NOT insert child relations.  If you want to insert
+        parent and relations at the same time use insert_with_relations() instead.
         """
 
     @abstractmethod
-    async def insert_with_relations(entity, models: List[Dict]) -> None:
+    async def insert_with_relations(entity, models: List[Dict]) -> List:
         """Insert one or more entities as List of Dict that DO have relations included
 
-        Because relations are included, this insert is NOT bulk and must
-        loop each row, insert the parent, get the PK, then insert each
-        children (or children first then parent depending on BelongsTo vs
-        HasOne or HasMany)
+        Each level of the relation tree is inserted as one bulk insert per
+        table.  All BelongsTo children are inserted first, then all parents
+        (getting back each new PK), then all HasOne/HasMany/Morph children of
+        all parents at once.  Returns the List of PKs of the inserted models.
         """
 
     @abstractmethod
@@ -68,13 +67,57 @@ class Model(Generic[E], ABC):
         """Same as create(), except it deletes all first, so it sets the entire children"""
 
     @abstractmethod
-    async def save(self) -> None:
+    async def upsert(entity, models: Union[E, Dict, List[E], List[Dict]]) -> None:
+        """Insert or update one or more entities as List of entities or List of Dictionaries"""
+
+    @abstractmethod
+    async def load_many(entity, models: List[E], *relations: str) -> List[E]:
+        """Load (lazy) relations of many already loaded entities at once"""
+
+    @abstractmethod
+    async def load(self, *relations: str) -> Any:
+        """Load (lazy) relations of this model"""
+
+    @abstractmethod
+    async def save_many(entity, models: Union[List[E], List[Dict]]) -> None:
+        """Save (insert or update) many entities with batched statements"""
+
+    @abstractmethod
+    async def save(self, upsert: bool = False) -> None:
         """Save this model to the database (insert or update)"""
 
     @abstractmethod
     async def delete(self) -> None:
         """Delete this model from the database"""
 
+    @abstractmethod
+    def is_dirty(self, *fields: str) -> bool:
+        """Check if any (or any of these) fields changed since loaded or last saved"""
+
+    @abstractmethod
+    def get_dirty(self) -> Dict:
+        """Get Dict of fields (and their new values) changed since loaded or last saved"""
+
+    @abstractmethod
+    def is_loaded(self, *fields: str) -> bool:
+        """Check if all (or all of these) fields were loaded, False for fields pruned by .only() or .defer()"""
+
+    @abstractmethod
+    def get_count(self, relation_name: str) -> Optional[int]:
+        """Get the record count of a relation queried with .with_count(), None if not counted"""
+
+    @abstractmethod
+    def get_original(self, field: str = None) -> Any:
+        """Get the original value of a field (or Dict of all fields) as loaded or last saved"""
+
+    @abstractmethod
+    async def link_many(entity, parents: List[Any], relation_name: str, models: Union[Any, List[Any]], *, sync: bool = False) -> None:
+        """Link records to many parents at once using the Many-To-Many pivot table"""
+
+    @abstractmethod
+    async def unlink_many(entity, parents: List[Any], relation_name: str, models: Union[Any, List[Any]] = None) -> None:
+        """Unlink records (or all records) from many parents at once using the Many-To-Many pivot table"""
+
     @abstractmethod
     async def link(self, relation_name: str, models: Union[Any, List[Any]]) -> None:
         """Link records to relation using the Many-To-Many pivot table"""
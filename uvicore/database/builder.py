@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import base64
+import json
 import operator as operators
-from copy import deepcopy
-from typing import Any, Dict, Generic, List, Tuple, TypeVar, Union, OrderedDict
+from copy import copy
+from typing import Any, AsyncGenerator, Dict, Generic, List, Optional, Tuple, TypeVar, Union, OrderedDict
 from uvicore.support import hash
 
 import sqlalchemy as sa
-from sqlalchemy.sql.expression import BinaryExpression
+from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList
 
 from sqlalchemy.sql import quoted_name
 from collections import OrderedDict as ODict
@@ -118,6 +120,21 @@ class QueryBuilder(Generic[B, E], BuilderInterface[B, E]):
         self.query.offset = offset
         return self
 
+    def on_primary(self) -> B[B, E]:
+        """Read from the primary database even if the connection has read replicas"""
+        self.query.on_primary = True
+        return self
+
+    def distinct(self) -> B[B, E]:
+        """Always SELECT DISTINCT, instead of only when joins may duplicate rows"""
+        self.query.distinct = True
+        return self
+
+    def no_distinct(self) -> B[B, E]:
+        """Never SELECT DISTINCT, even when joins may duplicate rows"""
+        self.query.distinct = False
+        return self
+
     def cache(self, key: str = None, *, seconds: int = None) -> B[B, E]:
         """Cache results, None seconds uses cache backend default, 0=forever"""
         # Seconds as None will default to cache configured default seconds
@@ -132,6 +149,80 @@ class QueryBuilder(Generic[B, E], BuilderInterface[B, E]):
         query, saquery = self._build_query('select', self.query.copy())
         return str(saquery)
 
+    async def chunk(self, size: int = 1000) -> AsyncGenerator[Union[List, Dict], None]:
+        """Execute select query in chunks of size rows using keyset pagination on the primary key
+
+        Each chunk seeks past the last primary key of the previous chunk
+        (WHERE pk > last ORDER BY pk LIMIT size) instead of using an OFFSET, so
+        every chunk is as fast as the first.  Any .order_by() is replaced by the
+        primary key order.
+        """
+        after = None
+        while True:
+            results, more, after = await self._keyset_page(size, after)
+            if results: yield results
+            if not more: break
+
+    async def paginate(self, page: int = 1, per_page: int = 20, cursor: str = None) -> Page:
+        """Execute select query for one page of results ordered by primary key
+
+        Without a cursor the page is found by OFFSET.  Pass the returned opaque
+        cursor to get the next page using keyset pagination on the primary key
+        instead.  The returned cursor is None on the last page.
+        """
+        if cursor:
+            after, page = self._decode_cursor(cursor)
+            results, more, last = await self._keyset_page(per_page, after)
+        else:
+            offset = (page - 1) * per_page if page > 1 else None
+            results, more, last = await self._keyset_page(per_page, None, offset)
+
+        return Page(
+            results=results,
+            page=page,
+            per_page=per_page,
+            cursor=self._encode_cursor(last, page + 1) if more else None,
+        )
+
+    def _keyset(self, size: int, after: Any = None, offset: int = None) -> B[B, E]:
+        # Fork this builder ordered by primary key, seeking past the after primary key
+        builder = copy(self)
+        builder.query = self.query.copy()
+        builder.query.order_by = [(self._pk(), 'ASC')]
+        builder.query.limit = size
+        builder.query.offset = offset
+        if after is not None: builder.query.wheres.append((self._pk(), '>', after))
+
+        # The primary key must be selected to seek past the last row of each page
+        if builder.query.selects:
+            columns = [self._column(select, builder.query) for select in builder.query.selects]
+            if not [column for column in columns if column.sacol is getattr(builder.query.table.c, self._pk()) and not column.alias]:
+                builder.query.selects.append(self._pk())
+        return builder
+
+    async def _keyset_page(self, size: int, after: Any = None, offset: int = None) -> Tuple:
+        # Fork this query by primary key and get one more than size to detect more pages
+        builder = self._keyset(size + 1, after, offset)
+        query, saquery = builder._build_query('select', copy(builder.query))
+        rows = await uvicore.db.fetchall(saquery, connection=self._connection(), primary=query.on_primary)
+
+        # Results, more pages and the last primary key seen
+        more = len(rows) > size
+        rows = rows[0:size]
+        if not rows: return ([], False, None)
+        return (rows, more, rows[-1][self._pk()])
+
+    def _encode_cursor(self, after: Any, page: int) -> str:
+        # Opaque URL safe cursor holding the last primary key seen
+        return base64.urlsafe_b64encode(json.dumps([after, page]).encode()).decode()
+
+    def _decode_cursor(self, cursor: str) -> Tuple:
+        try:
+            after, page = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except Exception:
+            raise ValueError('Invalid pagination cursor {}'.format(cursor))
+        return (after, page)
+
     def _build_query(self, method: str, query: Query) -> Tuple:
         # Convert our Query into SQLAlchemy query
         #saquery: sa.sql.select = None
@@ -145,7 +236,10 @@ class QueryBuilder(Generic[B, E], BuilderInterface[B, E]):
 
         if method == 'select' and query.table is not None:
             # Build .select() query from tables, joins and selectable columns
-            saquery = self._build_select(query).distinct()
+            saquery = self._build_select(query)
+
+            # DISTINCT forces a sort or hash of the entire result, so only when rows may be duplicated
+            if self._needs_distinct(query): saquery = saquery.distinct()
 
             # Build .select_from() query from tables and joins
             saquery = self._build_from(query, saquery)
@@ -156,11 +250,11 @@ class QueryBuilder(Generic[B, E], BuilderInterface[B, E]):
             # Build .group_by() queries
             saquery = self._build_group_by(query, saquery)
 
-            # Build .limit() query
-            if query.limit: saquery = saquery.limit(query.limit)
+            # Build .limit() query (could be a bind parameter from the ORM plan cache)
+            if query.limit is not None: saquery = saquery.limit(query.limit)
 
-            # Build .offset query
-            if query.offset: saquery = saquery.offset(query.offset)
+            # Build .offset query (could be a bind parameter from the ORM plan cache)
+            if query.offset is not None: saquery = saquery.offset(query.offset)
 
         elif method == 'delete' and query.table is not None:
             # Build .delete() query from table
@@ -184,6 +278,42 @@ class QueryBuilder(Generic[B, E], BuilderInterface[B, E]):
         # Return query and SQLAlchemy query
         return (query, saquery)
 
+    def _needs_distinct(self, query: Query) -> bool:
+        """Whether this select may return duplicate rows and needs DISTINCT, unless set by .distinct() or .no_distinct()"""
+        if query.distinct is not None: return query.distinct
+
+        # Joins may duplicate rows, unless each joined table is matched on one of its unique keys
+        for join in query.joins:
+            if not self._unique_join(join): return True
+
+        # A single table select is unique if it selects the tables entire primary key
+        pks = [column.name for column in query.table.primary_key.columns]
+        if not pks: return True
+        if not query.selects: return False
+        selected = []
+        for select in query.selects:
+            column = self._column(select, query).sacol
+            if getattr(column, 'table', None) is query.table: selected.append(column.name)
+        return not all(pk in selected for pk in pks)
+
+    def _unique_join(self, join: Join) -> bool:
+        """Whether this joins onclause matches at most one row of the joined table (on its primary or a unique key)"""
+        table = getattr(join.table, 'element', join.table)
+        clauses = join.onclause.clauses if isinstance(join.onclause, BooleanClauseList) else [join.onclause]
+        if isinstance(join.onclause, BooleanClauseList) and join.onclause.operator is not operators.and_: return False
+
+        # Joined table columns matched by equality
+        matched = []
+        for clause in clauses:
+            if not isinstance(clause, BinaryExpression) or clause.operator is not operators.eq: continue
+            for column in (clause.left, clause.right):
+                if getattr(column, 'table', None) is join.table: matched.append(column.name)
+
+        # Any primary key, unique constraint or unique index entirely matched
+        keys = [constraint.columns for constraint in table.constraints if isinstance(constraint, (sa.PrimaryKeyConstraint, sa.UniqueConstraint))]
+        keys += [index.columns for index in table.indexes if index.unique]
+        return any(len(key) and all(column.name in matched for column in key) for key in keys)
+
     def _build_group_by(self, query: Query, saquery):
         for column in query.group_by:
             column = self._column(column, query)
@@ -450,9 +580,17 @@ class Query:
     limit: Optional[int]
     offset: Optional[int]
     keyed_by: Optional[str]
+    result_format: Optional[str]
+    with_counts: List[str]
+    distinct: Optional[bool]
+    strategy: Optional[str]
+    on_primary: bool
+    only_fields: List[str]
+    defer_fields: List[str]
     show_writeonly: Union[bool, List]
     cache: Dict
     relations: OrderedDict[str, Relation]
+    json_relations: OrderedDict[str, Relation]
     joins: List[Join]
     table: sa.Table
 
@@ -470,26 +608,48 @@ class Query:
         self.limit: Optional[int] = None
         self.offset: Optional[int] = None
         self.keyed_by: Optional[str] = None
+        self.result_format: Optional[str] = None
+        self.with_counts: List[str] = []
+        self.distinct: Optional[bool] = None
+        self.strategy: Optional[str] = None
+        self.on_primary: bool = False
+        self.only_fields: List[str] = []
+        self.defer_fields: List[str] = []
         self.show_writeonly: Union[bool, List] = False
         self.cache: Dict = None
         self.relations: OrderedDict[str, Relation] = ODict()
+        self.json_relations: OrderedDict[str, Relation] = ODict()
         self.joins: List[Join] = []
         self.table: sa.Table = None
 
-    def copy(self):
-        # Objects are always byref in python.  We want a complete deep clone
-        # of a query.  Must use deep or it won't copy the .joins since its a
-        # list of an actual class also.  Shallow copies all lists and dicts, but
-        # not classes or list of classes, they will be byref unless deep
-        table = self.table
-        self.table = None
-        newquery = deepcopy(self)
-        self.table = table
-
-        # Copy the original table by ref back or else SQLAlchemy will see a new
-        # table class ID and think you are joining 2 different tables.  We must keep
-        # the exact instance of each table.
-        newquery.table = table
+    def copy(self) -> Query:
+        # Fork this query using structural sharing instead of a deepcopy.  Only the
+        # containers (lists and dicts) are copied so each fork can append its own
+        # wheres, selects, joins and relations.  The items themselves (where tuples,
+        # Join and Relation instances, SQLAlchemy tables and columns) are never
+        # modified once added to a query so they are shared byref between forks.
+        # This makes a fork O(number of items) instead of O(entire nested tree).
+        # Sharing also keeps the exact instance of each table, or else SQLAlchemy will
+        # see a new table class ID and think you are joining 2 different tables.
+        newquery = self.__class__.__new__(self.__class__)
+        newquery.__dict__.update(self.__dict__)
+        newquery.includes = list(self.includes)
+        newquery.selects = list(self.selects)
+        newquery.wheres = list(self.wheres)
+        newquery.or_wheres = list(self.or_wheres)
+        newquery.filters = list(self.filters)
+        newquery.or_filters = list(self.or_filters)
+        newquery.group_by = list(self.group_by)
+        newquery.order_by = list(self.order_by)
+        newquery.sort = list(self.sort)
+        newquery.with_counts = list(self.with_counts)
+        newquery.only_fields = list(self.only_fields)
+        newquery.defer_fields = list(self.defer_fields)
+        newquery.relations = ODict(self.relations)
+        newquery.json_relations = ODict(self.json_relations)
+        newquery.joins = list(self.joins)
+        if type(self.show_writeonly) == list: newquery.show_writeonly = list(self.show_writeonly)
+        if self.cache is not None: newquery.cache = dict(self.cache)
         return newquery
 
     def hash(self, *, hash_type: str = 'sha1', **kwargs) -> str:
@@ -508,8 +668,31 @@ class Query:
             'limit': self.limit,
             'offset': self.offset,
             'keyed_by': self.keyed_by,
+            'result_format': self.result_format,
+            'with_counts': self.with_counts,
+            'distinct': self.distinct,
+            'strategy': self.strategy,
+            'only_fields': self.only_fields,
+            'defer_fields': self.defer_fields,
+            'show_writeonly': self.show_writeonly,
             'kwargs': kwargs,
         }
         hash_method = getattr(hash, hash_type)
         return hash_method(str(unique_params))
 
+
+@dataclass
+@uvicore.service()
+class Page:
+    # One page of results from .paginate() along with the opaque cursor of the
+    # next page.  Cursor is None on the last page.
+    results: Union[List, Dict]
+    page: int
+    per_page: int
+    cursor: Optional[str]
+
+    def __init__(self, results: Union[List, Dict], page: int, per_page: int, cursor: Optional[str]):
+        self.results = results
+        self.page = page
+        self.per_page = per_page
+        self.cursor = cursor
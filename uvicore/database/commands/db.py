@@ -167,6 +167,20 @@ def connections():
     dump(db.connections)
 
 
+@command()
+@argument('connections', required=False)
+async def stats(connections: str = None):
+    """Show connection pool statistics for connection(s)"""
+    # Pools are per process, so connect first to show the pools this process opens
+    metakeys = get_metakeys(connections) if connections else db.databases.keys()
+    for metakey in metakeys:
+        await db.database(metakey=metakey)
+    log.header("Connection pool statistics by metakey")
+    log.line()
+    for metakey in metakeys:
+        dump(db.stats(metakey=metakey))
+
+
 
 
 
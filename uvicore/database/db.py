@@ -1,15 +1,35 @@
-from uvicore.typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Union
+from uvicore.typing import Any, AsyncGenerator, Dict, Hashable, List, Mapping, Optional, Union
+
+import time
+from contextlib import asynccontextmanager
+from contextvars import Context, ContextVar, copy_context
 
 import sqlalchemy as sa
 from databases import Database as EncodeDatabase
+from databases.core import Connection as EncodeConnection
 from sqlalchemy.sql import ClauseElement
 
 import uvicore
 from uvicore.contracts import Connection
 from uvicore.contracts import Database as DatabaseInterface
 from uvicore.database.query import DbQueryBuilder
+from uvicore.database.pool import PoolStats, pool_options
+from uvicore.database.replicas import Replicas, last_written, written
+from uvicore.database.statements import Statement, StatementCache
+from uvicore.database.upsert import upsert
 from uvicore.support.dumper import dd, dump
 from sqlalchemy.engine.result import RowProxy
+from sqlalchemy.sql.dml import Insert
+
+# Maximum bound parameters of one statement by dialect (SQLite before 3.32 allows 999)
+MAX_PARAMS = {
+    'sqlite': 999,
+    'postgresql': 32767,
+    'mysql': 65535,
+}
+
+# Open uvicore.db.transaction() depth of each metakey in this context
+_transactions: ContextVar[Optional[Dict]] = ContextVar('uvicore.database.transactions', default=None)
 
 @uvicore.service('uvicore.database.db.Db',
     aliases=['Database', 'database', 'db'],
@@ -47,6 +67,9 @@ class Db(DatabaseInterface):
         self._engines = Dict()
         self._databases = Dict()
         self._metadatas = Dict()
+        self._pools = Dict()
+        self._replicas = Dict()
+        self._statements = Dict()
 
     def init(self, default: str, connections: Dict[str, Connection]) -> None:
         self._default = default
@@ -58,25 +81,39 @@ class Db(DatabaseInterface):
             if connection.metakey in self.metadatas: continue
 
             if connection.backend == 'sqlalchemy':
-                # Build encode/databases specific connection URL
-                # connection.url has a dialect in it, which we need for engines
-                # but don't need for encode/databases library
-                if connection.driver == 'sqlite':
-                    encode_url = (connection.driver
-                        + ':///' + connection.database
-                    )
-                else:
-                    encode_url = (connection.driver
-                        + '://' + connection.username
-                        + ':' + connection.password
-                        + '@' + connection.host
-                        + ':' + str(connection.port)
-                        + '/' + connection.database
-                    )
                 self._engines[connection.metakey] = sa.create_engine(connection.url)
-                self._databases[connection.metakey] = EncodeDatabase(encode_url)
+                self._databases[connection.metakey] = EncodeDatabase(self._encode_url(connection), **pool_options(connection))
+                self._pools[connection.metakey] = PoolStats()
+                self._statements[connection.metakey] = StatementCache(connection.statements)
                 self._metadatas[connection.metakey] = sa.MetaData()
 
+                # Read replicas inherit every option of the primary they do not override
+                if connection.replicas:
+                    self._replicas[connection.metakey] = Replicas(
+                        databases=[
+                            EncodeDatabase(self._encode_url(replica), **pool_options(replica))
+                            for replica in [Dict({**connection, **replica}) for replica in connection.replicas]
+                        ],
+                        policy=connection.replica_policy,
+                        window=connection.read_your_writes,
+                    )
+
+    def _encode_url(self, connection: Connection) -> str:
+        # Build encode/databases specific connection URL
+        # connection.url has a dialect in it, which we need for engines
+        # but don't need for encode/databases library
+        if connection.driver == 'sqlite':
+            return (connection.driver
+                + ':///' + connection.database
+            )
+        return (connection.driver
+            + '://' + connection.username
+            + ':' + connection.password
+            + '@' + connection.host
+            + ':' + str(connection.port)
+            + '/' + connection.database
+        )
+
     def packages(self, connection: str = None, metakey: str = None) -> Connection:
         if not metakey:
             if not connection: connection = self.default
@@ -142,38 +179,270 @@ class Db(DatabaseInterface):
     async def disconnect(self, connection: str = None, metakey: str = None, from_all: bool = False) -> None:
         if from_all:
             # Disconnect from all connected databases
-            for database in self.databases.values():
+            metakeys = self.databases.keys()
+        else:
+            # Disconnect from one database by connection str or metakey
+            metakeys = [self.metakey(connection, metakey)]
+
+        for metakey in metakeys:
+            databases = [self.databases.get(metakey)]
+            if metakey in self._replicas: databases.extend(self._replicas[metakey].databases)
+            for database in databases:
                 # Only disconnect if connected or will throw an error
                 if database.is_connected:
                     await database.disconnect()
-        else:
-            # Disconnect from one database by connection str or metakey
-            metakey = self.metakey(connection, metakey)
-            database = self.databases.get(metakey)
-            if database.is_connected:
-                await database.disconnect()
 
-    async def fetchall(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None) -> List[RowProxy]:
-        database = await self.database(connection, metakey)
-        return await database.fetch_all(query, values)
+    def stats(self, connection: str = None, metakey: str = None) -> Dict[str, Dict]:
+        """Live connection pool and statement cache statistics keyed by metakey, of all databases or just this connection or metakey"""
+        metakeys = [self.metakey(connection, metakey)] if connection or metakey else self.databases.keys()
+        stats = Dict()
+        for key in metakeys:
+            stats[key] = self._pools[key].stats(self.databases[key])
+            stats[key].statements = self._statements[key].stats()
+            if key in self._replicas: stats[key].replicas = self._replicas[key].stats()
+        return stats
+
+    def statement(self, statement: ClauseElement, values: Dict, key: Hashable, connection: str = None, metakey: str = None) -> ClauseElement:
+        """Bind values to a statement whose compiled SQL is cached by its structure key (like an ORM plan key)"""
+        statements = self._statements.get(self.metakey(connection, metakey))
+        if statements is None or not statements.enabled: return statement.params(values)
+        return Statement(statement, values, key, statements)
+
+    def sticky(self, connection: str = None, metakey: str = None) -> bool:
+        """Whether reads of this context stick to the primary, inside a transaction or just after a write"""
+        metakey = self.metakey(connection, metakey)
+        replicas = self._replicas.get(metakey)
+        if not replicas: return True
+
+        # Inside a transaction every read must see its uncommitted writes
+        if self.in_transaction(metakey=metakey): return True
+
+        # Replicas lag behind the primary, so a context reads its own writes from the primary
+        written = last_written(metakey)
+        return written is not None and time.monotonic() - written < replicas.window
+
+    def task_context(self) -> Context:
+        """Copy of this context to run a concurrent task in, with its own pool connections
+
+        databases keeps one connection per context, so tasks sharing it would
+        serialize all their queries.  Every other context variable is kept.
+        """
+        context = copy_context()
+        databases = list(self.databases.values())
+        for replicas in self._replicas.values(): databases.extend(replicas.databases)
+        for database in databases:
+            context.run(database._connection_context.set, EncodeConnection(database._backend))
+        return context
+
+    def in_transaction(self, connection: str = None, metakey: str = None) -> bool:
+        """Whether this context is inside a uvicore.db.transaction() of this database"""
+        metakey = self.metakey(connection, metakey)
+        return bool((_transactions.get() or {}).get(metakey))
+
+    @asynccontextmanager
+    async def transaction(self, connection: str = None, metakey: str = None) -> AsyncGenerator[EncodeConnection, None]:
+        """Run all queries of this context, DB builder and ORM alike, in one transaction of the primary database
 
-    async def fetchone(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None) -> Optional[RowProxy]:
-        database = await self.database(connection, metakey)
-        return await database.fetch_one(query, values)
+        async with uvicore.db.transaction():
+            await Post.insert_with_relations(...)
+            await uvicore.db.query().table('posts').where('id', 1).update(...)
 
-    async def execute(self, query: Union[ClauseElement, str], values: Union[List, Dict] = None, connection: str = None, metakey: str = None) -> Any:
-        database = await self.database(connection, metakey)
-        if type(values) == dict:
-            return await database.execute(query, values)
-        elif type(values) == list:
-            return await database.execute_many(query, values)
+        The connection of the transaction is this tasks connection, so every
+        query of this context (and of tasks it starts) runs on it.  Committed
+        when the block exits or rolled back if it raises.  A nested transaction
+        is a savepoint, rolled back alone if its block raises.
+        """
+        metakey = self.metakey(connection, metakey)
+        async with self._acquire(metakey=metakey, write=True) as conn, conn.transaction():
+            # Generator code runs in the callers context, so this depth is seen by
+            # every query of the block (and tasks it starts) until it exits
+            depths = _transactions.get() or {}
+            token = _transactions.set({**depths, metakey: depths.get(metakey, 0) + 1})
+            try:
+                yield conn
+            finally:
+                _transactions.reset(token)
+
+    @asynccontextmanager
+    async def _acquire(self, connection: str = None, metakey: str = None, *, write: bool = False, primary: bool = False) -> AsyncGenerator[EncodeConnection, None]:
+        """Acquire this tasks connection to a database (or a read replica) from its pool, measuring pool statistics"""
+        metakey = self.metakey(connection, metakey)
+        if write or primary or self.sticky(metakey=metakey):
+            database = await self.database(metakey=metakey)
+            pool = self._pools[metakey]
         else:
-            return await database.execute(query)
+            database, pool = self._replicas[metakey].choose()
+            if not database.is_connected: await database.connect()
+
+        async with pool.acquire(database) as conn:
+            yield conn
+        if write: written(metakey)
+
+    async def fetchall(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None, primary: bool = False) -> List[RowProxy]:
+        async with self._acquire(connection, metakey, primary=primary) as database:
+            return await database.fetch_all(query, values)
 
-    #  async def iterate(self, query: Union[ClauseElement, str], values: dict = None, connection: str = None) -> AsyncGenerator[Mapping, None]:
-    #     async with self.connection() as connection:
-    #         async for record in connection.iterate(query, values):
-    #             yield record
+    async def fetchone(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None, primary: bool = False) -> Optional[RowProxy]:
+        async with self._acquire(connection, metakey, primary=primary) as database:
+            return await database.fetch_one(query, values)
+
+    async def execute(self, query: Union[ClauseElement, str], values: Union[List, Dict] = None, connection: str = None, metakey: str = None) -> Any:
+        # A List of rows for a plain INSERT is bulk inserted with multi-row INSERT
+        # statements (or COPY), not one statement per row like execute_many
+        if type(values) == list and values and self._plain_insert(query):
+            return await self.insert_many(query.table, values, connection, metakey)
+
+        async with self._acquire(connection, metakey, write=True) as database:
+            if type(values) == dict:
+                return await database.execute(query, values)
+            elif type(values) == list:
+                return await database.execute_many(query, values)
+            else:
+                return await database.execute(query)
+
+    async def insert_many(self, table: sa.Table, values: List[Dict], connection: str = None, metakey: str = None) -> None:
+        """Bulk insert rows using as few multi-row INSERT statements as the bound parameter limit allows
+
+        Large bulk inserts into PostgreSQL use COPY FROM instead.
+        """
+        dialect = self.engine(connection, metakey).dialect
+        max_params = self.max_params(connection, metakey)
+        async with self._acquire(connection, metakey, write=True) as database, database.transaction():
+            if self._copyable(table, values, dialect):
+                await self._copy(database, table, values, dialect)
+                return
+            for batch in self._batches(values, max_params):
+                await database.execute(table.insert().values(batch))
+
+    async def insert_returning(self, table: sa.Table, values: List[Dict], connection: str = None, metakey: str = None) -> List:
+        """Bulk insert rows using multi-row INSERT statements returning the primary key of each inserted row
+
+        PostgreSQL uses INSERT ... RETURNING.  SQLite and MySQL get the last
+        insert id of each multi-row statement and infer the contiguous ids of
+        its rows.  MySQL InnoDB only guarantees contiguous ids for a multi-row
+        INSERT with innodb_autoinc_lock_mode 0 or 1, so with the interleaved
+        lock mode 2 (the MySQL 8 default) each row is inserted on its own.
+        """
+        dialect = self.engine(connection, metakey).dialect
+        max_params = self.max_params(connection, metakey)
+
+        # First primary key column of this table
+        pk = [x for x in table.primary_key.columns][0]
+
+        # A None primary key means the database should generate it
+        values = [{k: v for (k, v) in row.items() if not (k == pk.name and v is None)} for row in values]
+
+        pks = []
+        async with self._acquire(connection, metakey, write=True) as database, database.transaction():
+            # Primary keys were explicitly set on every row, nothing to return
+            if all(pk.name in row for row in values) and self._copyable(table, values, dialect):
+                await self._copy(database, table, values, dialect)
+                return [row[pk.name] for row in values]
+
+            # Whether MySQL ids of one multi-row INSERT are contiguous, and their increment
+            if dialect.name == 'mysql':
+                row = await database.fetch_one('SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment')
+                (lock_mode, increment) = (int(row[0]), int(row[1]))
+
+            for batch in self._batches(values, max_params):
+                query = table.insert().values(batch)
+                if pk.name in batch[0]:
+                    # Primary keys were explicitly set
+                    await database.execute(query)
+                    pks.extend([row[pk.name] for row in batch])
+                elif dialect.name == 'postgresql':
+                    rows = await database.fetch_all(query.returning(pk))
+                    pks.extend([row[0] for row in rows])
+                elif dialect.name == 'mysql' and lock_mode == 2:
+                    # Interleaved ids of concurrent inserts, so the last insert id of each row
+                    for row in batch:
+                        pks.append(await database.execute(table.insert().values(row)))
+                elif dialect.name == 'mysql':
+                    # MySQL last insert id is the id of the FIRST row inserted
+                    first = await database.execute(query)
+                    pks.extend(range(first, first + len(batch) * increment, increment))
+                else:
+                    # SQLite last insert rowid is the id of the LAST row inserted
+                    last = await database.execute(query)
+                    pks.extend(range(last - len(batch) + 1, last + 1))
+        return pks
+
+    async def upsert(self, table: sa.Table, values: List[Dict], connection: str = None, metakey: str = None) -> None:
+        """Bulk insert rows, updating rows whose primary key already exists, using dialect native upserts
+
+        PostgreSQL and SQLite use INSERT ... ON CONFLICT DO UPDATE and MySQL
+        uses INSERT ... ON DUPLICATE KEY UPDATE.
+        """
+        dialect = self.engine(connection, metakey).dialect.name
+        max_params = self.max_params(connection, metakey)
+
+        # A None primary key means the database should generate it
+        pk = [x for x in table.primary_key.columns][0]
+        values = [{k: v for (k, v) in row.items() if not (k == pk.name and v is None)} for row in values]
+
+        async with self._acquire(connection, metakey, write=True) as database, database.transaction():
+            for batch in self._batches(values, max_params):
+                await database.execute(upsert(table, batch, dialect))
+
+    def max_params(self, connection: str = None, metakey: str = None) -> int:
+        """Maximum bound parameters of one statement for this connections dialect (or app config database.max_params)"""
+        dialect = self.engine(connection, metakey).dialect.name
+        return uvicore.config.app.database.max_params or MAX_PARAMS.get(dialect, 999)
+
+    def in_chunk_size(self) -> int:
+        """Maximum keys of one WHERE IN, longer key lists are split into multiple queries (or app config orm.in_chunk_size)"""
+        return uvicore.config.app.orm.in_chunk_size or 500
+
+    def _batches(self, values: List[Dict], max_params: int) -> List[List[Dict]]:
+        """Split rows into batches of the same columns, each under the maximum bound parameters of one statement"""
+        batches = []
+        batch = []
+        for row in values:
+            if batch and (row.keys() != batch[0].keys() or (len(batch) + 1) * len(row) > max_params):
+                batches.append(batch)
+                batch = []
+            batch.append(row)
+        if batch: batches.append(batch)
+        return batches
+
+    def _plain_insert(self, query: Union[ClauseElement, str]) -> bool:
+        """Whether this query is a table.insert() without its own values, prefixes or returning"""
+        return (isinstance(query, Insert)
+            and query.parameters is None
+            and not query._prefixes
+            and query._returning is None
+        )
+
+    def _copyable(self, table: sa.Table, values: List[Dict], dialect: sa.engine.interfaces.Dialect) -> bool:
+        """Whether these rows are worth (and safe) to bulk insert with PostgreSQL COPY FROM"""
+        # COPY has a round trip of its own, small bulk inserts are faster as multi-row INSERTs
+        threshold = uvicore.config.app.database.copy_threshold or 1000
+        if dialect.name != 'postgresql' or len(values) < threshold: return False
+
+        # COPY needs the same columns in every row
+        columns = values[0].keys()
+        if any(row.keys() != columns for row in values): return False
+
+        # COPY applies server defaults of omitted columns, but not SQLAlchemy client side defaults
+        return not [column for column in table.columns if column.name not in columns and column.default is not None]
+
+    async def _copy(self, database: EncodeConnection, table: sa.Table, values: List[Dict], dialect: sa.engine.interfaces.Dialect) -> None:
+        """Bulk insert rows with PostgreSQL COPY FROM on the raw asyncpg connection"""
+        # COPY skips SQLAlchemy, so convert values (JSON, Enum...) with each columns bind processor
+        columns = list(values[0].keys())
+        processors = [table.c[name].type.bind_processor(dialect) for name in columns]
+        records = [
+            tuple(process(row[name]) if process else row[name] for (name, process) in zip(columns, processors))
+            for row in values
+        ]
+        await database.raw_connection.copy_records_to_table(
+            table.name, records=records, columns=columns, schema_name=table.schema
+        )
+
+    async def iterate(self, query: Union[ClauseElement, str], values: Dict = None, connection: str = None, metakey: str = None, primary: bool = False) -> AsyncGenerator[RowProxy, None]:
+        async with self._acquire(connection, metakey, primary=primary) as database:
+            async for row in database.iterate(query, values):
+                yield row
 
     # async def _connect(self, connection: str = None, metakey: str = None) -> None:
     #     # Async connect to db if not connected
@@ -0,0 +1,114 @@
+import time
+from contextlib import asynccontextmanager
+
+from databases import Database as EncodeDatabase
+from databases.core import Connection as EncodeConnection
+
+from uvicore.typing import Any, AsyncGenerator, Dict, List
+from uvicore.support.dumper import dump, dd
+
+# Acquire latency histogram bucket upper bounds in milliseconds (last bucket is everything slower)
+BUCKETS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+
+def pool_options(connection: Dict) -> Dict:
+    """Convert a connections pool config into encode/databases backend options
+
+    Common options are translated for each driver, all other options are passed
+    through to the drivers pool (asyncpg.create_pool or aiomysql.create_pool) as is.
+        min_size: Minimum connections kept open in the pool
+        max_size: Maximum connections the pool will open
+        lifetime: Seconds an idle connection is kept (postgresql) or recycled after (mysql)
+        timeout:  Seconds to wait when opening a new connection
+    For example statement_cache_size is the number of server side prepared
+    statements asyncpg keeps (and re-uses) per pooled connection.
+    """
+    # SQLite has no connection pool
+    if not connection.pool or connection.driver == 'sqlite': return {}
+
+    options = dict(connection.pool)
+    renames = {
+        'postgresql': {'lifetime': 'max_inactive_connection_lifetime'},
+        'mysql': {'lifetime': 'pool_recycle', 'timeout': 'connect_timeout'},
+    }.get(connection.driver, {})
+    for (name, rename) in renames.items():
+        if name in options: options[rename] = options.pop(name)
+    return options
+
+
+class PoolStats:
+    """Live connection pool statistics of one database (metakey)
+
+    Waiters and acquire latencies are measured around each connection acquire
+    of uvicore.db.  In use, idle and size are read from the drivers pool itself.
+    """
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.waiters = 0
+        self.acquires = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    @asynccontextmanager
+    async def acquire(self, database: EncodeDatabase) -> AsyncGenerator[EncodeConnection, None]:
+        """Acquire this tasks connection from the pool, measuring the wait"""
+        connection = database.connection()
+        self.waiters += 1
+        start = time.perf_counter()
+        try:
+            await connection.__aenter__()
+        finally:
+            self.waiters -= 1
+        self.observe((time.perf_counter() - start) * 1000)
+
+        self.active += 1
+        try:
+            yield connection
+        finally:
+            self.active -= 1
+            await connection.__aexit__()
+
+    def observe(self, milliseconds: float) -> None:
+        """Add one acquire latency to the histogram"""
+        self.acquires += 1
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+        for (i, bound) in enumerate(BUCKETS):
+            if milliseconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def stats(self, database: EncodeDatabase) -> Dict:
+        """Snapshot of these statistics and the drivers pool"""
+        # The pool of the asyncpg (postgresql) or aiomysql (mysql) backend, none for sqlite
+        pool = getattr(database._backend, '_pool', None)
+        size = idle = min_size = max_size = None
+        if hasattr(pool, 'get_size'):
+            size, idle = pool.get_size(), pool.get_idle_size()
+            min_size, max_size = pool.get_min_size(), pool.get_max_size()
+        elif hasattr(pool, 'freesize'):
+            size, idle = pool.size, pool.freesize
+            min_size, max_size = pool.minsize, pool.maxsize
+
+        return Dict({
+            'connected': database.is_connected,
+            'size': size,
+            'min_size': min_size,
+            'max_size': max_size,
+            'in_use': size - idle if size is not None else self.active,
+            'idle': idle,
+            'active': self.active,
+            'waiters': self.waiters,
+            'acquires': self.acquires,
+            'latency': {
+                'avg_ms': self.total / self.acquires if self.acquires else 0.0,
+                'max_ms': self.max,
+                'buckets': {
+                    **{'<=' + str(bound) + 'ms': count for (bound, count) in zip(BUCKETS, self.buckets)},
+                    '>' + str(BUCKETS[-1]) + 'ms': self.buckets[-1],
+                },
+            },
+        })
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import operator as operators
 from copy import copy
-from typing import Any, Dict, Generic, List, Tuple, TypeVar, Union
+from typing import Any, AsyncGenerator, Dict, Generic, List, Tuple, TypeVar, Union
 from uvicore.support.hash import sha1
 
 import sqlalchemy as sa
@@ -124,13 +124,29 @@ class DbQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E]):
         else:
             # Execute query
             #dump('DB FROM DB')
-            results = await uvicore.db.fetchall(saquery, connection=self._connection())
+            results = await uvicore.db.fetchall(saquery, connection=self._connection(), primary=query.on_primary)
 
             # Add to cache if desired
             if cache: await uvicore.cache.put(cache.get('key'), results, seconds=cache.get('seconds'))
 
         return results
 
+    async def stream(self, chunk_size: int = 1000) -> AsyncGenerator[RowProxy, None]:
+        """Execute select query and yield each row as it is read from the database cursor
+
+        Unlike get(), the entire result set is never held in memory.  Results
+        are never cached, even if .cache() was used.  chunk_size matches the ORM
+        stream(), where it sizes the chunks *Many relations are queried for.  The
+        DB builder has no relations, so each row is yielded as soon as it is read.
+        """
+
+        # Build select query
+        query, saquery = self._build_query('select', copy(self.query))
+
+        # Yield each row from the database cursor
+        async for row in uvicore.db.iterate(saquery, connection=self._connection(), primary=query.on_primary):
+            yield row
+
     async def delete(self) -> None:
         """Execute delete query"""
 
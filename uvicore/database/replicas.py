@@ -0,0 +1,76 @@
+import time
+from contextvars import ContextVar
+
+from databases import Database as EncodeDatabase
+
+from uvicore.database.pool import PoolStats
+from uvicore.support import module
+from uvicore.typing import Dict, List, Optional, Tuple
+from uvicore.support.dumper import dump, dd
+
+# Time of the last write to each metakey in this context, for read your writes
+_writes: ContextVar[Optional[Dict]] = ContextVar('uvicore.database.writes', default=None)
+
+
+class RoundRobin:
+    """Replica policy choosing each replica in turn"""
+
+    def __init__(self) -> None:
+        self._next = 0
+
+    def choose(self, pools: List[PoolStats]) -> int:
+        index = self._next % len(pools)
+        self._next = index + 1
+        return index
+
+
+class LeastConnections:
+    """Replica policy choosing the replica with the fewest active and waiting queries"""
+
+    def choose(self, pools: List[PoolStats]) -> int:
+        loads = [pool.active + pool.waiters for pool in pools]
+        return loads.index(min(loads))
+
+
+# Built in replica policies by config name
+POLICIES = {
+    'round_robin': RoundRobin,
+    'least_connections': LeastConnections,
+}
+
+
+class Replicas:
+    """Read replicas of one database (metakey)
+
+    Reads are routed to a replica chosen by the policy, a built in policy name
+    (round_robin, least_connections) or the module path of a class with a
+    choose(pools) method returning the index of the replica to use.  Reads of
+    a context that wrote to the primary within the last window seconds stay on
+    the primary, so a request always reads its own writes.
+    """
+
+    def __init__(self, databases: List[EncodeDatabase], policy: str = None, window: float = None) -> None:
+        self.databases = databases
+        self.pools = [PoolStats() for database in databases]
+        policy = policy or 'round_robin'
+        self.policy = POLICIES[policy]() if policy in POLICIES else module.load(policy).object()
+        self.window = window if window is not None else 5
+
+    def choose(self) -> Tuple[EncodeDatabase, PoolStats]:
+        """Choose the replica database (and its pool statistics) for the next read"""
+        index = self.policy.choose(self.pools)
+        return (self.databases[index], self.pools[index])
+
+    def stats(self) -> List[Dict]:
+        """Pool statistics of each replica"""
+        return [pool.stats(database) for (database, pool) in zip(self.databases, self.pools)]
+
+
+def written(metakey: str) -> None:
+    """Remember this context just wrote to the primary of this metakey"""
+    _writes.set({**(_writes.get() or {}), metakey: time.monotonic()})
+
+
+def last_written(metakey: str) -> Optional[float]:
+    """When this context last wrote to the primary of this metakey, if ever"""
+    return (_writes.get() or {}).get(metakey)
@@ -46,6 +46,7 @@ class Database(ServiceProvider, Cli):
                 'seed': 'uvicore.database.commands.db.seed',
                 'reseed': 'uvicore.database.commands.db.reseed',
                 'connections': 'uvicore.database.commands.db.connections',
+                'stats': 'uvicore.database.commands.db.stats',
             }
         )
 
@@ -0,0 +1,102 @@
+from collections import OrderedDict as ODict
+
+from sqlalchemy.engine.interfaces import Compiled, Dialect
+from sqlalchemy.sql import ClauseElement
+
+from uvicore.typing import Any, Dict, Hashable
+from uvicore.support.dumper import dump, dd
+
+
+class StatementCache:
+    """Compiled SQL statement cache of one database (metakey)
+
+    Compiled statements are keyed by dialect and a statement structure key
+    (like an ORM plan key), so a statement of a known structure is compiled once
+    and only re-bound to new values.  Least recently used statements are evicted
+    first.  On asyncpg the identical SQL also re-uses the server side prepared
+    statement of each pooled connection (pool option statement_cache_size).
+    """
+
+    def __init__(self, config: Dict = None) -> None:
+        # Statement cache connection config is optional
+        config = Dict(config or {}).defaults({
+            'enabled': True,
+            'size': 500,
+        })
+        self.enabled: bool = config.enabled
+        self.size: int = config.size
+        self._statements = ODict()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, statement: ClauseElement, dialect: Dialect, key: Hashable) -> Compiled:
+        """Get the compiled statement of this structure and dialect, compiling it on a miss"""
+        key = (dialect.name, dialect.paramstyle, key)
+        compiled = self._statements.get(key)
+        if compiled is None:
+            self.misses += 1
+            compiled = self._statements[key] = statement.compile(dialect=dialect)
+            while len(self._statements) > self.size:
+                self._statements.popitem(last=False)
+            return compiled
+
+        self._statements.move_to_end(key)
+        self.hits += 1
+        return compiled
+
+    def clear(self) -> None:
+        """Remove all compiled statements and reset counters"""
+        self._statements.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict:
+        """Statement cache statistics"""
+        lookups = self.hits + self.misses
+        return Dict({
+            'enabled': self.enabled,
+            'size': self.size,
+            'statements': len(self._statements),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': (self.hits / lookups) if lookups else 0.0,
+        })
+
+
+class Statement:
+    """A SQLAlchemy statement bound to new values, compiled through the statement cache
+
+    Passed to encode/databases in place of the statement itself, which only
+    ever calls .compile(dialect=...) on it.
+    """
+
+    def __init__(self, statement: ClauseElement, values: Dict, key: Hashable, cache: StatementCache) -> None:
+        self.statement = statement
+        self.values = values
+        self.key = key
+        self.cache = cache
+
+    def compile(self, dialect: Dialect = None, **kwargs) -> 'BoundCompiled':
+        return BoundCompiled(self.cache.compile(self.statement, dialect, self.key), self.values)
+
+    def __str__(self) -> str:
+        return str(self.statement)
+
+
+class BoundCompiled:
+    """A cached compiled statement with this statements bind values"""
+
+    def __init__(self, compiled: Compiled, values: Dict) -> None:
+        self._compiled = compiled
+        self._values = values
+
+    @property
+    def params(self) -> Dict:
+        return self.construct_params()
+
+    def construct_params(self, params: Dict = None, **kwargs) -> Dict:
+        return self._compiled.construct_params({**self._values, **(params or {})}, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything else (string, bind processors, result columns...) is the compiled statements
+        return getattr(self._compiled, name)
@@ -0,0 +1,61 @@
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from uvicore.typing import Dict, List
+
+
+def upsert(table: sa.Table, values: List[Dict], dialect: str) -> ClauseElement:
+    """Build a dialect native multi-row INSERT that updates rows whose primary key already exists
+
+    All rows must have the same columns.  Every non primary key column of the
+    row is updated on conflict.
+    """
+    pks = [column.name for column in table.primary_key.columns]
+    columns = [column for column in values[0].keys() if column not in pks]
+
+    if dialect == 'postgresql':
+        # INSERT ... ON CONFLICT (pk) DO UPDATE SET column = excluded.column
+        query = postgresql.insert(table).values(values)
+        if not columns: return query.on_conflict_do_nothing(index_elements=pks)
+        return query.on_conflict_do_update(
+            index_elements=pks,
+            set_={column: getattr(query.excluded, column) for column in columns}
+        )
+
+    elif dialect == 'mysql':
+        # INSERT ... ON DUPLICATE KEY UPDATE column = VALUES(column)
+        query = mysql.insert(table).values(values)
+        if not columns: columns = pks
+        return query.on_duplicate_key_update({column: getattr(query.inserted, column) for column in columns})
+
+    # SQLite INSERT ... ON CONFLICT (pk) DO UPDATE SET column = excluded.column
+    return SqliteUpsert(table.insert().values(values), pks, columns)
+
+
+class SqliteUpsert(Executable, ClauseElement):
+    """SQLite (3.24+) INSERT ... ON CONFLICT DO UPDATE
+
+    SQLAlchemy 1.3 has no SQLite upsert construct, so this wraps a regular
+    insert and appends the ON CONFLICT clause when compiled.
+    """
+
+    # The compiler inspects the compiled statement for RETURNING columns
+    _returning = None
+
+    def __init__(self, insert: sa.sql.Insert, index_elements: List[str], update_columns: List[str]):
+        self.insert = insert
+        self.index_elements = index_elements
+        self.update_columns = update_columns
+
+
+@compiles(SqliteUpsert, 'sqlite')
+def compile_sqlite_upsert(element: SqliteUpsert, compiler, **kwargs) -> str:
+    quote = compiler.preparer.quote
+    sql = compiler.process(element.insert, **kwargs)
+    sql += ' ON CONFLICT (' + ', '.join([quote(column) for column in element.index_elements]) + ')'
+    if not element.update_columns: return sql + ' DO NOTHING'
+    return sql + ' DO UPDATE SET ' + ', '.join([
+        quote(column) + ' = excluded.' + quote(column) for column in element.update_columns
+    ])
@@ -1,3 +1,4 @@
 from .fields import Field, HasOne, HasMany, BelongsTo, BelongsToMany, MorphOne, MorphMany, MorphToMany
 from .metaclass import ModelMetaclass
 from .model import Model
+from .identity import Session, session, current_session
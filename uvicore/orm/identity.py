@@ -0,0 +1,103 @@
+from collections import OrderedDict as ODict
+from contextvars import ContextVar
+
+import uvicore
+from uvicore.typing import Any, Dict, List, Optional
+from uvicore.support.dumper import dump, dd
+
+# The active session of the current request or async with uvicore.orm.session() block
+_session: ContextVar[Optional['Session']] = ContextVar('uvicore.orm.session', default=None)
+
+
+@uvicore.service('uvicore.orm.identity.Session',
+    aliases=['OrmSession', 'orm_session'],
+)
+class Session:
+    """ORM identity map and unit of work
+
+    While a session is active every entity hydrated from the database is
+    deduped by (model, pk), so the same row reached through multiple includes
+    or multiple queries is always the same model instance.  A find(pk) of an
+    entity already loaded is answered from memory.  Models added to the session
+    are saved in batched statements when the session is committed.
+
+    async with uvicore.orm.session() as session:
+        post = await Post.query().find(1)
+        post.title = 'New Title'
+        session.add(post)
+    """
+
+    def __init__(self) -> None:
+        self._identities: Dict = {}
+        self._pending: ODict = ODict()
+        self._tokens: List = []
+
+    def get(self, entity: Any, pk: Any) -> Optional[Any]:
+        """Get the already loaded entity instance of this model and primary key"""
+        return self._identities.get((entity, pk))
+
+    def identify(self, model: Any) -> Any:
+        """Get the already loaded instance of this models identity, or remember this one as the loaded instance"""
+        pk = getattr(model, model.__class__.pk)
+        if pk is None: return model
+        return self._identities.setdefault((model.__class__, pk), model)
+
+    def evict(self, entity: Any) -> None:
+        """Forget all loaded instances of this model, as a bulk update or delete changed rows behind them"""
+        for key in [key for key in self._identities.keys() if key[0] is entity]:
+            del self._identities[key]
+
+    def add(self, *models: Any) -> None:
+        """Add new or changed models to be saved when the session is committed"""
+        if len(models) == 1 and type(models[0]) == list: models = models[0]
+        for model in models:
+            # Keyed by id as models are not hashable, each model is added only once
+            self._pending[id(model)] = model
+
+    async def commit(self) -> None:
+        """Save all pending models, with batched statements per model"""
+        pending = list(self._pending.values())
+        self._pending.clear()
+
+        # Group pending models by their model class, in the order first added
+        entities = ODict()
+        for model in pending:
+            entities.setdefault(model.__class__, []).append(model)
+
+        for (entity, models) in entities.items():
+            await entity.save_many(models)
+            for model in models:
+                self.identify(model)
+
+    def rollback(self) -> None:
+        """Forget all pending models without saving them"""
+        self._pending.clear()
+
+    def clear(self) -> None:
+        """Forget all loaded and pending models"""
+        self._identities.clear()
+        self._pending.clear()
+
+    async def __aenter__(self) -> 'Session':
+        self._tokens.append(_session.set(self))
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            # Commit pending saves unless the block raised an exception
+            if exc_type is None:
+                await self.commit()
+            else:
+                self.rollback()
+        finally:
+            _session.reset(self._tokens.pop())
+
+
+def session() -> Session:
+    """New ORM identity map and unit of work session, used as async with uvicore.orm.session()"""
+    return Session()
+
+
+def current_session() -> Optional[Session]:
+    """The active ORM session of this request or async with block, if any"""
+    return _session.get()
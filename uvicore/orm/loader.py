@@ -0,0 +1,51 @@
+import asyncio
+
+import uvicore
+from uvicore.typing import Any, Dict, List, Tuple
+from uvicore.support.dumper import dump, dd
+
+
+@uvicore.service('uvicore.orm.loader.Loader',
+    aliases=['OrmLoader', 'orm_loader'],
+    singleton=True,
+)
+class Loader:
+    """ORM lazy relation loader
+
+    Relations requested with model.load() during one event loop tick are
+    coalesced (like a DataLoader) into a single Model.load_many() of all
+    requesting models of the same model class and relations.  So
+    asyncio.gather(*[post.load('comments') for post in posts]) runs one
+    query per relation, not one per post.
+    """
+
+    def __init__(self) -> None:
+        # Pending batches by (event loop, entity, relations)
+        self._batches: Dict[Tuple, Tuple[List, asyncio.Future]] = {}
+
+    async def load(self, model: Any, relations: Tuple[str]) -> Any:
+        """Load relations of this model, batched with all other loads of this tick"""
+        loop = asyncio.get_event_loop()
+        key = (loop, model.__class__, relations)
+        batch = self._batches.get(key)
+        if batch is None:
+            # First load of this tick, dispatch the batch once all other
+            # tasks already scheduled for this tick have joined it
+            batch = self._batches[key] = ([], loop.create_future())
+            loop.call_soon(lambda: asyncio.ensure_future(self._dispatch(key)))
+        batch[0].append(model)
+
+        # Shield so a cancelled load does not cancel the batch of all other loads
+        await asyncio.shield(batch[1])
+        return model
+
+    async def _dispatch(self, key: Tuple) -> None:
+        """Load the relations of all models of a batch at once"""
+        (models, future) = self._batches.pop(key)
+        (loop, entity, relations) = key
+        try:
+            await entity.load_many(models, *relations)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
@@ -2,8 +2,8 @@ import uvicore
 import inspect
 from uvicore.support.dumper import dump, dd
 from uvicore.contracts import Mapper as MapperInterface
-from uvicore.support.collection import haskey, getvalue
 from sqlalchemy.engine.result import RowProxy
+from uvicore.typing import Dict
 
 
 @uvicore.service()
@@ -65,16 +65,20 @@ class Mapper(MapperInterface):
             single = True
 
         models = []
+        mappers = {}
         for value in values:
             if type(value) == RowProxy:
-                # Convert SQLAlchemy row to model
-                models.append(self._row_to_model(value))
+                # Convert SQLAlchemy row to model.  Rows of one result set share their
+                # keys, so the row mapper is built once per key set, not once per row
+                keys = tuple(value.keys())
+                if keys not in mappers: mappers[keys] = self.entity.row_mapper(keys, self._prefix())
+                models.append(mappers[keys](value))
 
             elif type(value) == dict:
                 # Convert dict to actual Model instance
                 if perform_mapping:
                     # Values table columns need mapped to model fields
-                    models.append(self._row_to_model(value))
+                    models.append(self._dict_to_model(value))
                 else:
                     # Assume values are already in model fields
                     models.append(self.entity(**value))
@@ -138,44 +142,20 @@ class Mapper(MapperInterface):
         #         columns[field.column] = value
         # return columns
 
-    def _row_to_model(self, row = None):
-        """Convert a single table row (SQLAlchemy RowProxy) or DICT of table into a model instance"""
-        if not row: row = self.args[0]
-        prefix = None
-        if len(self.args) == 2: prefix = self.args[1]
-        fields = {}
-
-        for field in self.instance.__modelfields__.values():
-            if not field.column and not field.evaluate: continue
-
-            # NO, because we added an override of show_writeonly() on query builder
-            # So this is handled in metaclass.py selectable_columns instead
-            # NO if field.write_only: continue
-
-            if field.evaluate:
-                if type(field.evaluate) == dict:
-                    # Evaluate is a Dict with callback and named parameters
-                    eval_method = field.evaluate['method']
-                    del field.evaluate['method']
-                    #dump('tuple here', field.evaluate)
-                    fields[field.name] = eval_method(row, **field.evaluate)
-
-                elif type(field.evaluate) == tuple:
-                    # Evaluate is a Tuple with callback and parameters
-                    eval_method = field.evaluate[0]
-                    fields[field.name] = eval_method(row, *field.evaluate[1:])
+    def _prefix(self):
+        """Relation prefix of the table columns, entity.mapper(rows, prefix)"""
+        if len(self.args) == 2: return self.args[1]
 
-                else:
-                    # Evaluate is a callback
-                    fields[field.name] = field.evaluate(row)
+    def _dict_to_model(self, row: Dict):
+        """Convert a DICT of table columns into a new (validated) model instance
 
-            else:
-                column = field.column
-                if prefix: column = prefix + '__' + column
-                # Use haskey instead of hasattr because data could be an SQLAlchemy row (which is class notation)
-                # or a dictionary.  haskey and getvalue work the same on class models or dictionaries!
-                if haskey(row, column):
-                    fields[field.name] = getvalue(row, column)
+        Dicts are user input, not loaded rows, so they are never marked clean
+        or swapped for an already loaded session instance like the row mapper does.
+        """
+        (columns, evaluators) = self.entity.row_slots(self._prefix())
+        fields = {name: row[column] for (name, column) in columns if column in row}
+        for (name, evaluate) in evaluators:
+            fields[name] = evaluate(row)
         return self.entity(**fields)
 
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, AsyncGenerator, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 import sqlalchemy as sa
 from prettyprinter import pretty_call, register_pretty
@@ -8,6 +8,7 @@ from sqlalchemy.sql import ClauseElement
 
 import uvicore
 from uvicore.orm.fields import Field
+from uvicore.orm.identity import current_session
 from uvicore.support.dumper import dd, dump
 
 # Think of this metaclass as all the STATIC methods similar to @classmethod
@@ -121,13 +122,103 @@ class ModelMetaclass(PydanticMetaclass):
         """Database execute in the context of this entities connection"""
         return await uvicore.db.execute(query=query, values=values, connection=entity.__connection__)
 
-    async def fetchone(entity, query: Union[ClauseElement, str], values: Dict = None) -> Optional[Mapping]:
+    async def insert_returning(entity, values: List[Dict]) -> List:
+        """Database bulk insert returning primary keys in the context of this entities connection"""
+        return await uvicore.db.insert_returning(table=entity.table, values=values, connection=entity.__connection__)
+
+    async def fetchone(entity, query: Union[ClauseElement, str], values: Dict = None, primary: bool = False) -> Optional[Mapping]:
         """Database fetchone in the context of this entities connection"""
-        return await uvicore.db.fetchone(query=query, connection=entity.__connection__)
+        return await uvicore.db.fetchone(query=query, connection=entity.__connection__, primary=primary)
 
-    async def fetchall(entity, query: Union[ClauseElement, str], values: Dict = None) -> List[Mapping]:
+    async def fetchall(entity, query: Union[ClauseElement, str], values: Dict = None, primary: bool = False) -> List[Mapping]:
         """Database fetchall in the context of this entities connection"""
-        return await uvicore.db.fetchall(query=query, connection=entity.__connection__)
+        return await uvicore.db.fetchall(query=query, connection=entity.__connection__, primary=primary)
+
+    async def iterate(entity, query: Union[ClauseElement, str], values: Dict = None, primary: bool = False) -> AsyncGenerator[Mapping, None]:
+        """Database iterate in the context of this entities connection"""
+        async for row in uvicore.db.iterate(query=query, values=values, connection=entity.__connection__, primary=primary):
+            yield row
+
+    def row_slots(entity, prefix: str = None) -> Tuple[List[Tuple], List[Tuple]]:
+        """Get the precompiled (field, column) slots and (field, evaluator) callbacks of this entity and relation prefix
+
+        Compiled once per prefix so converting rows never builds prefixed
+        column names or inspects field types again.
+        """
+        slots = entity.__rowslots__.get(prefix)
+        if slots is not None: return slots
+
+        columns = []
+        evaluators = []
+        for field in entity.modelfields.values():
+            if field.evaluate:
+                evaluate = field.evaluate
+                if type(evaluate) == dict:
+                    # Evaluate is a Dict with callback and named parameters
+                    kwargs = {k: v for (k, v) in evaluate.items() if k != 'method'}
+                    evaluators.append((field.name, lambda row, method=evaluate['method'], kwargs=kwargs: method(row, **kwargs)))
+                elif type(evaluate) == tuple:
+                    # Evaluate is a Tuple with callback and parameters
+                    evaluators.append((field.name, lambda row, method=evaluate[0], args=evaluate[1:]: method(row, *args)))
+                else:
+                    # Evaluate is a callback
+                    evaluators.append((field.name, evaluate))
+            elif field.column:
+                columns.append((field.name, prefix + '__' + field.column if prefix else field.column))
+
+        slots = entity.__rowslots__[prefix] = (columns, evaluators)
+        return slots
+
+    def row_mapper(entity, keys: List[str], prefix: str = None, trusted: bool = False, partial: bool = False) -> Callable:
+        """Build a row to model converter from the precompiled slots for rows containing these keys (columns)
+
+        Trusted rows come from our own database and are constructed without
+        pydantic validation.  Partial rows are from .only() or .defer() queries,
+        their missing fields are set to None and marked as not loaded.
+        """
+        (columns, evaluators) = entity.row_slots(prefix)
+
+        # Fields whose columns were pruned from a partial query are not loaded
+        unloaded = frozenset([name for (name, column) in columns if column not in keys]) if partial else frozenset()
+
+        # Only columns actually found in the rows are mapped.  Every row of
+        # one result set has the same keys, so this is checked just once
+        columns = [(name, column) for (name, column) in columns if column in keys]
+        callbacks = entity.__callbacks__
+
+        # With an active ORM session rows of already loaded entities are the
+        # already loaded instance, found by the rows primary key column
+        session = current_session()
+        pk_column = dict(columns).get(entity.pk) if session else None
+
+        def to_model(row):
+            if pk_column is not None:
+                model = session.get(entity, row[pk_column])
+                if model is not None: return model
+
+            fields = {name: row[column] for (name, column) in columns}
+            for (name, evaluate) in evaluators:
+                fields[name] = evaluate(row)
+            if trusted or unloaded:
+                # Skip validation but still fill in callback properties like Model.__init__
+                # Partial models are never validated as required fields may not be loaded
+                for name in unloaded:
+                    fields[name] = None
+                model = entity.construct(**fields)
+                for (key, callback) in callbacks.items():
+                    setattr(model, key, callback(model))
+                if unloaded: model._unloaded = unloaded
+            else:
+                model = entity(**fields)
+
+            # Loaded from the database, so the model starts clean for dirty tracking
+            model._sync_original()
+
+            # Partial models are never remembered by the session, so a later
+            # full query or find() does not return a partially loaded model
+            if session and not unloaded: return session.identify(model)
+            return model
+        return to_model
 
     # def to_model(entity, row, prefix: str = None) -> Any:
     #     """Convert a row of table data into a model"""
@@ -249,6 +340,7 @@ class ModelMetaclass(PydanticMetaclass):
             '__tableclass__': __tableclass__,
             '__callbacks__': __callbacks__,
             '__modelfields__': __modelfields__,
+            '__rowslots__': {},
             #'__query__': {},
             #'_test1': 'hi',
             **{n: v for n, v in namespace.items()},
@@ -344,6 +436,10 @@ class ModelMetaclass(PydanticMetaclass):
                         callback = getattr(cls, callback)
                     cls.__callbacks__[key] = callback
 
+        # Precompile the row to model slots of the main (non relation) table
+        cls.__rowslots__.clear()
+        cls.row_slots()
+
         #dump(cls.__dict__)
         return cls
 
@@ -0,0 +1,36 @@
+import uvicore
+from uvicore.typing import ASGIApp, Message, Receive, Scope, Send
+from uvicore.orm.identity import Session as OrmSession
+from uvicore.support.dumper import dump, dd
+
+
+@uvicore.service()
+class Session:
+    """ORM identity map and unit of work global middleware, one ORM session per request
+
+    Pending saves added to the session are committed before the final response
+    body is sent, so a failed save is never reported as a success.  Pending
+    saves are discarded if the request raised an exception.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        # __init__ called one time on uvicore HTTP bootstrap
+        # __call__ called on every request
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Middleware only for http and websocket types
+        if scope["type"] not in ["http", "websocket"]:
+            # Next middleware in stack
+            await self.app(scope, receive, send)
+            return
+
+        # Next middleware in stack with this requests ORM session active
+        async with OrmSession() as session:
+            async def send_committed(message: Message) -> None:
+                # Commit pending saves before the last chunk of the response body
+                if message['type'] == 'http.response.body' and not message.get('more_body', False):
+                    await session.commit()
+                await send(message)
+
+            await self.app(scope, receive, send_committed)
@@ -2,14 +2,17 @@ from __future__ import annotations
 import uvicore
 import sqlalchemy as sa
 from uvicore.orm.mapper import Mapper
+from collections import OrderedDict as ODict
+from copy import copy
+from pydantic import PrivateAttr
 from pydantic import main as PydanticMain
 from uvicore.support.dumper import dd, dump
 from uvicore.orm.query import OrmQueryBuilder
 from uvicore.support.classes import hybridmethod
 from uvicore.contracts import Model as ModelInterface
 from uvicore.support.collection import getvalue, setvalue
-from uvicore.typing import Any, Dict, Generic, List, Tuple, TypeVar, Union
-from uvicore.orm.fields import BelongsTo, BelongsToMany, Field, HasMany, HasOne, MorphMany, MorphOne, MorphToMany
+from uvicore.typing import Any, Dict, FrozenSet, Generic, List, Optional, Tuple, TypeVar, Union
+from uvicore.orm.fields import BelongsTo, BelongsToMany, Field, HasMany, HasOne, MorphMany, MorphOne, MorphToMany, Relation
 
 E = TypeVar("E")
 
@@ -46,9 +49,20 @@ PydanticBaseModel = PydanticMain.BaseModel
 #   mapper
 #   create
 #   save
+#   save_many
+#   upsert
 #   delete
+#   load
+#   load_many
+#   is_dirty
+#   get_dirty
+#   get_original
+#   get_count
+#   is_loaded
 #   link
+#   link_many
 #   unlink
+#   unlink_many
 # and other items inside pydantic BaseModel (main.py) that will error itself like:
 #   dict
 #   json
@@ -58,6 +72,16 @@ PydanticBaseModel = PydanticMain.BaseModel
 @uvicore.service()
 class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
 
+    # Snapshot of field values as last loaded from or saved to the database.
+    # None for new models, which are entirely dirty.
+    _original: Optional[Dict] = PrivateAttr(None)
+
+    # Relation record counts from .with_count()
+    _counts: Optional[Dict] = PrivateAttr(None)
+
+    # Fields not loaded by an .only() or .defer() query (partial models)
+    _unloaded: FrozenSet[str] = PrivateAttr(frozenset())
+
     def __init__(self, **data: Any) -> None:
         # Call pydantic parent
         super().__init__(**data)
@@ -87,11 +111,11 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
     async def insert(entity, models: Union[E, Dict, List[E], List[Dict]]) -> Any:
         """Insert one or more entities as List of entities or List of Dictionaries
 
-        This bulk insert does NOT allow inserting child relations at the
-        same time as there is no way to get each parents PK out to
-        reference with each child in BULK. If you want to insert parent
-        and relations at the same time use the slower non-bulk
-        insert_with_relations() instead.
+        A List is bulk inserted using multi-row INSERT statements (or PostgreSQL
+        COPY if every PK is set) and returns the List of new PKs, which are also
+        set on each model instance.  This
+        bulk insert does NOT insert child relations.  If you want to insert
+        parent and relations at the same time use insert_with_relations() instead.
         """
 
         # Convert any type of dict or list to an actual Model or List[Model]
@@ -118,8 +142,14 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
 
         result = None
         if type(bulk) == list:
-            # List, so bulk insert
-            result = await entity.execute(query, bulk)
+            # List, so bulk insert returning each new PK
+            result = await entity.insert_returning(bulk)
+
+            # Only set the new PK back to the model if the models PK is null
+            # If not null, means its probably a string based pre-inserted PK like a 'key' field
+            for (model, pk_value) in zip(models, result):
+                if getattr(model, entity.pk) is None:
+                    setattr(model, entity.pk, pk_value)
         else:
             # Single, so single insert, returning PK or silently passing if error
             # WHY? Was I silently passing?
@@ -141,126 +171,116 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
         return result
 
     @classmethod
-    async def insert_with_relations(entity, models: List[Dict], *, parent_pk = None, skip_save: bool = False) -> None:
+    async def insert_with_relations(entity, models: List[Dict], *, parent_pk = None, skip_save: bool = False) -> List:
         """Insert one or more entities as List of Dict that DO have relations included
 
-        Because relations are included, this insert is NOT bulk and must
-        loop each row, insert the parent, get the PK, then insert each
-        children (or children first then parent depending on BelongsTo vs
-        HasOne or HasMany)
+        Each level of the relation tree is inserted as one bulk insert per
+        table.  All BelongsTo children are inserted first, then all parents
+        (getting back each new PK), then all HasOne/HasMany/Morph children of
+        all parents at once.  Returns the List of PKs of the inserted models.
+        The whole relation tree is inserted in one transaction.
         """
-
-        # Note about bulk insert with nested relations Dictionary
-        # Bulk insert does not give back the primary keys for each inserted record
-        # So I have no way to know the PK of the parent when I insert the child relations
-        # So the only way to possibly insert parent and child is to do one at a time
-        # which is not bulk and will be slower.  If I wanted to do this I could pull
-        # out all models that HAVE a relation and set those asside.  All that do NOT
-        # have a relation I could bulk insert, then after insert one those that do have a
-        # relation one at a time.  The problem with this is they won't be inserted in the
-        # order you wanted.  Only way to preserve order is to check if ANY models have
-        # a relation, if so, loop and insert one at a time, no bulk period.
-        # SQLAlchemy does have a bulk_save_objects that does return the PKs but
-        # encode/databases does not impliment this.  Instead their insert_many
-        # uses a cursor where each row is added as a query, then the cursor is committed.
-        # This is bulk insert, but no way to retrieve each PK from it.
+        if not uvicore.db.in_transaction(entity.connection):
+            async with uvicore.db.transaction(entity.connection):
+                return await entity.insert_with_relations(models, parent_pk=parent_pk, skip_save=skip_save)
 
         # Ensure models is a list
         if type(models) != list: models = [models]
 
-        for model in models:
-
-            # Skip empty models (None or [])
-            if not model: continue
+        # Skip empty models (None or [])
+        # If model is not a dict, its probably a real pydantic model instance, convert it to a dict
+        models = [model if type(model) == dict else model.dict() for model in models if model]
+        if not models: return []
 
-            # If model is not a dict, its probably a real pydantic model instance, convert it to a dict
-            if type(model) != dict: model = model.dict()
-
-            # Check each field for relations and rename them before inserting parent
-            relations = {}
-            skip_children = False
-            for (fieldname, value) in model.items():
+        # Check each field for relations and pull them out of each parent model
+        # as they cannot be inserted.  Relations are kept by fieldname so each
+        # relation can be inserted for all parents at once.
+        relations = {}
+        children = []
+        for model in models:
+            model_children = {}
+            for fieldname in [x for x in model.keys()]:
                 field = entity.modelfields.get(fieldname)  # Using direct dictionary to skip bad values in dict
                 if not field: continue
                 if not field.relation: continue
-                relation = field.relation.fill(field)
-
-                # Cannot change a dict in place or you get error
-                # RuntimeError: dictionary keys changed during iteration
-                # Se we'll add to a list and delete it outside the loop
-                relations[fieldname] = {
-                    'relation': relation,
-                    'data': value
-                }
-
-            # Delete relations from parent model as they cannot be inserted
-            for relation in relations.keys():
-                del model[relation]
-
-            # BelongTo relations are the inverse of HasOne or HasMany in that
-            # the child has to be created BEFORE the parent
-            for relation in relations.values():
-                data = relation['data']
-                relation = relation['relation']
-
-                if type(relation) == BelongsTo:
-                    # Because we insert the children first, skip inserting
-                    # children later down the method
-                    skip_children = True
-
-                    # Ignore empty relation (None or []), AFTER skip_children is set
-                    if not data: continue
-
-                    # Check if one ONE relation is already a fully inserted object (presense of pk)
-                    # If NOT, it needs to be inserted, if so, just grab its existing PK as the child_pk
-                    if getvalue(data, relation.foreign_key):
-                        # Already inserted realtion, use its existing PK
-                        child_pk = getvalue(data, relation.foreign_key)
-                    else:
-                        # Recursively insert child and get PK
-                        child_pk = await relation.entity.insert_with_relations([data])
-
-                    # Replace parent foreignKey with child_pk
-                    model[relation.local_key] = child_pk
-
-            # Convert model Dict into actual Model instance
-            model_instance = entity.mapper(model).model(perform_mapping=False)
-
-            # Insert the parent model and retrieve parents new PK value
-            # Unless we are told to skip, as is the case with ManyToMany where we
-            # use .create() instead of .save()
-            if not skip_save:
-                model_instance = await model_instance.save()
-                parent_pk = getattr(model_instance, entity.pk)
-
-            # Now insert each child relation
-            for relation in relations.values():
-                data = relation['data']
-                relation = relation['relation']
+                if fieldname not in relations: relations[fieldname] = field.relation.fill(field)
+
+                # Cannot change a dict while iterating, so iterate a copy of its keys
+                model_children[fieldname] = model.pop(fieldname)
+            children.append(model_children)
+
+        # BelongTo relations are the inverse of HasOne or HasMany in that
+        # the child has to be created BEFORE the parent
+        for (fieldname, relation) in relations.items():
+            if type(relation) != BelongsTo: continue
+
+            # Check if ONE relation is already a fully inserted object (presense of pk)
+            # If NOT, it needs to be inserted, if so, just grab its existing PK as the child_pk
+            pending = []
+            for (model, model_children) in zip(models, children):
+                data = model_children.get(fieldname)
 
                 # Ignore empty relation (None or [])
                 if not data: continue
 
-                childmodels = data
-                if type(childmodels) != list: childmodels = [childmodels]
+                if getvalue(data, relation.foreign_key):
+                    # Already inserted realtion, use its existing PK
+                    model[relation.local_key] = getvalue(data, relation.foreign_key)
+                else:
+                    pending.append((model, data))
+
+            # Bulk insert all children (recursively) and replace each parent foreignKey with its child_pk
+            child_pks = await relation.entity.insert_with_relations([data for (model, data) in pending])
+            for ((model, data), child_pk) in zip(pending, child_pks):
+                model[relation.local_key] = child_pk
+
+        # Convert model Dicts into actual Model instances
+        model_instances = entity.mapper(models).model(perform_mapping=False)
+
+        # Insert the parent models and retrieve each parents new PK value
+        # Unless we are told to skip, as is the case with ManyToMany where we
+        # use .create() instead of .save()
+        if skip_save:
+            parent_pks = [parent_pk for model in model_instances]
+        else:
+            # Models with a PK may already exist, let .save() insert or update them
+            new_instances = []
+            for model_instance in model_instances:
+                if getattr(model_instance, entity.pk) is None:
+                    new_instances.append(model_instance)
+                else:
+                    await model_instance.save()
+
+            # Bulk insert all new models, which sets each new PK on the model instance
+            if new_instances: await entity.insert(new_instances)
+            parent_pks = [getattr(model_instance, entity.pk) for model_instance in model_instances]
+
+        # Now insert each child relation for all parents at once
+        for (fieldname, relation) in relations.items():
+            if type(relation) == BelongsTo: continue
+
+            # All children of all parents for this relation
+            childmodels = []
+            for (model_instance, model_children, pk_value) in zip(model_instances, children, parent_pks):
+                data = model_children.get(fieldname)
 
-                # Insert BelongsTo (which is the only one that obeys skip_children)
-                if type(relation) == BelongsTo and not skip_children:
-                    await relation.entity.insert_with_relations(childmodels)
+                # Ignore empty relation (None or [])
+                if not data: continue
+                if type(data) != list: data = [data]
 
                 # Insert HasMany or HasOne (which are basically the same)
-                elif type(relation) == HasOne or type(relation) == HasMany:
+                if type(relation) == HasOne or type(relation) == HasMany:
                     # Replace child foreignKey with parent_pk
-                    for childmodel in childmodels:
-                        childmodel[relation.foreign_key] = parent_pk
-                    await relation.entity.insert_with_relations(childmodels)
+                    for childmodel in data:
+                        childmodel[relation.foreign_key] = pk_value
+                    childmodels.extend(data)
 
                 # Insert Polymorphic OneToOne
                 elif type(relation) == MorphOne or type(relation) == MorphMany:
-                    for childmodel in childmodels:
+                    for childmodel in data:
                         childmodel[relation.foreign_type] = entity.tablename
-                        childmodel[relation.foreign_key] = parent_pk
-                    await relation.entity.insert_with_relations(childmodels)
+                        childmodel[relation.foreign_key] = pk_value
+                    childmodels.extend(data)
 
                 # Insert ManyToMany or Polymorphic MorphToMany
                 elif type(relation) == BelongsToMany or type(relation) == MorphToMany:
@@ -275,12 +295,173 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
 
                     # Now insert any children using this parents PK, so not let it .save() so we
                     # can instead use the .create() for proper linkage
-                    await relation.entity.insert_with_relations(childmodels, skip_save=True, parent_pk=poly_parent_pk)
+                    await relation.entity.insert_with_relations(data, skip_save=True, parent_pk=poly_parent_pk)
+
+            # Bulk insert all children of all parents
+            if childmodels:
+                await relation.entity.insert_with_relations(childmodels)
+
+        # Return the PK of each inserted model
+        return parent_pks
+
+    @classmethod
+    async def upsert(entity, models: Union[E, Dict, List[E], List[Dict]]) -> None:
+        """Insert or update one or more entities as List of entities or List of Dictionaries
 
-        # Return parent_pk for recursion only
-        # This method not meant to return anything valuable to the user, which
-        # is why the method itself is -> None
-        return parent_pk
+        Uses the databases native upsert (ON CONFLICT / ON DUPLICATE KEY) to
+        insert or update whole batches without first selecting each record.  As
+        it is not known if each record is inserted or updated only the save
+        hooks are fired.  This bulk upsert does NOT upsert child relations.
+
+        Upserted models are clean (not dirty) afterwards.  The primary key of
+        new models upserted without one is NOT set, as not every database
+        returns the generated keys of an upsert.  Use insert() for those.
+        """
+
+        # Convert any type of dict or list to an actual List[Model]
+        models = entity.mapper(models).model(perform_mapping=False)
+        if type(models) != list: models = [models]
+
+        # Loop each model and call the before_save hook
+        for model in models:
+            await model._before_save()
+
+        # Convert List[Model] into List of mapped table columns ready for upsert
+        # only after hooks are fired as they may alter the data.  The table mapper
+        # skips read_only fields, but the PK is the upserts conflict target.
+        bulk = entity.mapper(models).table()
+        pk_column = entity.mapper(entity.pk).column()
+        write_only = [field for field in entity.modelfields.values() if field.column and field.write_only]
+        for (model, row) in zip(models, bulk):
+            row[pk_column] = getattr(model, entity.pk)
+
+            # Write only fields are None when loaded without show_writeonly(), so only
+            # upsert them if changed since loaded (or on new models), never overwriting
+            # the stored value (a password...) with NULL.  Db.upsert batches by columns.
+            if model._original is not None:
+                dirty = model.get_dirty()
+                for field in write_only:
+                    if field.name not in dirty: row.pop(field.column, None)
+        await uvicore.db.upsert(entity.table, bulk, connection=entity.connection)
+
+        # Loop each model, now matching its record, and call the after_save hook
+        for model in models:
+            model._sync_original()
+            await model._after_save()
+
+    @classmethod
+    async def load_many(entity, models: List[E], *relations: str) -> List[E]:
+        """Load (lazy) relations of many already loaded entities at once
+
+        Uses the same queries as .include() for all models at once, so each
+        relation is one query no matter how many models.  Nested relations
+        in dot notation are also loaded.  Model.load_many(posts, 'comments.creator')
+        """
+        if len(relations) == 1 and type(relations[0]) == list: relations = relations[0]
+        models = [model for model in models if model is not None]
+        if not models or not relations: return models
+
+        # Only actual relation fields can be loaded (the first part of dot notation)
+        fieldnames = []
+        for relation in relations:
+            fieldname = relation.split('.')[0]
+            if not entity.modelfield(fieldname).relation:
+                raise Exception('Field {} is not a relation of model {}'.format(fieldname, entity.modelfqn))
+            if fieldname not in fieldnames: fieldnames.append(fieldname)
+
+        # Query these entities again by PK with the relations included.  Very large
+        # lists are split as databases limit the number of bound parameters
+        pks = list(dict.fromkeys([getattr(model, entity.pk) for model in models]))
+        size = uvicore.db.in_chunk_size()
+        loaded = {}
+        for i in range(0, len(pks), size):
+            results = await entity.query().include(*relations).where(entity.pk, 'in', pks[i:i + size]).get()
+            for result in results:
+                loaded[getattr(result, entity.pk)] = result
+
+        # Copy the loaded relations into each model (unless the ORM session
+        # already returned the very same model instance)
+        for model in models:
+            result = loaded.get(getattr(model, entity.pk))
+            if result is None or result is model: continue
+            for fieldname in fieldnames:
+                setattr(model, fieldname, getattr(result, fieldname))
+        return models
+
+    async def load(self, *relations: str) -> Model:
+        """Load (lazy) relations of this model
+
+        All .load() of the same model class and relations in the same event loop
+        tick are batched into one Model.load_many().  await post.load('comments')
+        """
+        if len(relations) == 1 and type(relations[0]) == list: relations = relations[0]
+        loader = uvicore.ioc.make('uvicore.orm.loader.Loader')
+        return await loader.load(self, tuple(relations))
+
+    @classmethod
+    async def save_many(entity, models: Union[List[E], List[Dict]]) -> None:
+        """Save (insert or update) many entities with batched statements
+
+        Which models already exist is checked with one query.  New models are
+        bulk inserted.  Existing models are updated with only their changed
+        columns, in one UPDATE ... SET column = CASE pk ... END statement for each
+        set of changed columns.  All statements run in one transaction.
+        """
+        if not uvicore.db.in_transaction(entity.connection):
+            async with uvicore.db.transaction(entity.connection):
+                return await entity.save_many(models)
+        models = entity.mapper(models).model(perform_mapping=False)
+        if type(models) != list: models = [models]
+        if not models: return
+
+        # Models with a PK may already exist, check them all at once.  Very large
+        # lists are split as databases limit the number of bound parameters
+        table = entity.table
+        pk_column = getattr(table.c, entity.mapper(entity.pk).column())
+        pks = [getattr(model, entity.pk) for model in models if getattr(model, entity.pk) is not None]
+        size = uvicore.db.in_chunk_size()
+        existing = set()
+        for i in range(0, len(pks), size):
+            query = sa.select([pk_column]).select_from(table).where(pk_column.in_(pks[i:i + size]))
+            existing.update([row[0] for row in await entity.fetchall(query, primary=True)])
+
+        # Bulk insert all new models, which sets each new PK on the model instance
+        new_models = [model for model in models if getattr(model, entity.pk) not in existing]
+        if new_models:
+            await entity.insert(new_models)
+            for model in new_models:
+                model._sync_original()
+
+        # Group existing models by their changed columns (only after hooks are fired
+        # as they may alter the data) so each group is a single UPDATE statement
+        updates = ODict()
+        for model in [model for model in models if getattr(model, entity.pk) in existing]:
+            await model._before_save()
+            values = {entity.modelfields[name].column: value for (name, value) in model.get_dirty().items()}
+            updates.setdefault(tuple(values.keys()), []).append((model, values))
+
+        for (columns, group) in updates.items():
+            # Nothing changed since loaded or last saved, skip the UPDATE entirely
+            # Otherwise each statement binds 2 parameters per column and 1 for the IN per model
+            size = max(1, uvicore.db.max_params(entity.connection) // (len(columns) * 2 + 1))
+            for i in range(0, len(group) if columns else 0, size):
+                chunk = [(getattr(model, entity.pk), values) for (model, values) in group[i:i + size]]
+
+                # The ELSE column keeps the CASE typed as the column for all databases
+                query = (table.update()
+                    .where(pk_column.in_([pk for (pk, values) in chunk]))
+                    .values({
+                        column: sa.case(
+                            [(pk_column == pk, sa.literal(values[column], table.c[column].type)) for (pk, values) in chunk],
+                            else_=table.c[column]
+                        )
+                        for column in columns
+                    })
+                )
+                await entity.execute(query)
+            for (model, values) in group:
+                await model._after_save()
+                model._sync_original()
 
     @hybridmethod
     def mapper(self_or_entity, *args) -> Mapper:
@@ -330,19 +511,17 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
             # Bulk insert new values with proper keys
             await relation.entity.insert(models)
 
-        # Cannot assume a record has been created or linked, so loop each and test
-        # Because of this, we cannot bulk insert
+        # Models with a PK already exist and are only linked.  All others
+        # are bulk inserted first, then all are linked in the pivot table
         elif type(relation) == BelongsToMany or type(relation) == MorphToMany:
-            for model in models:
-                # If its PK is set, it already exists
-                pk_value = None
-                create = getvalue(model, relation.entity.pk) == None
-                if create:
-                    pk_value = await relation.entity.insert(model)
+            new_models = [model for model in models if getvalue(model, relation.entity.pk) == None]
+            if new_models:
+                pk_values = await relation.entity.insert(new_models)
+                for (model, pk_value) in zip(new_models, pk_values):
                     setvalue(model, relation.entity.pk, pk_value)
 
-                # Link in pivot table
-                await self.link(relation_name, model)
+            # Link in pivot table
+            await entity.link_many([self], relation_name, models)
 
         else:
             raise Exception('Creating children does not work for this type of relation.')
@@ -369,12 +548,23 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
             await self.delete(relation_name)
         await self.create(relation_name, models)
 
-    async def save(self) -> Model:
-        """Save this model to the database (insert or update)"""
+    async def save(self, upsert: bool = False) -> Model:
+        """Save this model to the database (insert or update)
+
+        With upsert=True an existing primary key is saved with the databases
+        native upsert (ON CONFLICT / ON DUPLICATE KEY) in one statement instead
+        of first selecting the record.  Only the save hooks are fired.
+        """
 
         # Get the entity of this model instance (which is the metaclass, aka self.__class__)
         entity = self.__class__
 
+        # Upsert records that have a primary key without checking if they exist
+        # Partial models are loaded so they exist, and an upsert would overwrite their unloaded fields
+        if upsert and getattr(self, entity.pk) is not None and not self._unloaded:
+            await entity.upsert(self)
+            return self
+
         # Hum, think about this.  Probably a BAD idea.  Imagine you already have a record
         # and they change around relations, then type .save() would they expect ALL relations
         # to insert/delete/update properly?  I think not.  This .save() shouldn't work on relations
@@ -405,12 +595,14 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
             # Record exists, perform update
             await self._before_save()
 
-            # Convert self model instance into Dict of mapped table columns, only after hooks are fired
+            # Convert only the changed fields into Dict of mapped table columns
             # only after hooks are fired as they may alter the data
-            values = self.mapper().table()
+            values = {entity.modelfields[name].column: value for (name, value) in self.get_dirty().items()}
 
-            query = table.update().where(getattr(table.c, entity.pk) == getattr(self, entity.pk)).values(**values)
-            await entity.execute(query)
+            # Nothing changed since loaded or last saved, skip the UPDATE entirely
+            if values:
+                query = table.update().where(getattr(table.c, entity.pk) == getattr(self, entity.pk)).values(**values)
+                await entity.execute(query)
             await self._after_save()
         else:
             # New record, perform insert
@@ -432,6 +624,9 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
             await self._after_insert()
             await self._after_save()
 
+        # Model is now clean, future saves only update what changes from here
+        self._sync_original()
+
         # This is a TRY version if if exists, not sure which is more efficient, a select first, or an insert attempt/failure
         # try:
         #     # Try insert first
@@ -450,6 +645,58 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
         # Return model with new PK value
         return self
 
+    def is_dirty(self, *fields: str) -> bool:
+        """Check if any (or any of these) fields changed since loaded or last saved"""
+        dirty = self.get_dirty()
+        if not fields: return bool(dirty)
+        return any(field in dirty for field in fields)
+
+    def get_dirty(self) -> Dict:
+        """Get Dict of fields (and their new values) changed since loaded or last saved
+
+        Only writable table columns are tracked.  New models that were never
+        loaded or saved are entirely dirty.
+        """
+        entity = self.__class__
+        original = self._original
+        dirty = {}
+        for (name, value) in self.__dict__.items():
+            field = entity.modelfields.get(name)
+            if not field or not field.column or field.read_only: continue
+            if original is None or name not in original or original[name] != value:
+                dirty[name] = value
+        return dirty
+
+    def get_original(self, field: str = None) -> Any:
+        """Get the original value of a field (or Dict of all fields) as loaded or last saved"""
+        original = self._original or {}
+        if field is None: return Dict(original)
+        return original.get(field)
+
+    def is_loaded(self, *fields: str) -> bool:
+        """Check if all (or all of these) fields were loaded, False for fields pruned by .only() or .defer()"""
+        if not fields: return not self._unloaded
+        return not any(field in self._unloaded for field in fields)
+
+    def get_count(self, relation_name: str) -> Optional[int]:
+        """Get the record count of a relation queried with .with_count(), None if not counted"""
+        return (self._counts or {}).get(relation_name)
+
+    def _set_counts(self, counts: Dict) -> None:
+        """Set relation record counts, also into any {relation}_count field of this model"""
+        self._counts = {**(self._counts or {}), **counts}
+        for (name, count) in counts.items():
+            if name + '_count' in self.__class__.modelfields:
+                setattr(self, name + '_count', count)
+
+    def _sync_original(self) -> None:
+        """Snapshot current field values as the clean original values"""
+        # Mutable values are copied so in place changes are still detected
+        self._original = {
+            name: copy(value) if type(value) in (dict, list) else value
+            for (name, value) in self.__dict__.items()
+        }
+
     async def delete(self, relation_name: str = None) -> None:
         """Delete this model from the database"""
 
@@ -507,148 +754,129 @@ class Model(Generic[E], PydanticBaseModel, ModelInterface[E]):
             await entity.execute(query)
             await self._after_delete()
 
-    async def link(self, relation_name: str, models: Union[Any, List[Any]]) -> None:
-        """Link records to relation using the Many-To-Many pivot table"""
+    @classmethod
+    async def link_many(entity, parents: List[Any], relation_name: str, models: Union[Any, List[Any]], *, sync: bool = False) -> None:
+        """Link records to many parents at once using the Many-To-Many pivot table
+
+        The current pivot rows of all parents are read in one query and only the
+        missing links are inserted with multi-row INSERTs.  With sync=True any
+        other records linked to these parents are also unlinked with one DELETE.
+        All statements run in one transaction.
+        Post.link_many(posts, 'tags', tags)
+        """
+        if not uvicore.db.in_transaction(entity.connection):
+            async with uvicore.db.transaction(entity.connection):
+                return await entity.link_many(parents, relation_name, models, sync=sync)
 
         # NOTICE hooks:  We do NOT actually need to fire hooks on relation tables!
         # Because there are no relation table models to listen for those hooks!
 
-        # NOTICE models:  Models can be single model, single dict, List[Model], List[Dict]
+        # NOTICE models:  Parents and models can be single model, single dict, List[Model], List[Dict]
         # and I do NOT have to convert them to actual models.  Because I am using my custom getvalue
         # the pk is pulled regardless of model or dict!
 
-        # Ignore empty models (None or [])
-        if not models: return
-
-        # Get the entity of this model instance (which is the metaclass, aka self.__class__)
-        entity = self.__class__
+        # Ensure parents and models are always a list
+        if not parents: return
+        if type(parents) != list: parents = [parents]
+        if models is None: models = []
+        if type(models) != list: models = [models]
 
         # Get field and relation info
         field = entity.modelfield(relation_name)
         relation = field.relation.fill(field)
-
-        # Ensure models are always a list
-        if type(models) != list: models = [models]
-
-        # Insert linkage data one link at a time so we can gracefully skip duplicates
-        if type(relation) == BelongsToMany:
-            for model in models:
-                # Set pivot relation data
-                left_key_value = getvalue(self, entity.pk)
-                right_key_value = getvalue(model, relation.entity.pk)
-                pivot = {
-                    relation.left_key: left_key_value,
-                    relation.right_key: right_key_value
-                }
-
-                # Check if exists.
-                # The encode/databases layer does NOT abstract each backend DB libraries exceptions
-                # into a common interface so You cannot catch generic IntegrityError.  So instead of a
-                # try catch, I will see if the record exists manually first :( - See https://github.com/encode/databases/issues/162
-                table = relation.join_table
-                query = (
-                    sa.select([getattr(table.c, relation.left_key)]).select_from(table)
-                    .where(getattr(table.c, relation.left_key) == left_key_value)
-                    .where(getattr(table.c, relation.right_key) == right_key_value)
-                )
-                exists = await entity.fetchone(query)  # Returns None if not exists
-
-                if not exists:
-                    query = relation.join_table.insert().values(**pivot)
-                    await entity.execute(query)  # No hooks needed, relation table are NOT models, no listeners
-
-                # # Try insert, fail silently if exists
-                # try:
-                #     query = relation.join_table.insert().values(**pivot)
-                #     await entity.execute(query)
-                # except:
-                #     # Ignore Integrity Errors
-                #     pass
-
-        elif type(relation) == MorphToMany:
-            for model in models:
-                # Set polymorphic pivor relation data
-                left_type_value = entity.tablename
-                left_key_value = getvalue(self, entity.pk)
-                right_key_value = getvalue(model, relation.entity.pk)
-                pivot = {
-                    relation.left_type: left_type_value,
-                    relation.left_key: left_key_value,
-                    relation.right_key: right_key_value
-                }
-
-                # Check if exists.
-                # The encode/databases layer does NOT abstract each backend DB libraries exceptions
-                # into a common interface so You cannot catch generic IntegrityError.  So instead of a
-                # try catch, I will see if the record exists manually first :( - See https://github.com/encode/databases/issues/162
-                table = relation.join_table
-                query = (
-                    sa.select([getattr(table.c, relation.left_type)]).select_from(table)
-                    .where(getattr(table.c, relation.left_type) == left_type_value)
-                    .where(getattr(table.c, relation.left_key) == left_key_value)
-                    .where(getattr(table.c, relation.right_key) == right_key_value)
-                )
-                exists = await entity.fetchone(query)  # Returns None if not exists
-
-                if not exists:
-                    query = relation.join_table.insert().values(**pivot)
-                    await entity.execute(query)  # No hooks needed, relation table are NOT models, no listeners
-
-
-                # Try insert, fail silently if exists
-                # try:
-                #     query = relation.join_table.insert().values(**pivot)
-                #     await entity.execute(query)
-                # except pymysql.err.IntegrityError:
-                #     # Ignore Integrity Errors
-                #     pass
-
-        else:
+        if type(relation) != BelongsToMany and type(relation) != MorphToMany:
             # Linking only works for Many-To-Many relations
             raise Exception('Linking is for Many-To-Many relations only.')
 
-    async def unlink(self, relation_name: str, models: Union[Any, List[Any]] = None) -> None:
-        """Unlink records to relation using the Many-To-Many pivot table"""
+        left_ids = list(dict.fromkeys([getvalue(parent, entity.pk) for parent in parents]))
+        right_ids = list(dict.fromkeys([getvalue(model, relation.entity.pk) for model in models]))
+
+        # Sync unlinks everything else, in the same DELETE an unlink() would use
+        if sync:
+            await entity._unlink_many(relation, left_ids, right_ids, exclude=True)
+        if not right_ids: return
+
+        # Get the existing links of all parents.  Very large parent lists are
+        # split into multiple WHERE IN queries as databases limit the number
+        # of bound parameters per statement
+        table = relation.join_table
+        left_key = getattr(table.c, relation.left_key)
+        right_key = getattr(table.c, relation.right_key)
+        size = uvicore.db.in_chunk_size()
+        existing = set()
+        for i in range(0, len(left_ids), size):
+            query = sa.select([left_key, right_key]).select_from(table).where(left_key.in_(left_ids[i:i + size]))
+            if type(relation) == MorphToMany:
+                query = query.where(getattr(table.c, relation.left_type) == entity.tablename)
+            for row in await entity.fetchall(query, primary=True):
+                existing.add((row[relation.left_key], row[relation.right_key]))
+
+        # Bulk insert only the missing links
+        pivots = []
+        for left_id in left_ids:
+            for right_id in right_ids:
+                if (left_id, right_id) in existing: continue
+                pivot = {relation.left_key: left_id, relation.right_key: right_id}
+                if type(relation) == MorphToMany:
+                    # Set polymorphic pivot relation type
+                    pivot[relation.left_type] = entity.tablename
+                pivots.append(pivot)
+        if pivots:
+            await uvicore.db.insert_many(table, pivots, connection=entity.connection)  # No hooks needed, relation table are NOT models, no listeners
 
-        # NOTICE hooks:  We do NOT actuall need to fire hooks on relation tables!
-        # Because there are no relation table models to listen for those hooks!
+    @classmethod
+    async def unlink_many(entity, parents: List[Any], relation_name: str, models: Union[Any, List[Any]] = None) -> None:
+        """Unlink records (or all records) from many parents at once using the Many-To-Many pivot table"""
 
-        # Get the entity of this model instance (which is the metaclass, aka self.__class__)
-        entity = self.__class__
+        # Ensure parents is always a list
+        if not parents: return
+        if type(parents) != list: parents = [parents]
 
         # Get field and relation info
         field = entity.modelfield(relation_name)
         relation = field.relation.fill(field)
+        if type(relation) != BelongsToMany and type(relation) != MorphToMany:
+            raise Exception('Uninking is for Many-To-Many relations only.')
 
-        # Ensure model is a list
-        ids = []
+        left_ids = list(dict.fromkeys([getvalue(parent, entity.pk) for parent in parents]))
+        right_ids = None
         if models is not None:
             if type(models) != list: models = [models]
-            ids = [getvalue(x, relation.entity.pk) for x in models]
+            right_ids = [getvalue(model, relation.entity.pk) for model in models]
+        await entity._unlink_many(relation, left_ids, right_ids)
 
-        if type(relation) == BelongsToMany:
-            # Get table and start where on self ID
-            table = relation.join_table
-            query = table.delete().where(getattr(table.c, relation.left_key) == getattr(self, entity.pk))
-            if models is not None:
+    @classmethod
+    async def _unlink_many(entity, relation: Relation, left_ids: List, right_ids: Optional[List], exclude: bool = False) -> None:
+        """Delete pivot rows of these parents, only those with (or without if exclude) these right_ids"""
+
+        # Unlinking an empty list of models unlinks nothing
+        if right_ids is not None and not right_ids and not exclude: return
+
+        table = relation.join_table
+        left_key = getattr(table.c, relation.left_key)
+        right_key = getattr(table.c, relation.right_key)
+        size = uvicore.db.in_chunk_size()
+        for i in range(0, len(left_ids), size):
+            query = table.delete().where(left_key.in_(left_ids[i:i + size]))
+            if type(relation) == MorphToMany:
+                query = query.where(getattr(table.c, relation.left_type) == entity.tablename)
+            if right_ids and exclude:
+                query = query.where(sa.not_(right_key.in_(right_ids)))
+            elif right_ids:
                 # Add in proper relation Ids
-                query = query.where(getattr(table.c, relation.right_key).in_(ids))
+                query = query.where(right_key.in_(right_ids))
             await entity.execute(query)  # No hooks needed, relation table are NOT models, no listeners
 
-        elif type(relation) == MorphToMany:
-            # Get table and start where on self ID
-            table = relation.join_table
-            query = (
-                table.delete()
-                .where(getattr(table.c, relation.left_type) == entity.tablename)
-                .where(getattr(table.c, relation.left_key) == getvalue(self, entity.pk))
-            )
-            if models is not None:
-                # Add in proper relation Ids
-                query = query.where(getattr(table.c, relation.right_key).in_(ids))
-            await entity.execute(query)  # No hooks needed, relation table are NOT models, no listeners
-        else:
-            raise Exception('Uninking is for Many-To-Many relations only.')
+    async def link(self, relation_name: str, models: Union[Any, List[Any]]) -> None:
+        """Link records to relation using the Many-To-Many pivot table"""
+
+        # Ignore empty models (None or [])
+        if not models: return
+        await self.__class__.link_many([self], relation_name, models)
+
+    async def unlink(self, relation_name: str, models: Union[Any, List[Any]] = None) -> None:
+        """Unlink records to relation using the Many-To-Many pivot table"""
+        await self.__class__.unlink_many([self], relation_name, models)
 
     async def _before_insert(self) -> None:
         """Hook fired before record is inserted (new records only)"""
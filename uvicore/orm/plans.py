@@ -0,0 +1,84 @@
+from collections import OrderedDict as ODict
+
+import uvicore
+from uvicore.typing import Any, Dict, List, Optional, Tuple
+from uvicore.support.dumper import dump, dd
+
+
+@uvicore.service('uvicore.orm.plans.PlanCache',
+    aliases=['OrmPlanCache', 'orm_plans'],
+    singleton=True,
+)
+class PlanCache:
+    """ORM query plan cache
+
+    Stores the list of built SQLAlchemy queries (main + each *Many secondary)
+    for a given ORM query shape (entity, includes, where columns and operators,
+    sorts...).  Where values are SQLAlchemy bind parameters so a cached plan is
+    re-used by simply swapping the bound values.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __init__(self) -> None:
+        # ORM plan cache app config is optional
+        config = uvicore.config.app.orm.plans.defaults({
+            'enabled': True,
+            'size': 500,
+        })
+        self._enabled: bool = config.enabled
+        self._size: int = config.size
+        self._plans = ODict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Tuple) -> Optional[List]:
+        """Get a cached plan by query shape key, counting the hit or miss"""
+        plan = self._plans.get(key)
+        if plan is None:
+            self._misses += 1
+            return None
+
+        # Least recently used plans are evicted first
+        self._plans.move_to_end(key)
+        self._hits += 1
+        return plan
+
+    def put(self, key: Tuple, plan: List) -> None:
+        """Add a plan to the cache, evicting the least recently used if full"""
+        self._plans[key] = plan
+        self._plans.move_to_end(key)
+        while len(self._plans) > self.size:
+            self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached plans and reset counters"""
+        self._plans.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> Dict:
+        """Plan cache statistics"""
+        lookups = self.hits + self.misses
+        return Dict({
+            'enabled': self.enabled,
+            'size': self.size,
+            'plans': len(self._plans),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': (self.hits / lookups) if lookups else 0.0,
+        })
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import operator as operators
 import os
 
 from collections import OrderedDict as ODict
-from copy import deepcopy
-from typing import Any, Dict, Generic, List, OrderedDict, Tuple, TypeVar, Union, Callable
+from copy import copy
+from typing import Any, AsyncGenerator, Dict, Generic, List, Optional, OrderedDict, Tuple, TypeVar, Union, Callable
 from uvicore.support.hash import sha1
 
 import sqlalchemy as sa
 from sqlalchemy.sql import quoted_name
 from sqlalchemy.sql.expression import BinaryExpression
+from pydantic import BaseModel as PydanticBaseModel
 
 import uvicore
 from uvicore.contracts import OrmQueryBuilder as BuilderInterface
@@ -18,6 +21,7 @@ from uvicore.database.builder import QueryBuilder, Join, Query
 from uvicore.orm.fields import (BelongsTo, BelongsToMany, Field, HasMany,
                                 HasOne, MorphMany, MorphOne, MorphToMany)
 from uvicore.orm.fields import Relation
+from uvicore.orm.identity import current_session
 from uvicore.support.collection import getvalue
 from uvicore.support.dumper import dd, dump
 
@@ -186,6 +190,64 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
         self.query.keyed_by = field
         return self
 
+    def raw(self) -> B[B, E]:
+        """Return models constructed from trusted database rows without validation"""
+        self.query.result_format = 'raw'
+        return self
+
+    def as_dicts(self) -> B[B, E]:
+        """Return results as plain dictionaries instead of models"""
+        self.query.result_format = 'dicts'
+        return self
+
+    def as_tuples(self) -> B[B, E]:
+        """Return results as plain tuples of field values instead of models"""
+        self.query.result_format = 'tuples'
+        return self
+
+    def with_count(self, *args) -> B[B, E]:
+        """Count the records of these relations (without loading them) into each models get_count(relation)"""
+        if len(args) == 1 and type(args[0]) == list: args = args[0]
+        for relation in args:
+            if relation not in self.query.with_counts:
+                self.query.with_counts.append(relation)
+        return self
+
+    def strategy(self, strategy: str) -> B[B, E]:
+        """Eager load strategy of included *Many relations, 'query' (default) or 'json'
+
+        The json strategy aggregates the records of each included *Many relation
+        into a JSON array column of the main query (PostgreSQL json_agg, SQLite
+        json_group_array) instead of one more query per relation.  Relations
+        with nested includes, or used in wheres, filters or sorts, and other
+        databases still use the query strategy.
+        """
+        if strategy not in ['query', 'json']:
+            raise Exception('Unknown eager load strategy {}, use query or json'.format(strategy))
+        self.query.strategy = strategy
+        return self
+
+    def only(self, *args) -> B[B, E]:
+        """Select only these fields, with dot notation for relation fields like only('id', 'title', 'creator.email')
+
+        An entity (main model or included relation) without any fields listed
+        here still selects all of its fields.  Primary keys and the keys needed
+        to merge relations are always selected.
+        """
+        if len(args) == 1 and type(args[0]) == list: args = args[0]
+        for field in args:
+            if field not in self.query.only_fields:
+                self.query.only_fields.append(field)
+        return self
+
+    def defer(self, *args) -> B[B, E]:
+        """Do not select these fields, with dot notation for relation fields like defer('body', 'creator.password')"""
+        if len(args) == 1 and type(args[0]) == list: args = args[0]
+        for field in args:
+            if field not in self.query.defer_fields:
+                self.query.defer_fields.append(field)
+        return self
+
     def show_writeonly(self, fields: List = None):
         if fields is None:
             self.query.show_writeonly = True
@@ -211,6 +273,14 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
         if pk_value:
             column = self._pk()
             value = pk_value
+
+            # Entity already loaded in the active ORM session, no query needed.
+            # Only a plain find as includes or wheres may not match the loaded entity
+            session = current_session()
+            query = self.query
+            if session and not (query.includes or query.wheres or query.or_wheres or query.filters or query.or_filters or query.show_writeonly or query.result_format):
+                model = session.get(self.entity, pk_value)
+                if model is not None: return model
         elif kwargs:
             column = [x for x in kwargs.keys()][0]
             value = [x for x in kwargs.values()][0]
@@ -237,7 +307,7 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
             #dump('not sqlalchemy')
 
         # Build SQLAlchemy select queries
-        queries = self._build_orm_queries('select')
+        queries = self._build_orm_queries('select', execute=True)
         #dump(queries)
 
         self.log.nl().header('Queries')
@@ -256,16 +326,14 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
             prefix = 'uvicore.orm/'
             if cache.get('key') is None:
                 # No cache name specified, automatically build unique based on queries
-                query_hash = ''
-                for query in queries:
-                    if query['name'] == 'main':
-                        query_hash = query.get('query').hash(
-                            hash_type='sha1',
-                            package='uvicore.orm',
-                            entity=self.entity,
-                            connection=self._connection()
-                        )
-                        break
+                # Hash the original query, not the built queries as those may be cached plans
+                # holding bind parameters from a previous query
+                query_hash = self.query.hash(
+                    hash_type='sha1',
+                    package='uvicore.orm',
+                    entity=self.entity,
+                    connection=self._connection()
+                )
                 cache['key'] = prefix + query_hash
                 #dump(query_hash)
             else:
@@ -276,16 +344,15 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
             #dump('ORM FROM CACHE')
             entities = await uvicore.cache.get(cache.get('key'))
         else:
-            # Execute each query
-            results = None
-            main_query = None
-            has_many = {}
-            for query in queries:
-                if query.get('name') == 'main':
-                    main_query = query.get('query')
-                    results = await self.entity.fetchall(query.get('saquery'))
-                else:
-                    has_many[query.get('name')] = await self.entity.fetchall(query.get('saquery'))
+            # Execute main query first
+            main_query = queries[0].get('query')
+            primary = self._on_primary()
+            results = await self.entity.fetchall(queries[0].get('saquery'), primary=primary)
+
+            # Execute each *Many secondary query only for the primary keys the
+            # main query actually returned.  So a .limit() on the main query
+            # also limits the secondary queries to the children of that page
+            has_many = await self._fetch_many(queries[1:], results, primary)
 
             # Convert results to List of entities
             entities = self._build_orm_results(main_query, results, has_many)
@@ -296,40 +363,564 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
         # Return List of Entities
         return entities
 
+    async def stream(self, chunk_size: int = 1000) -> AsyncGenerator[E, None]:
+        """Execute a select query and yield each model as it is read from the database cursor
+
+        The main query is read from a database cursor and buffered in chunks of
+        chunk_size rows.  Each *Many secondary query is then executed once per
+        chunk, restricted to the primary keys of that chunk.  Results are never
+        cached or keyed, even if .cache() or .key_by() were used.
+        """
+
+        # Build SQLAlchemy select queries
+        queries = self._build_orm_queries('select', execute=True)
+
+        self.log.nl().header('Stream Queries')
+        self.log.dump(queries)
+
+        # Split main and *Many secondary queries
+        main_query = None
+        main_saquery = None
+        secondaries = []
+        for query in queries:
+            if query.get('name') == 'main':
+                main_query = query.get('query')
+                main_saquery = query.get('saquery')
+            else:
+                secondaries.append(query)
+
+        # Stitched results are never keyed when streaming.  Copy as the main
+        # query may be shared with a cached plan
+        main_query = main_query.copy()
+        main_query.keyed_by = None
+
+        primary = self._on_primary()
+
+        # Inside a transaction every query must run on this tasks connection
+        transaction = uvicore.db.in_transaction(self._connection())
+
+        async def build_chunk(rows: List) -> List[E]:
+            has_many = {}
+            if transaction:
+                has_many = await self._fetch_many(secondaries, rows, primary)
+            elif secondaries:
+                # The main query cursor holds this tasks database connection
+                # until fully read.  Run the secondary queries in a task with
+                # their own pool connection
+                has_many = await uvicore.db.task_context().run(asyncio.ensure_future, self._fetch_many(secondaries, rows, primary))
+
+            # Convert chunk results to List of entities
+            return self._build_orm_results(main_query, rows, has_many)
+
+        # The cursor would hold the transactions connection the secondary queries
+        # need until fully read, so inside a transaction the main query is read at once
+        if transaction and secondaries:
+            rows = await self.entity.fetchall(main_saquery, primary=primary)
+            for i in range(0, len(rows), chunk_size):
+                for entity in await build_chunk(rows[i:i + chunk_size]):
+                    yield entity
+            return
+
+        # Read the main query from the cursor, buffering chunk_size rows
+        rows = []
+        async for row in self.entity.iterate(main_saquery, primary=primary):
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                for entity in await build_chunk(rows):
+                    yield entity
+                rows = []
+
+        # Last partial chunk
+        if rows:
+            for entity in await build_chunk(rows):
+                yield entity
+
+    async def _keyset_page(self, size: int, after: Any = None, offset: int = None) -> Tuple:
+        # Fork this query by primary key and get one more than size to detect more pages
+        builder = self._keyset(size + 1, after, offset)
+        queries = builder._build_orm_queries('select', execute=True)
+        main_query = queries[0].get('query')
+        primary = self._on_primary()
+        rows = await self.entity.fetchall(queries[0].get('saquery'), primary=primary)
+
+        # No more rows
+        more = len(rows) > size
+        rows = rows[0:size]
+        if not rows: return ([], False, None)
+
+        # Execute each *Many secondary query only for this pages primary keys
+        has_many = await self._fetch_many(queries[1:], rows, primary)
+
+        # Convert page results to List (or Dict if keyed) of entities
+        pk = self.entity.mapper(self.entity.pk).column()
+        return (builder._build_orm_results(main_query, rows, has_many), more, rows[-1][pk])
+
+    async def _fetch_many(self, queries: List, rows: List, primary: bool = False) -> Dict:
+        """Execute *Many secondary queries restricted to the primary keys of these main query rows"""
+        # Secondary queries select from the main table so we can where on its primary key
+        pk = self.entity.mapper(self.entity.pk).column()
+        pks = [row[pk] for row in rows]
+
+        # Very large key lists are split into multiple WHERE IN queries as
+        # databases limit the number of bound parameters per statement
+        size = uvicore.db.in_chunk_size()
+
+        jobs = []
+        for query in queries:
+            table = query.get('query').table
+            for i in range(0, len(pks), size):
+                saquery = query.get('saquery').limit(None).offset(None).where(
+                    getattr(table.c, pk).in_(pks[i:i + size])
+                )
+                jobs.append((query.get('name'), saquery))
+
+        # Secondary queries do not depend on each other so run them concurrently,
+        # at most orm.concurrency at a time.  Each runs in a task with its own
+        # pool connection instead of serializing them all on this tasks connection.
+        # Except inside a transaction where every query must see its uncommitted writes
+        concurrency = uvicore.config.app.orm.get('concurrency')
+        if concurrency is None: concurrency = 4
+        if concurrency > 1 and len(jobs) > 1 and not uvicore.db.in_transaction(self._connection()):
+            semaphore = asyncio.Semaphore(concurrency)
+            async def fetch(saquery):
+                async with semaphore:
+                    return await self.entity.fetchall(saquery, primary=primary)
+            results = await asyncio.gather(*[
+                uvicore.db.task_context().run(asyncio.ensure_future, fetch(saquery)) for (name, saquery) in jobs
+            ])
+        else:
+            results = [await self.entity.fetchall(saquery, primary=primary) for (name, saquery) in jobs]
+
+        # Merge results of each chunk of keys by relation name
+        has_many = {query.get('name'): [] for query in queries}
+        for (name, saquery), rows in zip(jobs, results):
+            has_many[name].extend(rows)
+        return has_many
+
+    async def count(self) -> int:
+        """Count the records matching this query without selecting or hydrating them"""
+        return int(await self._aggregate(sa.func.count()))
+
+    async def exists(self) -> bool:
+        """Check if any record matches this query using an EXISTS subquery"""
+        saquery = self._build_aggregate_query([getattr(self.entity.table.c, self._pk())])
+        return bool(await self._scalar(sa.select([sa.exists(saquery)])))
+
+    async def sum(self, field: str) -> Any:
+        """Sum of this field of the records matching this query"""
+        return await self._aggregate(sa.func.sum(self._aggregate_column(field)))
+
+    async def min(self, field: str) -> Any:
+        """Minimum of this field of the records matching this query"""
+        return await self._aggregate(sa.func.min(self._aggregate_column(field)))
+
+    async def max(self, field: str) -> Any:
+        """Maximum of this field of the records matching this query"""
+        return await self._aggregate(sa.func.max(self._aggregate_column(field)))
+
+    async def avg(self, field: str) -> Any:
+        """Average of this field of the records matching this query"""
+        return await self._aggregate(sa.func.avg(self._aggregate_column(field)))
+
+    def _aggregate_column(self, field: str) -> sa.Column:
+        """Get the SQLAlchemy column of this main entity field"""
+        return getattr(self.entity.table.c, self.entity.mapper(field).column())
+
+    async def _aggregate(self, select: Any) -> Any:
+        """Execute a single aggregate select of the records matching this query"""
+        return await self._scalar(self._build_aggregate_query([select]))
+
+    async def _scalar(self, saquery: Any) -> Any:
+        """Execute a query and return the first column of its first row"""
+        row = await self.entity.fetchone(saquery, primary=self._on_primary())
+        return row[0] if row is not None else None
+
+    def _on_primary(self) -> bool:
+        """Whether reads of this query go to the primary database instead of a read replica"""
+        return self.query.on_primary or uvicore.db.sticky(self._connection())
+
+    def _build_aggregate_query(self, selects: List) -> Any:
+        """Build a select of these columns or aggregates over all records matching this queries wheres"""
+        query = self.query.copy()
+
+        # Sorts, limits and grouping do not apply to one aggregate of all matching records
+        query.order_by = []
+        query.sort = []
+        query.group_by = []
+        query.limit = None
+        query.offset = None
+
+        # Relation wheres filter by a primary key subselect so the joins of *Many
+        # relations can never count or sum the same record more than once
+        pks = self._build_pk_subquery(query)
+        if pks is None:
+            query.selects = selects
+            query, saquery = self._build_query('select', query)
+            return saquery
+        return sa.select(selects).where(getattr(self.entity.table.c, self._pk()).in_(pks))
+
+    def _json_relations(self, query: Query) -> OrderedDict[str, Relation]:
+        """The included *Many relations to eager load as JSON arrays with .strategy('json')"""
+        relations = ODict()
+        if query.strategy != 'json' or self.entity.table is None: return relations
+        dialect = uvicore.db.engine(self._connection()).dialect.name
+        if dialect not in ['postgresql', 'sqlite']: return relations
+
+        # Relations used in wheres, filters or sorts must still be joined or queried
+        used = []
+        for where in query.wheres + query.or_wheres + query.filters + query.or_filters + query.sort + query.order_by:
+            if type(where) == tuple and type(where[0]) == str and '.' in where[0]:
+                used.append(where[0].split('.')[0])
+
+        for include in query.includes:
+            # Only top level *Many relations without nested includes
+            if '.' in include or include in used: continue
+            if any(x.startswith(include + '.') for x in query.includes): continue
+            field: Field = self.entity.modelfields.get(include)
+            if not field or field.column or not field.relation: continue
+            relation = copy(field.relation.fill(field))
+            if not relation.is_many(): continue
+            relation.name = include
+            relations[include] = relation
+        return relations
+
+    def _build_json_subquery(self, query: Query, relation: Relation) -> Any:
+        """Build a correlated subquery aggregating this *Many relations records of each main record into a JSON array"""
+        dialect = uvicore.db.engine(self._connection()).dialect.name
+        main = self.entity.table
+        table = sa.alias(relation.entity.table, name=relation.name)
+
+        # JSON object of each records columns, keyed by column name
+        pairs = []
+        for column in self._selectable_columns(query, relation.entity, table, relation):
+            pairs.extend([sa.literal_column("'" + column.name + "'"), column])
+        if dialect == 'postgresql':
+            aggregate = sa.func.json_agg(sa.func.json_build_object(*pairs))
+        else:
+            aggregate = sa.func.json_group_array(sa.func.json_object(*pairs))
+
+        if type(relation) == BelongsToMany or type(relation) == MorphToMany:
+            # Join the pivot table to the related table
+            pivot = sa.alias(relation.join_table)
+            selectable = table.join(pivot, getattr(pivot.c, relation.right_key) == getattr(table.c, relation.entity.pk))
+            wheres = [getattr(pivot.c, relation.left_key) == getattr(main.c, self._pk())]
+            if type(relation) == MorphToMany:
+                wheres.append(getattr(pivot.c, relation.left_type) == self.entity.tablename)
+        else:
+            selectable = table
+            foreign_key = getattr(table.c, relation.entity.mapper(relation.foreign_key).column())
+            local_key = getattr(main.c, self.entity.mapper(relation.local_key).column())
+            wheres = [foreign_key == local_key]
+            if type(relation) == MorphOne or type(relation) == MorphMany:
+                wheres.append(getattr(table.c, relation.foreign_type) == self.entity.tablename)
+
+        return sa.select([aggregate]).select_from(selectable).where(sa.and_(*wheres)).as_scalar()
+
+    def _build_count_subquery(self, name: str) -> Any:
+        """Build a correlated COUNT(*) subquery of this relations records for each main record"""
+        field = self.entity.modelfield(name)
+        if not field.relation:
+            raise Exception('Field {} is not a relation of model {}'.format(name, self.entity.modelfqn))
+        relation = field.relation.fill(field)
+        table = self.entity.table
+
+        if type(relation) == BelongsToMany or type(relation) == MorphToMany:
+            # Count the pivot table records, no need to join the related table
+            counted = relation.join_table
+            wheres = [getattr(counted.c, relation.left_key) == getattr(table.c, self._pk())]
+            if type(relation) == MorphToMany:
+                wheres.append(getattr(counted.c, relation.left_type) == self.entity.tablename)
+        else:
+            counted = relation.entity.table
+            foreign_key = getattr(counted.c, relation.entity.mapper(relation.foreign_key).column())
+            local_key = getattr(table.c, self.entity.mapper(relation.local_key).column())
+            wheres = [foreign_key == local_key]
+            if type(relation) == MorphOne or type(relation) == MorphMany:
+                wheres.append(getattr(counted.c, relation.foreign_type) == self.entity.tablename)
+
+        return sa.select([sa.func.count()]).select_from(counted).where(sa.and_(*wheres)).as_scalar()
+
     async def delete(self) -> None:
-        """Execute delete query"""
+        """Execute delete query
+
+        Wheres on relations (.where('creator.email', ...)) are allowed and
+        still delete all matching records in a single statement.
+        """
 
         # Build SQLAlchemy delete query
-        query, saquery = self._build_query('delete', self.query.copy())
+        saquery = self._build_bulk_query('delete')
 
         # Execute query
         await self.entity.execute(saquery)
+        self._evict()
 
     async def update(self, **kwargs) -> None:
-        """Execute update query"""
+        """Execute update query
 
-        # Build SQLAlchemy delete query
-        query, saquery = self._build_query('update', self.query.copy())
+        Wheres on relations (.where('creator.email', ...)) are allowed and
+        still update all matching records in a single statement.
+        """
+
+        # Build SQLAlchemy update query
+        saquery = self._build_bulk_query('update')
 
         # Add in values
         saquery = saquery.values(**kwargs)
 
         # Execute query
         await self.entity.execute(saquery)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Forget this models instances loaded in the active ORM session, they may be stale after a bulk update or delete"""
+        session = current_session()
+        if session: session.evict(self.entity)
+
+    def _build_bulk_query(self, method: str):
+        """Build a set based UPDATE or DELETE query, joining any relations used in wheres"""
+        query = self.query.copy()
+
+        # No relation wheres, a simple single table UPDATE or DELETE
+        pks = self._build_pk_subquery(query)
+        if pks is None:
+            query, saquery = self._build_query(method, query)
+            return saquery
+
+        # A single table UPDATE or DELETE cannot join relations, and UPDATE ... FROM and
+        # DELETE ... USING are not portable.  So UPDATE or DELETE WHERE pk IN (subselect)
+        table = self.entity.table
+        pk = getattr(table.c, self._pk())
+        if method == 'delete':
+            return sa.delete(table).where(pk.in_(pks))
+        return sa.update(table).where(pk.in_(pks))
+
+    def _build_pk_subquery(self, query: Query) -> Optional[Any]:
+        """Build a select of the primary keys matching this queries relation wheres, None if no relation wheres"""
+
+        # Relations used in wheres (creator.email is the creator relation)
+        includes = []
+        for where in query.wheres + query.or_wheres:
+            if type(where) == tuple and type(where[0]) == str and '.' in where[0]:
+                include = '.'.join(where[0].split('.')[0:-1])
+                if include not in includes: includes.append(include)
+        if not includes: return None
+
+        # Select the matching primary keys with the relations joined just like a .get()
+        pk = getattr(self.entity.table.c, self._pk())
+        query = query.copy()
+        query.includes = includes
+        query.order_by = []
+        query.sort = []
+        query.limit = None
+        query.offset = None
+        self._build_orm_relations(query)
+        query.selects = [pk]
 
-    def _build_orm_queries(self, method: str) -> List:
+        # Duplicate primary keys do not matter inside an IN (subselect)
+        query.distinct = False
+        query, subquery = self._build_query('select', query)
+
+        # MySQL cannot select from the table being updated or deleted unless the
+        # subselect is wrapped in a derived table, which all other databases allow
+        return sa.select([subquery.alias('bulk').c[pk.name]])
+
+    def _build_orm_queries(self, method: str, execute: bool = False) -> List:
         # Different than the single _build_query in the DB Builder
         # This one is for ORM only and build multiple DB queries from one ORM query.
+        # Queries built to execute have their main query compiled through the statement
+        # cache, others (.queries(), .sql()) are plain SQLAlchemy queries.
+
+        # Query plans are cached by query shape (includes, where columns, sorts...)
+        # with all where values as bind parameters.  If this shape has been built
+        # before, skip the relation walking and SQL building and simply re-bind values.
+        plans = uvicore.ioc.make('uvicore.orm.plans.PlanCache')
+        params = self._plan_params(method) if plans.enabled else None
+        if params is None:
+            return self._build_orm_plan(method, self.query)
+        (key, values, base) = params
+
+        plan = plans.get(key)
+        if plan is None:
+            # Plan not found, build it with bind parameters and cache it
+            plan = self._build_orm_plan(method, base())
+            plans.put(key, plan)
+
+        # Bind this queries values into each cached SQLAlchemy query.  The executed main
+        # query is compiled once per plan and dialect (uvicore.db statement cache).
+        # Secondaries are cloned as they are further restricted to parent keys.
+        return [{
+            **query,
+            'saquery': (uvicore.db.statement(query['saquery'], values, key, self._connection())
+                if execute and query.get('name') == 'main' else query['saquery'].params(values)),
+        } for query in plan]
+
+    def _plan_params(self, method: str) -> Optional[Tuple]:
+        """Get the plan cache key, bind values and a parameterized query builder for this query
+
+        Returns None if this query cannot be cached (SQLAlchemy expressions instead of
+        string/column tuples, databaseless models, non select methods...)
+        """
+        query = self.query
+        if method != 'select' or self.entity.table is None: return None
+
+        values = {}
+        shapes = []
+        params = {}
+
+        # Wheres, or_wheres, filters and or_filters as (column, operator, bindparam) tuples
+        for name in ['wheres', 'or_wheres', 'filters', 'or_filters']:
+            shape = []
+            wheres = []
+            for (i, where) in enumerate(getattr(query, name)):
+                if type(where) != tuple: return None
+                (column, operator, value) = where
+                if type(column) != str and type(column) != sa.Column: return None
+                if isinstance(value, sa.sql.ClauseElement): return None
+
+                expanding = operator in ['in', '!in']
+                if value is None or (type(value) == str and value.lower() == 'null') or (expanding and not value):
+                    # NULL and empty IN values change the actual SQL, so they stay literal
+                    # and are part of the plan shape
+                    shape.append((str(column), operator, repr(value)))
+                    wheres.append(where)
+                elif expanding:
+                    # IN values are one bind parameter per item.  The encode/databases layer
+                    # does not support SQLAlchemy expanding bind parameters, so the number
+                    # of items is part of the plan shape
+                    binds = []
+                    for (j, item) in enumerate(value):
+                        bind_name = 'plan_' + name + '_' + str(i) + '_' + str(j)
+                        values[bind_name] = item
+                        binds.append(sa.bindparam(bind_name, item, type_=sa.types.NULLTYPE))
+                    shape.append((str(column), operator, len(binds)))
+                    wheres.append((column, operator, binds))
+                else:
+                    # All other values are bind parameters.  NULLTYPE so SQLAlchemy
+                    # uses the columns type when compared
+                    bind_name = 'plan_' + name + '_' + str(i)
+                    values[bind_name] = value
+                    shape.append((str(column), operator))
+                    wheres.append((column, operator, sa.bindparam(bind_name, value, type_=sa.types.NULLTYPE)))
+            shapes.append(tuple(shape))
+            params[name] = wheres
+
+        # Order by and sorts must be (column, order) tuples
+        for name in ['order_by', 'sort']:
+            shape = []
+            for order_by in getattr(query, name):
+                if type(order_by) != tuple: return None
+                shape.append(tuple(str(x) for x in order_by))
+            shapes.append(tuple(shape))
+
+        # Group by must be strings or columns
+        for group_by in query.group_by:
+            if type(group_by) != str and type(group_by) != sa.Column: return None
+        shapes.append(tuple(str(x) for x in query.group_by))
+
+        # Limit and offset are bind parameters as well, only their presence is part of the shape
+        for name in ['limit', 'offset']:
+            value = getattr(query, name)
+            if value:
+                values['plan_' + name] = value
+                params[name] = sa.bindparam('plan_' + name, value, type_=sa.Integer)
+            else:
+                params[name] = None
+            shapes.append(bool(value))
+
+        show_writeonly = query.show_writeonly
+        if type(show_writeonly) == list: show_writeonly = tuple(show_writeonly)
+
+        key = (
+            self.entity.modelfqn,
+            self._connection(),
+            method,
+            tuple(query.includes),
+            show_writeonly,
+            query.keyed_by,
+            query.result_format,
+            tuple(query.with_counts),
+            tuple(query.only_fields),
+            tuple(query.defer_fields),
+            query.distinct,
+            query.strategy,
+            tuple(shapes),
+        )
+
+        def base() -> Query:
+            # Only copy the query on a plan cache miss
+            newquery = query.copy()
+            for (name, value) in params.items():
+                setattr(newquery, name, value)
+            return newquery
+
+        return (key, values, base)
+
+    def _selectable_columns(self, query: Query, entity: E, table: sa.Table = None, relation: Relation = None, keep: List[str] = None) -> List[sa.Column]:
+        """Selectable columns of the main entity or this relation, pruned by .only() and .defer()"""
+        columns = entity.selectable_columns(table, show_writeonly=query.show_writeonly)
+        if not query.only_fields and not query.defer_fields: return columns
+
+        # Fields of this entity are those of the relations dot notation path with no further dots
+        prefix = relation.name.replace('__', '.') + '.' if relation else ''
+        def fields(names: List[str]) -> List[str]:
+            return [name[len(prefix):] for name in names if name.startswith(prefix) and '.' not in name[len(prefix):]]
+        only = fields(query.only_fields)
+        defer = fields(query.defer_fields)
+        if not only and not defer: return columns
+
+        # The primary key and all fields used to merge *Many children into their
+        # parents (or to key the results) are always selected
+        keep = [entity.pk] + (keep or [])
+        if relation:
+            if relation.is_many() and type(relation) != BelongsToMany and type(relation) != MorphToMany:
+                keep.append(relation.foreign_key)
+            for name in ['dict_key', 'dict_value', 'list_value']:
+                value = getvalue(relation, name)
+                if type(value) == list: keep.extend(value)
+                elif value: keep.append(value)
+
+        only = [entity.mapper(field).column() for field in only + keep] if only else None
+        defer = [entity.mapper(field).column() for field in defer if field not in keep]
+        return [column for column in columns if (only is None or column.name in only) and column.name not in defer]
+
+    def _needs_distinct(self, query: Query, relation: Relation = None) -> bool:
+        """Whether the main (or this *Many relations secondary) query may return duplicate rows and needs DISTINCT
+
+        Joins of *One relations never duplicate rows.  Every *Many relation join
+        does, except in its own secondary query where each related record is
+        one row (once per parent of a Many-To-Many, as the pivot key is selected).
+        """
+        if query.distinct is not None: return query.distinct
+        path = relation.name.split('__') if relation else []
+        for joined in query.relations.values():
+            if not joined.is_many(): continue
+            parts = joined.name.split('__')
+
+            # The secondary queries own relation, or a One-To-Many above it
+            if relation and parts == path[0:len(parts)]:
+                if len(parts) == len(path): continue
+                if type(joined) != BelongsToMany and type(joined) != MorphToMany: continue
+            return True
+        return False
+
+    def _build_orm_plan(self, method: str, base: Query) -> List:
+        """Build the main and all *Many secondary queries from this base query"""
         queries = []
 
         # First query
-        query = self.query.copy()
+        query = base.copy()
+
+        # *Many relations eager loaded as JSON arrays are not joined at all
+        query.json_relations = self._json_relations(base)
+        if query.json_relations:
+            query.includes = [include for include in query.includes if include not in query.json_relations]
 
         # Build relation (join) queries
         self._build_orm_relations(query)
 
         # Add all columns from main model
-        query.selects = self.entity.selectable_columns(show_writeonly=self.query.show_writeonly)
+        keep = [query.keyed_by] if query.keyed_by else []
+        query.selects = self._selectable_columns(base, self.entity, keep=keep)
 
         # Add all selects where any nested relation is NOT a *Many
         relation: Relation
@@ -337,12 +928,21 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
             if not relation.contains_many(query.relations):
                 # Don't use the relation.entity table to get columns, use the join aliased table
                 table = self._get_join_table(query, alias=relation.name)
-                columns = relation.entity.selectable_columns(table, show_writeonly=self.query.show_writeonly)
+                columns = self._selectable_columns(base, relation.entity, table, relation)
                 for column in columns:
                     query.selects.append(column.label(quoted_name(relation.name + '__' + column.name, True)))
 
+        # Add a correlated JSON array subquery for each .strategy('json') relation
+        for relation in query.json_relations.values():
+            query.selects.append(self._build_json_subquery(base, relation).label(quoted_name('json__' + relation.name, True)))
+
+        # Add a correlated COUNT(*) subquery for each .with_count() relation
+        for name in query.with_counts:
+            query.selects.append(self._build_count_subquery(name).label(quoted_name('count__' + name, True)))
+
         # Build first query
         saquery = None
+        query.distinct = self._needs_distinct(query)
         if query.table is not None:
             query, saquery = self._build_query(method, query)
         queries.append({
@@ -363,8 +963,9 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
             # Relation __ name converted to dot name
             rel_dot = relation.name.replace('__', '.')
 
-            # New secondary relation query
-            query2 = self.query.copy()
+            # New secondary relation query, also without the JSON array relations
+            query2 = base.copy()
+            query2.includes = list(query.includes)
 
             # Build ORM Relations but force HasMany joins to INNER JOIN
             self._build_orm_relations(query2)
@@ -384,7 +985,7 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
 
             # Set selects to only those in the related table
             table = self._get_join_table(query2, alias=relation.name)
-            columns = relation.entity.selectable_columns(table, show_writeonly=self.query.show_writeonly)
+            columns = self._selectable_columns(base, relation.entity, table, relation)
             for column in columns:
                 query2.selects.append(column.label(quoted_name(relation.name + '__' + column.name, True)))
 
@@ -393,7 +994,7 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
                 if relation.name + '__' not in sub_relation.name: continue
                 if sub_relation.contains_many(query2.relations, skip=relation.name.split('__')): continue
                 table = self._get_join_table(query2, alias=sub_relation.name)
-                columns = sub_relation.entity.selectable_columns(table, show_writeonly=self.query.show_writeonly)
+                columns = self._selectable_columns(base, sub_relation.entity, table, sub_relation)
                 for column in columns:
                     query2.selects.append(column.label(quoted_name(sub_relation.name + '__' + column.name, True)))
 
@@ -438,6 +1039,7 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
             query2.order_by = query2.sort
 
             # Build secondary relation query
+            query2.distinct = self._needs_distinct(query2, relation)
             query2, saquery2 = self._build_query(method, query2)
             queries.append({
                 'name': relation.name,
@@ -510,10 +1112,11 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
 
                 # Add relation to List only once
                 if relation_name not in relations:
-                    # We have to deepcopy a relationship becuase if we have owner and creator
+                    # We have to copy a relationship becuase if we have owner and creator
                     # and both of those user models have a "Contact" model, that contact model is a
-                    # single instance.  We want separate instances of each relationship
-                    relations[relation_name] = deepcopy(relation)
+                    # single instance.  We want separate instances of each relationship.
+                    # Only the name differs, so a shallow copy shares the entity and join_table byref
+                    relations[relation_name] = copy(relation)
 
                     # Alias the Joined Table (so we can join the same table multiple times if needed, like owner and creator)
                     # Alias is always the relation_name, we'll just make it doubly clear with its own variable
@@ -668,10 +1271,16 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
         self.log.nl().header('Has Many Data')
         self.log.dump(secondary)
 
-        # Deepcopy relations Dict so I can remove relations I have already processed.
+        # Copy relations Dict so I can remove relations I have already processed.
         # I process all secondary results first.  This means all left over relations are of
-        # the primary results
-        relations = deepcopy(query.relations)
+        # the primary results.  Only keys are removed so the Relations themselves are shared.
+        relations = ODict(query.relations)
+
+        # Raw, dict and tuple results skip pydantic validation
+        trusted = query.result_format is not None
+
+        # Models of an .only() or .defer() query are partially loaded
+        partial = bool(query.only_fields or query.defer_fields)
 
         # Dictionary of all secondary converted models
         models = {}
@@ -702,114 +1311,113 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
                     field: Field = entity.modelfield(rnpart)
                     entity = field.relation.fill(field).entity
 
+            # Every row of one result set has the same columns, so all column to field
+            # slot maps and relation walks are computed once here instead of per row
+            keys = set(data[0].keys())
+
             #self.log.item('Field: ' + str(field))
             self.log.item('Entity: ' + str(entity))
-            self.log.item('Data Keys: ' + str(data[0].keys()))
+            self.log.item('Data Keys: ' + str(keys))
 
             # Add a new List to our Dict of models
             models[rel_name] = {}
+            rel_models = models[rel_name]
 
             # Pk field and column
             pk = entity.pk
             pk_column = entity.mapper(pk).column()
             if not primary: pk_column = rel_name + '__' + pk_column
 
-            # Track completed relations so I can remove from our relations list later
-            completed_relations = {}
+            # Row to model converter for the main fields (not relations)
+            to_model = entity.row_mapper(keys, None if primary else rel_name, trusted, partial)
+
+            # Relation counts from .with_count() are only on the primary results
+            counts = [(name, 'count__' + name) for name in query.with_counts] if primary else []
+
+            # Build a slot for each *One relation that apply to this one "data" model
+            slots = []
+            relation: Relation
+            for relation in relations.values():
+
+                # Only look at relations that begin with this relation__ and are *One
+                if not primary and rel_name + '__' not in relation.name: continue
+
+                # Walk up relations and exclude if ANY relation is a *Many starting from rel_name and up
+                if relation.contains_many(query.relations, skip=rel_name_parts): continue
+
+                # Log output
+                self.log.item('Relation: ' + relation.name + ' - ' + str(relation))
+
+                # Get all relation fieldnames from relation.name split
+                fieldnames = relation.name.split('__')
+                if not primary:
+                    # Skip the first __ parts of rel_name
+                    fieldnames = fieldnames[len(rel_name_parts):]
+                self.log.item2('  Fieldnames: ' + ', '.join(fieldnames))
+
+                # Actual fieldname is always the LAST of the fieldnames.  All others are
+                # used to walk down the root model until you reach the nested model that
+                # has the right field to hold this converted sub model
+                fieldname = fieldnames[-1] if fieldnames else relation.name
+                self.log.item2('  Model Field: ' + fieldname)
+
+                # Convert each unique *One record just once, or else pull from singles cache
+                # The odd part about this cache is if you include many nested relations one one parent model
+                # And a child model also uses the same child, it too will include all nested relations
+                # Example if you do .include('creator.info', 'owner').  If owner is id=1 and id=1 was already
+                # a creator, that owner will also have the nested INFO filled out, because it pulls from the cache.
+                if relation.entity.tablename not in singles: singles[relation.entity.tablename] = {}
+                slots.append((
+                    relation.name,
+                    fieldnames[0:-1],
+                    fieldname,
+                    singles[relation.entity.tablename],
+                    relation.name + '__' + relation.entity.mapper(relation.entity.pk).column(),
+                    relation.entity.row_mapper(keys, relation.name, trusted, partial),
+                ))
 
             # Loop each row of raw data
-            i = 0
             for row in data:
 
                 # Because of Many-To-Many we could have the same model multiple times.  But we only want
                 # to convert and deal with it once based on unique PK
-                if getattr(row, pk_column) in models[rel_name]: continue
-                #if models[rel_name][getattr(row, pk_column)]: continue
+                pk_value = row[pk_column]
+                if pk_value in rel_models: continue
 
                 # Convert this one row to model (just the main fields, not relations)
-                if primary:
-                    root_model = entity.mapper(row).model()
-                    #root_model = entity.mapper(row).row_to_model()
-                else:
-                    root_model = entity.mapper(row, rel_name).model()
-                    #root_model = entity.mapper(row, rel_name).row_to_model()
-
-                # Get pk value
-                pk_value = getattr(root_model, pk)
-
-                # Loop only *One relations that apply to this one "data" model
-                relation: Relation
-                for relation in relations.values():
-
-                    # Only look at relations that begin with this relation__ and are *One
-                    if not primary and rel_name + '__' not in relation.name: continue
-
-                    # Walk up relations and exclude if ANY relation is a *Many starting from rel_name and up
-                    if relation.contains_many(query.relations, skip=rel_name_parts): continue
-
-                    # Log output
-                    if i == 0: self.log.item('Relation: ' + relation.name + ' - ' + str(relation))
+                root_model = to_model(row)
+                if counts: root_model._set_counts({name: row[label] for (name, label) in counts})
 
-                    # RowProxy results lookup prefix
-                    prefix = relation.name
-
-                    # Get all relation fieldnames from relation.name split
-                    fieldnames = relation.name.split('__')
-                    if not primary:
-                        # Skip the first __ parts of rel_name
-                        fieldnames = fieldnames[len(rel_name_parts):]
-                    if i == 0: self.log.item2('  Fieldnames: ' + ', '.join(fieldnames))
-
-                    # Walk down the root model by fieldnames until you reach the nested
-                    # model that has the right field to hold this converted sub model
-                    # Remember each relation has the full__nested__name so always start with the
-                    # root_model for each relation and work your way down.
-                    model = root_model
-                    for f in range(0, len(fieldnames) - 1):
-                        model = getattr(model, fieldnames[f])
-
-                    # Actual fieldname is always the LAST of the fieldnames, but our model was walked down.
-                    fieldname = fieldnames[-1] if fieldnames else relation.name
-
-                    # Walkdown Log
-                    if i == 0: self.log.item2('  Model Field: ' + fieldname)
-                    if i == 0: self.log.item2('  Field Model: ' + str(model.__class__))
-
-                    # Convert this one rows relation data into a sub_relation model
-                    # Only convert each unique *One record just once, or else pull from singles cache
-                    # The odd part about this cache is if you include many nested relations one one parent model
-                    # And a child model also uses the same child, it too will include all nested relations
-                    # Example if you do .include('creator.info', 'owner').  If owner is id=1 and id=1 was already
-                    # a creator, that owner will also have the nested INFO filled out, because it pulls from the cache.
-                    if relation.entity.tablename not in singles: singles[relation.entity.tablename] = {}
-                    sub_model_pk = relation.name + '__' + relation.entity.mapper(relation.entity.pk).column()
-                    sub_model_pk_value = getattr(row, sub_model_pk)
-                    if sub_model_pk_value is not None and sub_model_pk_value not in singles[relation.entity.tablename]:
-                        singles[relation.entity.tablename][sub_model_pk_value] = relation.entity.mapper(row, prefix).model()
-                        #singles[relation.entity.tablename][sub_model_pk_value] = relation.entity.mapper(row, prefix).row_to_model()
+                # Fill each *One relation of this row
+                for (name, walk, fieldname, cache, sub_model_pk, sub_model_to_model) in slots:
+                    sub_model_pk_value = row[sub_model_pk]
+                    if sub_model_pk_value is None: continue
 
                     # Get sub_model from singles cache
-                    if sub_model_pk_value is not None:
-                        sub_model = singles[relation.entity.tablename][sub_model_pk_value]
-                        #sub_model = relation.entity.mapper(row, prefix).model(False) # No cache version
+                    sub_model = cache.get(sub_model_pk_value)
+                    if sub_model is None:
+                        sub_model = cache[sub_model_pk_value] = sub_model_to_model(row)
 
-                        # Add this converted sub_model to the walked down parent model
-                        setattr(model, fieldname, sub_model)
+                    # Walk down the root model.  Remember each relation has the full__nested__name
+                    # so always start with the root_model for each relation and work your way down.
+                    model = root_model
+                    for f in walk:
+                        model = getattr(model, f)
+                        if model is None: break
 
-                    # Mark relation as complete so I can delete from relations Dict later
-                    completed_relations[relation.name] = 1
+                    # Add this converted sub_model to the walked down parent model
+                    if model is not None: setattr(model, fieldname, sub_model)
 
                 # All *One relations have been converted and merged
                 # Add this fully converted (including nested *One relations) model to List of models
-                models[rel_name][pk_value] = root_model
-                i += 1
+                rel_models[pk_value] = root_model
 
-            # Delete all completed relations from our relation deepcopy.  We will not need them again
-            for completed_relation in completed_relations.keys():
-                del relations[completed_relation]
+            # Delete all completed relations from our relation copy.  We will not need them again
+            for slot in slots:
+                del relations[slot[0]]
 
         # Fill in all *One relations for all secondary results first.
-        # as each relation is merged it will be removed from our local relations deepcopy.
+        # as each relation is merged it will be removed from our local relations copy.
         # All relations left will be those on the main results data.
         for rel_name, rel_data in secondary.items():
             fill_one_relations(rel_name, rel_data)
@@ -852,117 +1460,34 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
 
             self.log.item('Combining child: ' + children_name + ' into parent: ' + parents_name)
 
-            # Determine if child *Many results should be displayed as a Dict or List
-            dict_key = getvalue(relation, 'dict_key')
-            dict_value = getvalue(relation, 'dict_value')
-            list_value = getvalue(relation, 'list_value')
-
-            # Loop parents so we can at least set each child to empty [] instead of None.  We always want [] instead of None for empty children
-            for parent in parents.values():
-                # Set empty [] or {}
-                if dict_key:
-                    setattr(parent, field, {})
-                else:
-                    setattr(parent, field, [])
-
-            # Merge in Many-To-Many by using the original RowProxy result which contains
-            # The pivot tables joining column (left_key)
+            # Index all children into a List by their parents key in one pass
+            index = {}
             if type(relation) == BelongsToMany or type(relation) == MorphToMany:
+                # Many-To-Many children are deduplicated, so use the original RowProxy
+                # result which contains the pivot tables joining column (left_key)
                 left_key = relation.name + '__' + relation.left_key
                 right_key = relation.name + '__' + relation.entity.mapper(relation.entity.pk).column()
-
-                # QUESTION, what is the differente from children.values() vs
-                # secondary?  Look at the ELSE below that for child in children.values()
-                # but this many* uses secondary?
-                # Can I combine all relations into one large loop?
-                # Because I am doing identical work in the dict_key stuff
-
-                # ALSO all of this dict_key code may not work anyway
-                # I bet the API will not know how to handle input and complain?
-                # I may have to handle specially in the ModelRouter
-
-                # Loop raw RowProxy to find proper pivot keys
+                # Rows may repeat when other *Many joins are not DISTINCT, so each pair is merged once
+                pairs = set()
                 for row in secondary[relation.name]:
-                    left_id = getattr(row, left_key)
-                    right_id = getattr(row, right_key)
-
-                    # Get parent value, the value of the main table
-                    parent = parents[left_id]
-
-                    # Get child value. The value of the many record
-                    child = children[right_id]
-
-                    # Set None field to empty List
-                    if getattr(parent, field) is None:
-                        setattr(parent, field, [])
-
-                    # Add each *Many model as a Dict
-                    if dict_key:
-                        if dict_value:
-                            if type(dict_value) == list:
-                                value = {key:getattr(child, key) for key in dict_value}
-                            else:
-                                value = getattr(child, dict_value)
-                        else:
-                            value = child.dict()
-                        getattr(parent, field)[getattr(child, dict_key)] = value
-
-
-                    # Add each *Many model as a List of a single value
-                    elif list_value:
-                        getattr(parent, field).append(getattr(child, list_value))
-
-                    # Add each *Many as a List of the actual Models
-                    else:
-                        # Append to list using deepcopy
-                        getattr(parent, field).append(
-                            # We must deep copy the record becuase we dedup the *Many
-                            # but they could be used multiple times
-                            # ?? Hum maybe not, good if you change one it changes them all
-                            # But all the *One will NOT be like this I don't believe, have to test
-                            #deepcopy(child[right_id])
-                            child
-                        )
-
+                    pair = (row[left_key], row[right_key])
+                    if pair in pairs: continue
+                    pairs.add(pair)
+                    index.setdefault(pair[0], []).append(children[pair[1]])
             else:
-
+                foreign_key = relation.foreign_key
                 for child in children.values():
-                    parent_pk_value = getattr(child, relation.foreign_key)
-                    if parent_pk_value not in parents: continue;
-
-                    parent = parents[parent_pk_value]
-                    field = relation_parts[-1]
-
-                    # # Set None field to empty list
-                    # if getattr(parent, field) is None:
-                    #     setattr(parent, field, [])
-
-                    # DUPLCATING work here, see above for nearly exact same thing
-                    # need to optimize this code
-
-                    # Add each *Many model as a Dict
-                    if dict_key:
-                        if dict_value:
-                            if type(dict_value) == list:
-                                # Dict value is a list.  Create a dictionary from the lists keys
-                                value = {key:getattr(child, key) for key in dict_value}
-                            else:
-                                # Dict value is a string, use just that fields value
-                                value = getattr(child, dict_value)
-                        else:
-                            # No dict value set, but there is a dict_key, so we want a dict.  Use the entire record as a dict
-                            value = child.dict()
-                        getattr(parent, field)[getattr(child, dict_key)] = value
-                        #setattr(parent, field, 'x')
-
-                    # Add each *Many model as a List of a single value
-                    elif list_value:
-                        getattr(parent, field).append(getattr(child, list_value))
-
-                    # Add each *Many as a List of the actual Models
-                    else:
-                        getattr(parent, field).append(child)
+                    index.setdefault(getattr(child, foreign_key), []).append(child)
+
+            # Set each parents children.  Parents without children are set to an
+            # empty [] or {} instead of None.  We always want [] instead of None for empty children
+            for parent_pk_value, parent in parents.items():
+                value = self._relation_value(relation, index.get(parent_pk_value, []))
+                setattr(parent, field, value)
 
+        # Merge *Many relations eager loaded as JSON arrays into the primary models
+        if query.json_relations:
+            self._merge_json_relations(query, primary, models['primary'])
 
         self.log.nl().header('Singles Cache')
         self.log.dump(singles)
@@ -973,19 +1498,89 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
         # These models are already a Dict keyed by PK
         # Return existing primary model if user wanted keyby id
         if query.keyed_by == self.entity.pk:
-            return models['primary']
+            entities = models['primary']
 
         # Key results by another column
-        if query.keyed_by:
-            keyed_entities = {}
+        elif query.keyed_by:
+            entities = {}
             for entity in models['primary'].values():
-                keyed_entities[getattr(entity, self.query.keyed_by)] = entity
-
-            # Return Dictionary of Entities
-            return keyed_entities
+                entities[getattr(entity, query.keyed_by)] = entity
 
         # No keyby, convert primary models to a List
-        return [x for x in models['primary'].values()]
+        else:
+            entities = [x for x in models['primary'].values()]
+
+        # Convert to plain dictionaries or tuples if desired
+        if query.result_format in ['dicts', 'tuples']:
+            return self._format_results(entities, query.result_format)
+        return entities
+
+    def _relation_value(self, relation: Relation, items: List) -> Any:
+        """The value of a *Many relation field from its child models, as a List or Dict"""
+        # Determine if child *Many results should be displayed as a Dict or List
+        dict_key = getvalue(relation, 'dict_key')
+        dict_value = getvalue(relation, 'dict_value')
+        list_value = getvalue(relation, 'list_value')
+
+        # Add each *Many model as a Dict
+        if dict_key:
+            if dict_value:
+                if type(dict_value) == list:
+                    # Dict value is a list.  Create a dictionary from the lists keys
+                    return {getattr(child, dict_key): {key:getattr(child, key) for key in dict_value} for child in items}
+                else:
+                    # Dict value is a string, use just that fields value
+                    return {getattr(child, dict_key): getattr(child, dict_value) for child in items}
+            else:
+                # No dict value set, but there is a dict_key, so we want a dict.  Use the entire record as a dict
+                return {getattr(child, dict_key): child.dict() for child in items}
+
+        # Add each *Many model as a List of a single value
+        elif list_value:
+            return [getattr(child, list_value) for child in items]
+
+        # Add each *Many as a List of the actual Models
+        return items
+
+    def _merge_json_relations(self, query: Query, primary: List, parents: Dict) -> None:
+        """Convert the JSON arrays of .strategy('json') relations on each primary row into child models"""
+        pk_column = self.entity.mapper(self.entity.pk).column()
+        partial = bool(query.only_fields or query.defer_fields)
+
+        relation: Relation
+        for relation in query.json_relations.values():
+            # Each parent once, as rows may repeat when other *Many joins are not DISTINCT
+            label = 'json__' + relation.name
+            arrays = {}
+            for row in primary:
+                if row[pk_column] in arrays: continue
+                value = row[label]
+                if type(value) == str: value = json.loads(value)
+                arrays[row[pk_column]] = value or []
+
+            # Like secondary queries, a relation without any children at all stays None
+            if not any(arrays.values()): continue
+
+            # Every JSON object has the same keys (columns).  JSON has no date or
+            # decimal types so children are always validated to parse their values
+            keys = next(items for items in arrays.values() if items)[0].keys()
+            to_model = relation.entity.row_mapper(keys, None, False, partial)
+            for (pk_value, items) in arrays.items():
+                parent = parents.get(pk_value)
+                if parent is None: continue
+                setattr(parent, relation.name, self._relation_value(relation, [to_model(item) for item in items]))
+
+    def _format_results(self, value: Any, result_format: str) -> Any:
+        """Convert models (recursing into relations) into plain dictionaries or tuples"""
+        if isinstance(value, PydanticBaseModel):
+            if result_format == 'tuples':
+                return tuple([self._format_results(x, result_format) for x in value.__dict__.values()])
+            return {key: self._format_results(x, result_format) for (key, x) in value.__dict__.items()}
+        elif type(value) == list:
+            return [self._format_results(x, result_format) for x in value]
+        elif type(value) == dict:
+            return {key: self._format_results(x, result_format) for (key, x) in value.items()}
+        return value
 
     def _connection(self):
         return self.entity.connection
@@ -999,7 +1594,8 @@ class OrmQueryBuilder(Generic[B, E], QueryBuilder[B, E], BuilderInterface[B, E])
             relation = query.relations.get('__'.join(parts[:-1]))
             table = self._get_join_table(query, alias=relation.name)  # Get table from join alias since its a relation
             field = parts[-1]
-            name = self.entity.mapper(field).column()
+            # Field is on the relations entity, not this main entity
+            name = relation.entity.mapper(field).column()
         else:
             name = self.entity.mapper(dotname).column()
             table = query.table